@@ -211,14 +211,17 @@ async def similar_cases(
         client = get_qdrant_client()
         searcher = HybridSearcher(qdrant_client=client, embedder=embedder)
 
-        # Run hybrid search in thread pool (BGE-M3 + Qdrant are blocking)
-        raw_results = await asyncio.to_thread(
-            searcher.search,
-            query=request.query,
-            collection=COLLECTION_INDIAN_KANOON,
-            top_k=request.top_k,
-            query_type="civil_conceptual",  # balanced dense/sparse for case law
-        )
+        # Run hybrid search in thread pool (BGE-M3 + Qdrant are blocking).
+        # Filtered requests skip this and run their own filtered search below.
+        raw_results = []
+        if not must:
+            raw_results = await asyncio.to_thread(
+                searcher.search,
+                query=request.query,
+                collection=COLLECTION_INDIAN_KANOON,
+                top_k=request.top_k,
+                query_type="civil_conceptual",  # balanced dense/sparse for case law
+            )
 
         # If there's a filter, apply it post-search (client-side) since the
         # searcher's filter applies to act_filter/era_filter only.
@@ -231,8 +234,11 @@ async def similar_cases(
             from backend.rag.rrf import reciprocal_rank_fusion
 
             candidates = request.top_k * 5
-            dense_query = await asyncio.to_thread(embedder.encode_dense, [request.query])
-            dense_query = dense_query[0]
+            # One BGE-M3 forward pass yields both query vectors
+            dense_batch, sparse_batch = await asyncio.to_thread(
+                embedder.encode_dense_sparse, [request.query]
+            )
+            dense_query = dense_batch[0]
 
             dense_hits = await asyncio.to_thread(
                 client.search,
@@ -243,7 +249,6 @@ async def similar_cases(
                 with_payload=True,
             )
 
-            sparse_batch = await asyncio.to_thread(embedder.encode_sparse, [request.query])
             sv = sparse_dict_to_qdrant(sparse_batch[0])
             sparse_hits = await asyncio.to_thread(
                 client.search,
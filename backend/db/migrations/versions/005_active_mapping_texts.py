@@ -0,0 +1,62 @@
+"""Add the active_mapping_texts materialized view.
+
+Revision ID: 005
+Create Date: 2026-10-16
+
+Precomputes the double join of active law_transition_mappings to sections
+(old side and new side) that the activation similarity step otherwise redoes
+on every run. Refreshed by MappingActivator after each activation run;
+MappingActivator falls back to the join itself where this view is missing.
+
+- Unique index on id: required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+- (old_act, old_section) and (transition_type): the common lookups
+"""
+
+from alembic import op
+
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW active_mapping_texts AS
+        SELECT
+            m.id,
+            m.old_act,
+            m.old_section,
+            m.new_act,
+            m.new_section,
+            m.transition_type,
+            s_old.section_title AS old_title,
+            s_old.legal_text    AS old_text,
+            s_new.section_title AS new_title,
+            s_new.legal_text    AS new_text
+        FROM law_transition_mappings m
+        LEFT JOIN sections s_old
+          ON s_old.act_code = m.old_act
+         AND s_old.section_number = m.old_section
+        LEFT JOIN sections s_new
+          ON s_new.act_code = m.new_act
+         AND s_new.section_number = m.new_section
+        WHERE m.is_active = TRUE
+        """
+    )
+    op.create_index(
+        "idx_active_mapping_texts_id", "active_mapping_texts", ["id"], unique=True
+    )
+    op.create_index(
+        "idx_active_mapping_texts_old",
+        "active_mapping_texts",
+        ["old_act", "old_section"],
+    )
+    op.create_index(
+        "idx_active_mapping_texts_type", "active_mapping_texts", ["transition_type"]
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS active_mapping_texts")
@@ -0,0 +1,109 @@
+"""Covering and partial indexes for mapping assertions and activation.
+
+Revision ID: 006
+Create Date: 2026-10-16
+
+The adversarial assertions and tier activation filter on a handful of fixed
+predicates. These indexes let each of them run as an index(-only) scan:
+
+- idx_transition_old_covering: (old_act, old_section) INCLUDE (new_act,
+  new_section, transition_type) — IPC 302 / 124A / 376 lookups. Replaces
+  idx_transition_old, which it covers.
+- idx_transition_inactive_type: transition_type WHERE is_active = FALSE —
+  the activation tally and bulk UPDATE.
+- idx_transition_self_mapping: WHERE old_act = new_act — assertion 4.
+- idx_transition_equivalent_null: WHERE transition_type = 'equivalent' AND
+  new_section IS NULL — assertion 5.
+- idx_sections_act_num_title: (act_code, section_number) INCLUDE
+  (section_title) — BNS title checks. legal_text is deliberately not
+  included: long sections would exceed the btree row size limit.
+
+Indexes are built CONCURRENTLY (outside a transaction) so the tables stay
+writable, then the tables are re-analyzed.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_transition_old_covering",
+            "law_transition_mappings",
+            ["old_act", "old_section"],
+            postgresql_include=["new_act", "new_section", "transition_type"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_transition_old",
+            table_name="law_transition_mappings",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_transition_inactive_type",
+            "law_transition_mappings",
+            ["transition_type"],
+            postgresql_where=sa.text("is_active = FALSE"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_transition_self_mapping",
+            "law_transition_mappings",
+            ["id"],
+            postgresql_where=sa.text("old_act = new_act"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_transition_equivalent_null",
+            "law_transition_mappings",
+            ["id"],
+            postgresql_where=sa.text(
+                "transition_type = 'equivalent' AND new_section IS NULL"
+            ),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_sections_act_num_title",
+            "sections",
+            ["act_code", "section_number"],
+            postgresql_include=["section_title"],
+            postgresql_concurrently=True,
+        )
+        op.execute("ANALYZE law_transition_mappings")
+        op.execute("ANALYZE sections")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_sections_act_num_title", table_name="sections",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_transition_equivalent_null", table_name="law_transition_mappings",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_transition_self_mapping", table_name="law_transition_mappings",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_transition_inactive_type", table_name="law_transition_mappings",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_transition_old",
+            "law_transition_mappings",
+            ["old_act", "old_section"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_transition_old_covering", table_name="law_transition_mappings",
+            postgresql_concurrently=True,
+        )
@@ -227,6 +227,10 @@ class Section(Base):
             name="ck_sections_era",
         ),
         Index("idx_sections_act_code", "act_code"),
+        Index(
+            "idx_sections_act_num_title", "act_code", "section_number",
+            postgresql_include=["section_title"],
+        ),
         Index("idx_sections_status", "status"),
         Index("idx_sections_era", "era"),
         Index("idx_sections_is_offence", "is_offence"),
@@ -352,9 +356,24 @@ class LawTransitionMapping(Base):
             "scope_change IN ('none', 'narrowed', 'expanded', 'restructured', 'unknown') OR scope_change IS NULL",
             name="ck_scope_change",
         ),
-        Index("idx_transition_old", "old_act", "old_section"),
+        Index(
+            "idx_transition_old_covering", "old_act", "old_section",
+            postgresql_include=["new_act", "new_section", "transition_type"],
+        ),
         Index("idx_transition_new", "new_act", "new_section"),
         Index("idx_transition_active", "is_active"),
+        Index(
+            "idx_transition_inactive_type", "transition_type",
+            postgresql_where=sa_text("is_active = FALSE"),
+        ),
+        Index(
+            "idx_transition_self_mapping", "id",
+            postgresql_where=sa_text("old_act = new_act"),
+        ),
+        Index(
+            "idx_transition_equivalent_null", "id",
+            postgresql_where=sa_text("transition_type = 'equivalent' AND new_section IS NULL"),
+        ),
     )
 
 
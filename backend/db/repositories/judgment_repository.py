@@ -10,7 +10,7 @@ For async FastAPI endpoints (future), a separate async path can be added.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +84,41 @@ def is_already_ingested(diary_no: str, sync_session) -> bool:
     return result.scalar_one_or_none() is not None
 
 
+# Diary numbers per IN (...) query — well under Postgres' 65535 bind-parameter
+# limit, and small enough to keep each statement cheap to plan.
+_IN_QUERY_CHUNK = 10_000
+
+
+def get_ingested_diary_nos(diary_nos: Iterable[str], sync_session) -> set[str]:
+    """Return the subset of diary_nos already present in ingested_judgments.
+
+    Called once per year by sc_judgment_ingester.py so --resume dedup is a
+    local set lookup instead of one round-trip per judgment. Matches on the
+    diary_no UNIQUE key itself, so a judgment is found whichever year it was
+    recorded under. The IN list is sent in chunks of _IN_QUERY_CHUNK.
+
+    Args:
+        diary_nos:    Candidate diary_no strings (e.g. one year's metadata).
+        sync_session: Active SQLAlchemy sync Session.
+
+    Returns:
+        Set of the candidate diary_no strings that are already ingested.
+    """
+    from sqlalchemy import select
+    from backend.db.models.legal_foundation import IngestedJudgment
+
+    candidates = list(dict.fromkeys(diary_nos))
+    ingested: set[str] = set()
+    for start in range(0, len(candidates), _IN_QUERY_CHUNK):
+        result = sync_session.execute(
+            select(IngestedJudgment.diary_no).where(
+                IngestedJudgment.diary_no.in_(candidates[start:start + _IN_QUERY_CHUNK])
+            )
+        )
+        ingested.update(result.scalars())
+    return ingested
+
+
 def upsert_judgment_record(
     diary_no: str,
     case_no: Optional[str],
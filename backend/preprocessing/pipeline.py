@@ -52,6 +52,15 @@ from backend.preprocessing.enrichers.json_enricher import (
 from backend.preprocessing.extractors.pdf_extractor import extract_pdf
 from backend.preprocessing.parsers.act_parser import ParsedSection, parse_act
 from backend.preprocessing.validators.extraction_validator import (
+    BRACKET_ANNOTATION,
+    COMMENTARY_RESIDUE,
+    CROSS_SECTION_CONTAMINATION,
+    EMPTY_TEXT,
+    FOOTNOTE_RESIDUE,
+    MISSING_OFFENCE_FIELDS,
+    SHORT_TEXT,
+    SUBSECTION_COUNT_MISMATCH,
+    SUBSECTIONS_MISSING,
     ExtractionReport,
     validate_section,
 )
@@ -415,6 +424,7 @@ class LegalIngestionPipeline:
 
         section_num = sec.section_number
         confidence = validation_report.extraction_confidence
+        check_failures = validation_report.check_failures  # formatted once
 
         # ----------------------------------------------------------------
         # Step 6 — Merge extracted section with JSON enrichment
@@ -516,8 +526,8 @@ class LegalIngestionPipeline:
         # ----------------------------------------------------------------
         if validation_report.requires_human_review or confidence < 0.7:
             reason = (
-                "; ".join(validation_report.check_failures)
-                if validation_report.check_failures
+                "; ".join(check_failures)
+                if check_failures
                 else f"extraction_confidence={confidence:.2f} < 0.70"
             )
             await self._repo.add_to_review_queue(
@@ -557,7 +567,7 @@ class LegalIngestionPipeline:
             "pipeline_version": PIPELINE_VERSION,
             "checks_run": validation_report.checks_run,
             "checks_passed": validation_report.checks_passed,
-            "check_failures": validation_report.check_failures or [],
+            "check_failures": check_failures,
             "extraction_confidence": confidence,
             "noise_types_found": _detect_noise_types(validation_report),
             "raw_text_length": len(sec.raw_body_text) if sec.raw_body_text else 0,
@@ -659,25 +669,19 @@ class LegalIngestionPipeline:
 # Utility: detect which noise types fired in a validation report
 # ---------------------------------------------------------------------------
 
+_NOISE_TYPE_BY_CODE: Dict[int, str] = {
+    FOOTNOTE_RESIDUE: "footnote_residue",
+    COMMENTARY_RESIDUE: "commentary_residue",
+    CROSS_SECTION_CONTAMINATION: "cross_section_contamination",
+    BRACKET_ANNOTATION: "bracket_annotation",
+    EMPTY_TEXT: "empty_text",
+    SHORT_TEXT: "short_text",
+    SUBSECTIONS_MISSING: "subsection_count_mismatch",
+    SUBSECTION_COUNT_MISMATCH: "subsection_count_mismatch",
+    MISSING_OFFENCE_FIELDS: "missing_offence_fields",
+}
+
+
 def _detect_noise_types(report: ExtractionReport) -> List[str]:
-    """Convert check failure messages into a list of short noise type labels."""
-    types = []
-    for msg in report.check_failures:
-        if "Check 1" in msg:
-            types.append("footnote_residue")
-        elif "Check 2" in msg:
-            types.append("commentary_residue")
-        elif "Check 3" in msg:
-            types.append("cross_section_contamination")
-        elif "Check 4" in msg:
-            types.append("bracket_annotation")
-        elif "Check 5" in msg:
-            if "empty" in msg.lower():
-                types.append("empty_text")
-            else:
-                types.append("short_text")
-        elif "Check 6" in msg:
-            types.append("subsection_count_mismatch")
-        elif "Check 7" in msg:
-            types.append("missing_offence_fields")
-    return types
+    """Convert check failure codes into a list of short noise type labels."""
+    return [_NOISE_TYPE_BY_CODE[code] for code, _ in report.failure_codes]
@@ -8,8 +8,9 @@ Data source: s3://indian-supreme-court-judgments (CC BY 4.0, no AWS auth needed)
   Parquet: s3://indian-supreme-court-judgments/metadata/parquet/year=YYYY/metadata.parquet
   PDFs:    s3://indian-supreme-court-judgments/data/tar/year=YYYY/english/english.tar
 
-Run on Lightning AI GPU session for BGE-M3 embedding (batch processing).
-For incremental daily updates (5-20 judgments), CPU inference is acceptable.
+Run on Lightning AI GPU session for BGE-M3 embedding (batch processing, FP16).
+For incremental daily updates (5-20 judgments), CPU inference is acceptable;
+pass --cpu-int8 to run BGE-M3 with dynamic INT8 quantization on CPU.
 
 Usage:
     # Download and process 2024–2025 (most recent first)
@@ -24,12 +25,18 @@ Usage:
     # Resume interrupted run (skips already-ingested diary_nos)
     python -m backend.preprocessing.sc_judgment_ingester --years 2024 --resume
 
+    # Backfill with 4 worker processes (one embedder + Qdrant client each)
+    python -m backend.preprocessing.sc_judgment_ingester --year-range 2010 2025 --workers 4
+
 Architecture:
     Phase A: Download Parquet metadata + PDF tar from Vanga S3
     Phase B: Preprocess metadata (century-bug fix, domain inference, dedup check)
-    Phase C: PDF text extraction (PyMuPDF → Tesseract OCR fallback)
+    Phase C: PDF text extraction streamed from the tar (PyMuPDF → Tesseract OCR fallback)
     Phase D: Paragraph-aware chunking (400–500 tokens, 50-token overlap)
-    Phase E: BGE-M3 embedding + Qdrant upsert (batch_size=32)
+             (C + D run in a process pool, prefetched ahead of embedding)
+    Phase E: BGE-M3 embedding batched across judgments + Qdrant upsert
+             (batch_size=128 on GPU, 32 on CPU; uploads run concurrently on
+             an async client, overlapped with embedding of the next group)
     Phase F: Update ingested_judgments in Supabase
 
 Critical notes from architecture report (docs/neethi_architecture_report.md):
@@ -44,18 +51,27 @@ Critical notes from architecture report (docs/neethi_architecture_report.md):
 from __future__ import annotations
 
 import argparse
+import asyncio
 import hashlib
 import logging
+import multiprocessing
 import os
+import queue
 import re
 import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import uuid
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Container, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -75,13 +91,42 @@ CHUNK_MAX_TOKENS = 500       # hard max before forced split
 CHUNK_OVERLAP_TOKENS = 50    # tail overlap for context continuity
 MIN_PARA_TOKENS = 100        # merge short paragraphs with the next
 
-# BGE-M3 embedding batch size (Lightning AI GPU: 32; CPU incremental: 8)
-EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "32"))
+# BGE-M3 embedding batch size. 0 → auto: 128 when CUDA is available (a
+# 450-token forward pass only saturates an A100/L4 around 64–128), else 32.
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "0"))
+
+# Concurrent upsert requests in flight per judgment group on the async client,
+# and points per request — independent of the embedding batch size, since
+# larger requests amortise Qdrant's per-request overhead.
+QDRANT_UPSERT_CONCURRENCY = int(os.getenv("QDRANT_UPSERT_CONCURRENCY", "8"))
+QDRANT_UPLOAD_BATCH_SIZE = int(os.getenv("QDRANT_UPLOAD_BATCH_SIZE", "256"))
+
+# Below this many pending judgments (daily incremental runs) each judgment is
+# embedded on its own instead of waiting to fill a cross-judgment batch.
+INCREMENTAL_THRESHOLD = 16
+
+# Judgments embedded together per window on full runs. A wider window gives
+# the length sort more chunks to group, so batches carry less padding.
+EMBED_WINDOW_JUDGMENTS = int(os.getenv("EMBED_WINDOW_JUDGMENTS", "32"))
 
 # OCR: flag document as needing OCR if PyMuPDF extracts < 200 chars on > 2 pages
 OCR_CHAR_THRESHOLD = 200
 OCR_PAGE_THRESHOLD = 2
 
+# Empty MuPDF's object store (glyph/font caches) every N pages during native
+# extraction so long judgments do not hold every page's resources at once.
+PDF_STORE_SHRINK_PAGES = 20
+
+# OCR rendering: 150 DPI is ample for printed SC judgments (~1.8× fewer pixels
+# than 200 DPI). Pages are split into this many shards, one tesseract each.
+OCR_DPI = 150
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(os.cpu_count() or 1)))
+
+# Phase C + D (extract/clean/chunk) runs in this many worker processes, up to
+# PREPARE_PREFETCH judgments ahead of the embedding loop.
+PREPARE_WORKERS = int(os.getenv("PREPARE_WORKERS", str(os.cpu_count() or 1)))
+PREPARE_PREFETCH = 16
+
 # Case-no prefix → legal domain mapping
 _DOMAIN_MAP = {
     "C.A.": "civil",        # Civil Appeal
@@ -145,7 +190,19 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--keep-pdfs",
         action="store_true",
-        help="Keep extracted PDFs after processing (default: delete to save disk).",
+        help="Also write each PDF to disk while streaming the tar (default: in-memory only).",
+    )
+    parser.add_argument(
+        "--cpu-int8",
+        action="store_true",
+        help="On CPU-only machines, run BGE-M3 with dynamic INT8 quantization.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes per year, each with its own embedder and Qdrant "
+             "client over a diary_no partition; round-robined across GPUs (default: 1).",
     )
     return parser.parse_args()
 
@@ -329,6 +386,15 @@ def load_parquet_metadata(parquet_path: Path) -> list[dict]:
     return records
 
 
+# Date formats seen in Vanga / eCourts data. Reordered at runtime: the format
+# that last succeeded moves to the front, so within one Parquet file (which
+# uses a single format) nearly every row parses on the first strptime call
+# instead of raising ValueError for the formats ahead of it. The formats are
+# mutually exclusive (%Y needs four digits), so order never changes a result.
+_DATE_FORMATS = ["%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y/%m/%d"]
+
+
+@lru_cache(maxsize=8192)
 def _parse_decision_date(raw_date: str, partition_year: int) -> Optional[date]:
     """Parse and correct judgment date with century-bug fix.
 
@@ -336,6 +402,8 @@ def _parse_decision_date(raw_date: str, partition_year: int) -> Optional[date]:
     ~1994–2003 window to appear as 1894–1903. Correction: if the parsed year
     is < 1950 but the partition_year (from S3 tarball) is > 1993, add 100 years.
 
+    Memoized: many judgments in a year share a decision date.
+
     Args:
         raw_date:       Raw date string from Vanga data (e.g. "17-02-1902").
         partition_year: The year of the S3 tarball partition (always correct).
@@ -346,16 +414,18 @@ def _parse_decision_date(raw_date: str, partition_year: int) -> Optional[date]:
     if not raw_date:
         return None
 
-    # Try multiple date formats used in Vanga data
-    for fmt in ("%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y/%m/%d"):
+    # Try multiple date formats used in Vanga data, most recent winner first
+    for i, fmt in enumerate(_DATE_FORMATS):
         try:
             d = datetime.strptime(raw_date, fmt).date()
-            # Century-bug correction
-            if d.year < 1950 and partition_year > 1993:
-                d = d.replace(year=d.year + 100)
-            return d
         except ValueError:
             continue
+        if i:
+            _DATE_FORMATS.insert(0, _DATE_FORMATS.pop(i))
+        # Century-bug correction
+        if d.year < 1950 and partition_year > 1993:
+            d = d.replace(year=d.year + 100)
+        return d
 
     logger.debug("decision_date_parse_failed: %r (partition_year=%d)", raw_date, partition_year)
     return None
@@ -473,6 +543,19 @@ _CONSTITUTIONAL_TEXT_SIGNALS = [
 ]
 
 
+# Each signal list folded into one case-insensitive alternation so the opening
+# text is scanned once per domain, in C, without an uppercased copy.
+_CRIMINAL_TEXT_RE = re.compile(
+    "|".join(re.escape(s) for s in _CRIMINAL_TEXT_SIGNALS), re.IGNORECASE
+)
+_CONSTITUTIONAL_TEXT_RE = re.compile(
+    "|".join(re.escape(s) for s in _CONSTITUTIONAL_TEXT_SIGNALS), re.IGNORECASE
+)
+
+# Only the opening of a judgment carries the jurisdictional headers
+DOMAIN_SIGNAL_CHARS = 3000
+
+
 def _infer_domain_from_text(opening_text: str) -> str:
     """Infer legal domain from the opening section of a judgment PDF.
 
@@ -491,105 +574,260 @@ def _infer_domain_from_text(opening_text: str) -> str:
       4. Default → "civil"  (civil appeals, SLPs, service matters, property)
 
     Args:
-        opening_text: First ~3 000 characters of the raw extracted PDF text
-                      (i.e. *before* ``clean_judgment_text`` is applied).
+        opening_text: Raw extracted PDF text (i.e. *before*
+                      ``clean_judgment_text`` is applied). Only the first
+                      DOMAIN_SIGNAL_CHARS characters are scanned, so the full
+                      text can be passed without slicing.
 
     Returns:
         'criminal', 'constitutional', or 'civil' (never None).
     """
-    text = opening_text.upper()
+    automaton = _domain_signal_automaton()
+    if automaton is not None:
+        return _infer_domain_aho_corasick(automaton, opening_text)
 
     # Check criminal signals first — they are unambiguous in SC proceedings
-    for signal in _CRIMINAL_TEXT_SIGNALS:
-        if signal in text:
-            return "criminal"
+    if _CRIMINAL_TEXT_RE.search(opening_text, 0, DOMAIN_SIGNAL_CHARS):
+        return "criminal"
 
     # Check constitutional signals
-    for signal in _CONSTITUTIONAL_TEXT_SIGNALS:
-        if signal in text:
-            return "constitutional"
+    if _CONSTITUTIONAL_TEXT_RE.search(opening_text, 0, DOMAIN_SIGNAL_CHARS):
+        return "constitutional"
 
     # Default: civil (civil appeals, SLPs, service, property, family, commercial)
     return "civil"
 
 
+@lru_cache(maxsize=1)
+def _domain_signal_automaton():
+    """Build the Aho–Corasick automaton over both signal lists, or None.
+
+    pyahocorasick is optional: with it, every signal is found in a single
+    O(n) pass over the opening text regardless of how many signals there
+    are; without it, _infer_domain_from_text uses the regex alternations.
+    """
+    try:
+        import ahocorasick  # type: ignore
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for signal in _CONSTITUTIONAL_TEXT_SIGNALS:
+        automaton.add_word(signal, "constitutional")
+    # Criminal added last so it wins for any signal present in both lists
+    for signal in _CRIMINAL_TEXT_SIGNALS:
+        automaton.add_word(signal, "criminal")
+    automaton.make_automaton()
+    return automaton
+
+
+def _infer_domain_aho_corasick(automaton, opening_text: str) -> str:
+    """Aho–Corasick path of _infer_domain_from_text with identical priority."""
+    found_constitutional = False
+    for _end, label in automaton.iter(opening_text[:DOMAIN_SIGNAL_CHARS].upper()):
+        if label == "criminal":
+            return "criminal"
+        found_constitutional = True
+    return "constitutional" if found_constitutional else "civil"
+
+
 # ---------------------------------------------------------------------------
 # Phase C: PDF text extraction
 # ---------------------------------------------------------------------------
 
-def extract_pdf_text(pdf_path: Path) -> tuple[str, bool]:
+def iter_tar_pdfs(
+    tar_path: Path,
+    wanted: Optional[Container[str]] = None,
+) -> Iterator[tuple[str, bytes]]:
+    """Yield (pdf_basename, pdf_bytes) for every PDF member of a judgment tar.
+
+    The tar is opened in streaming mode ("r|"): members are consumed strictly
+    forward with no seeks or member index, so nothing is untarred to disk and
+    the archive can equally be a pipe. Each member's bytes must be consumed
+    before the next one is read — the caller gets a fully materialised
+    ``bytes`` object for that reason.
+
+    Basenames are yielded (not archive paths) because PDFs may be nested in
+    subdirectories within the tar while Parquet metadata records only the
+    filename.
+
+    Args:
+        tar_path: Path to the downloaded english.tar archive.
+        wanted:   If given, only members whose basename is in it are read;
+                  the rest are skipped without copying their bytes (on
+                  --resume most of a year's members are already ingested).
+                  Checked as each member is reached, so it may shrink while
+                  iterating.
+
+    Yields:
+        (basename, bytes) tuples in archive order.
+    """
+    with tarfile.open(tar_path, "r|") as tf:
+        for member in tf:
+            if not member.isfile() or not member.name.lower().endswith(".pdf"):
+                continue
+            name = Path(member.name).name
+            if wanted is not None and name not in wanted:
+                continue
+            f = tf.extractfile(member)
+            if f is None:
+                continue
+            yield name, f.read()
+
+
+def _open_pdf(pdf_source: bytes | Path):
+    """Open a PDF with PyMuPDF from in-memory bytes or a file path."""
+    import fitz  # PyMuPDF
+
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return fitz.open(stream=pdf_source, filetype="pdf")
+    return fitz.open(str(pdf_source))
+
+
+def extract_pdf_text(pdf_source: bytes | Path, name: str = "") -> tuple[str, bool]:
     """Extract text from a PDF using PyMuPDF with Tesseract OCR fallback.
 
     Extraction strategy:
     1. Try PyMuPDF (fitz) text extraction
     2. If extracted text < OCR_CHAR_THRESHOLD for a multi-page document,
-       flag ocr_required=True and use Tesseract OCR via pytesseract
+       flag ocr_required=True and use Tesseract OCR (batched per shard)
 
     Args:
-        pdf_path: Path to the PDF file.
+        pdf_source: PDF bytes (streamed from the tar) or path to a PDF file.
+        name:       Label for log messages. Defaults to the file name when
+                    pdf_source is a path.
 
     Returns:
         (extracted_text, ocr_required) tuple.
     """
     import fitz  # PyMuPDF
 
-    try:
-        doc = fitz.open(str(pdf_path))
-        page_count = len(doc)
+    name = name or (pdf_source.name if isinstance(pdf_source, Path) else "<stream>")
 
-        # Attempt native text extraction
-        text_parts = []
-        for page in doc:
-            text_parts.append(page.get_text())
+    try:
+        with _open_pdf(pdf_source) as doc:
+            page_count = doc.page_count
+
+            # Attempt native text extraction one page at a time, dropping each
+            # page before loading the next and periodically emptying MuPDF's
+            # object store so peak RSS does not grow with page count.
+            text_parts = []
+            for i in range(page_count):
+                page = doc.load_page(i)
+                text_parts.append(page.get_text())
+                del page
+                if (i + 1) % PDF_STORE_SHRINK_PAGES == 0:
+                    fitz.TOOLS.store_shrink(100)
         raw_text = "\n".join(text_parts)
-        doc.close()
+        del text_parts  # don't hold the per-page strings alongside the joined copy
 
         # Check if extraction quality is sufficient
-        if (
-            len(raw_text.strip()) < OCR_CHAR_THRESHOLD
-            and page_count > OCR_PAGE_THRESHOLD
-        ):
-            logger.info(
-                "pdf_ocr_fallback: %s (chars=%d, pages=%d)",
-                pdf_path.name, len(raw_text.strip()), page_count,
-            )
-            ocr_text = _ocr_pdf(pdf_path)
-            return ocr_text, True
+        if page_count > OCR_PAGE_THRESHOLD:
+            chars = len(raw_text.strip())
+            if chars < OCR_CHAR_THRESHOLD:
+                logger.info(
+                    "pdf_ocr_fallback: %s (chars=%d, pages=%d)",
+                    name, chars, page_count,
+                )
+                del raw_text  # release before rendering page images for OCR
+                ocr_text = _ocr_pdf(pdf_source, name)
+                return ocr_text, True
 
         return raw_text, False
 
     except Exception as exc:
-        logger.warning("pdf_extract_failed: %s — %s", pdf_path.name, exc)
+        logger.warning("pdf_extract_failed: %s — %s", name, exc)
         return "", False
 
 
-def _ocr_pdf(pdf_path: Path) -> str:
+def _ocr_pdf(pdf_source: bytes | Path, name: str = "") -> str:
     """Tesseract OCR fallback for scanned PDFs.
 
-    Converts each page to an image and runs pytesseract on it.
+    All pages are rendered to greyscale images and written as multi-page
+    TIFFs, one per shard, so each shard costs a single ``tesseract``
+    process (model + language data load) instead of one per page. Shards
+    run in parallel across OCR_WORKERS threads; page order is preserved.
     Much slower than native extraction — used only when necessary.
     """
     try:
         import fitz
-        import pytesseract
         from PIL import Image
-        import io
-
-        doc = fitz.open(str(pdf_path))
-        text_parts = []
-        for page in doc:
-            # Render page at 200 DPI for good OCR quality
-            pix = page.get_pixmap(dpi=200)
-            img_bytes = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_bytes))
-            text_parts.append(pytesseract.image_to_string(img, lang="eng"))
-        doc.close()
-        return "\n".join(text_parts)
+
+        images = []
+        with _open_pdf(pdf_source) as doc:
+            for i in range(doc.page_count):
+                pix = doc.load_page(i).get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY)
+                images.append(Image.frombytes("L", (pix.width, pix.height), pix.samples))
+                del pix
+        if not images:
+            return ""
+
+        shard_count = max(1, min(OCR_WORKERS, len(images)))
+        shard_size = -(-len(images) // shard_count)  # ceil division
+        shards = [images[i: i + shard_size] for i in range(0, len(images), shard_size)]
+
+        if len(shards) == 1:
+            return _tesseract_pages(shards[0])
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            return "\n".join(pool.map(_tesseract_pages, shards))
     except Exception as exc:
-        logger.warning("ocr_failed: %s — %s", pdf_path.name, exc)
+        logger.warning("ocr_failed: %s — %s", name, exc)
         return ""
 
 
+def _tesseract_pages(images: list) -> str:
+    """OCR a list of page images with one ``tesseract`` invocation.
+
+    Tesseract separates pages with a form feed on stdout; these are turned
+    back into newlines to match the per-page join used by native extraction.
+    OMP_THREAD_LIMIT=1 keeps parallel shards from oversubscribing the CPU.
+
+    Raises:
+        RuntimeError: If tesseract exits non-zero.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        tif_path = Path(tmp) / "batch.tif"
+        images[0].save(
+            tif_path,
+            save_all=True,
+            append_images=images[1:],
+            compression="tiff_deflate",
+        )
+        result = subprocess.run(
+            ["tesseract", str(tif_path), "-", "-l", "eng", "--oem", "1"],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "OMP_THREAD_LIMIT": "1"},
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"tesseract failed:\n{result.stderr}")
+    return "\n".join(result.stdout.split("\f"))
+
+
+# One "noise line" per match: standalone page numbers, page dividers and the
+# repetitive SC header stamps. The trailing newline is consumed with the line
+# so dropping it never introduces a spurious paragraph break.
+_NOISE_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"\d{1,4}"
+    r"|[-_]{3,}"
+    r"|IN THE SUPREME COURT OF INDIA"
+    r"|SUPREME COURT OF INDIA"
+    r"|REPORTABLE"
+    r"|NOT REPORTABLE"
+    r"|NON-REPORTABLE"
+    r"|(?:CIVIL|CRIMINAL) APPELLATE JURISDICTION"
+    r"|ORIGINAL JURISDICTION"
+    r"|WRIT JURISDICTION"
+    r")[^\S\n]*(?:\n|\Z)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_MULTIBLANK_RE = re.compile(r"\n{3,}")
+
+
 def clean_judgment_text(raw_text: str) -> str:
     """Clean extracted text: remove headers, footers, boilerplate.
 
@@ -600,6 +838,9 @@ def clean_judgment_text(raw_text: str) -> str:
     - "REPORTABLE" / "NOT REPORTABLE" stamps
     - Case number headers that repeat on each page
 
+    Noise lines are dropped in a single pass of _NOISE_LINE_RE, then runs of
+    blank lines are collapsed.
+
     Args:
         raw_text: Raw extracted text from PyMuPDF or Tesseract.
 
@@ -609,34 +850,9 @@ def clean_judgment_text(raw_text: str) -> str:
     if not raw_text:
         return ""
 
-    lines = raw_text.split("\n")
-    cleaned = []
-    for line in lines:
-        stripped = line.strip()
-        # Skip standalone page numbers
-        if re.fullmatch(r"\d{1,4}", stripped):
-            continue
-        # Skip repetitive SC header lines
-        if stripped.upper() in (
-            "IN THE SUPREME COURT OF INDIA",
-            "SUPREME COURT OF INDIA",
-            "REPORTABLE",
-            "NOT REPORTABLE",
-            "NON-REPORTABLE",
-            "CIVIL APPELLATE JURISDICTION",
-            "CRIMINAL APPELLATE JURISDICTION",
-            "ORIGINAL JURISDICTION",
-            "WRIT JURISDICTION",
-        ):
-            continue
-        # Skip lines that are just underscores or dashes (page dividers)
-        if re.fullmatch(r"[-_]{3,}", stripped):
-            continue
-        cleaned.append(line)
-
-    text = "\n".join(cleaned)
+    text = _NOISE_LINE_RE.sub("", raw_text)
     # Collapse runs of 3+ blank lines to at most 2
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _MULTIBLANK_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -776,14 +992,30 @@ def _split_at_sentences(text: str, max_tokens: int, overlap_tokens: int) -> list
     return sub_chunks
 
 
-def assign_section_types(chunks: list[str]) -> list[str]:
-    """Assign section_type label to each chunk based on its position.
+def section_type_at(chunk_idx: int, total_chunks: int) -> str:
+    """Return the section_type label for one chunk position.
 
     Heuristic from architecture report §7.3:
       - "background":  first 2 chunks (procedural facts, case summary)
       - "analysis":    middle chunks (ratio decidendi, legal reasoning)
       - "conclusion":  last 2 chunks (final order, outcome)
 
+    Judgments of 3 chunks or fewer get one background and one conclusion
+    chunk at most, with "conclusion" winning for a single chunk.
+    """
+    edge = 2 if total_chunks >= 4 else 1
+    if chunk_idx >= total_chunks - edge:
+        return "conclusion"
+    if chunk_idx < edge:
+        return "background"
+    return "analysis"
+
+
+def assign_section_types(chunks: list[str]) -> list[str]:
+    """Assign section_type label to each chunk based on its position.
+
+    See section_type_at() for the heuristic.
+
     Args:
         chunks: List of text chunks for one judgment.
 
@@ -791,30 +1023,248 @@ def assign_section_types(chunks: list[str]) -> list[str]:
         List of section_type strings, same length as chunks.
     """
     total = len(chunks)
-    if total == 0:
-        return []
-    if total == 1:
-        return ["conclusion"]
-    if total == 2:
-        return ["background", "conclusion"]
-    if total == 3:
-        return ["background", "analysis", "conclusion"]
-
-    types = []
-    for i in range(total):
-        if i < 2:
-            types.append("background")
-        elif i >= total - 2:
-            types.append("conclusion")
-        else:
-            types.append("analysis")
-    return types
+    return [section_type_at(i, total) for i in range(total)]
 
 
 # ---------------------------------------------------------------------------
 # Phase E: Embedding + Qdrant upsert
 # ---------------------------------------------------------------------------
 
+def _embed_batch_size() -> int:
+    """Resolve EMBED_BATCH_SIZE, auto-sizing for GPU when it is unset (0)."""
+    if EMBED_BATCH_SIZE > 0:
+        return EMBED_BATCH_SIZE
+    try:
+        import torch
+        return 128 if torch.cuda.is_available() else 32
+    except ImportError:
+        return 32
+
+
+def _chunk_point_ids(diary_no: str, count: int) -> list[str]:
+    """Return the deterministic point UUIDs for a judgment's chunks.
+
+    Byte-for-byte identical to ``uuid5(UUID_NAMESPACE, f"{diary_no}__chunk{idx}")``
+    but the namespace + "{diary_no}__chunk" prefix is hashed once per
+    judgment; each chunk only copies that SHA-1 state and feeds its index.
+    """
+    base = hashlib.sha1(UUID_NAMESPACE.bytes + f"{diary_no}__chunk".encode("utf-8"))
+    point_ids = []
+    for idx in range(count):
+        h = base.copy()
+        h.update(str(idx).encode("ascii"))
+        point_ids.append(str(uuid.UUID(bytes=h.digest()[:16], version=5)))
+    return point_ids
+
+
+def build_judgment_points(
+    judgments: list[dict],
+    embedder,
+    batch_size: Optional[int] = None,
+) -> tuple[Optional["Batch"], list[list[str]]]:
+    """Embed the chunks of several judgments together into a Qdrant Batch.
+
+    Chunks from all judgments are concatenated into one encode_batch() call
+    so every BGE-M3 forward pass runs at a full batch_size, instead of
+    under-filling the GPU with the tail of each short judgment (which also
+    encodes them in length order to minimise padding). Vectors come back
+    in input order and are demultiplexed to their judgments by offset.
+
+    Points are returned in Qdrant's columnar Batch form (parallel ids /
+    vectors / payloads lists) rather than one PointStruct per chunk, so no
+    per-point model object is built or validated.
+
+    Each chunk becomes one Qdrant point. Point UUID is deterministic:
+        uuid5(NAMESPACE_URL, f"{diary_no}__chunk{idx}")
+    This makes the pipeline fully idempotent — re-running overwrites
+    existing points with identical data, no duplicates accumulate.
+
+    Args:
+        judgments:  Record dicts from load_parquet_metadata(), each with an
+                    added "chunks" list of text chunks to embed.
+        embedder:   Loaded BGEM3Embedder instance.
+        batch_size: Texts per forward pass. Defaults to the resolved
+                    EMBED_BATCH_SIZE.
+
+    Returns:
+        (batch, point_ids): a Batch holding every chunk (None if there are
+        no chunks), and one list of point UUID strings per judgment, in
+        input order.
+    """
+    from qdrant_client.models import Batch, SparseVector
+
+    batch_size = batch_size or _embed_batch_size()
+
+    texts = [chunk for j in judgments for chunk in j["chunks"]]
+    if not texts:
+        return None, [[] for _ in judgments]
+
+    # Embed: dense + sparse in one BGE-M3 forward pass per batch. Sparse
+    # vectors come back as CSR arrays and each SparseVector is built from a
+    # slice of them.
+    dense_vecs, (indptr, indices, values) = embedder.encode_batch(
+        texts, batch_size=batch_size, sparse_csr=True,
+    )
+    bounds = indptr.tolist()
+    sparse_vecs = [
+        SparseVector(indices=indices[lo:hi].tolist(), values=values[lo:hi].tolist())
+        for lo, hi in zip(bounds, bounds[1:])
+    ]
+
+    # Build the id/payload columns, demuxing chunks back to each judgment
+    ids: list[str] = []
+    payloads: list[dict] = []
+    all_point_ids: list[list[str]] = []
+    for j in judgments:
+        diary_no = j["diary_no"]
+        chunks = j["chunks"]
+        total_chunks = len(chunks)
+        decision_date = j["decision_date"]
+
+        # Generate deterministic UUIDs for this judgment
+        point_ids = _chunk_point_ids(diary_no, total_chunks)
+        ids.extend(point_ids)
+        all_point_ids.append(point_ids)
+
+        # Judgment-level fields are shared by every chunk's payload
+        judgment_payload = {
+            "case_name": j["case_name"],
+            "case_no": j["case_no"],
+            "diary_no": diary_no,
+            "disposal_nature": j["disposal_nature"] or "",
+            "year": j["year"],
+            "decision_date": decision_date.isoformat() if decision_date else "",
+            "legal_domain": j["legal_domain"] or "",
+            "ik_url": "",   # populated in future IK enrichment pass
+            "language": "en",
+        }
+        for chunk_idx, chunk_text in enumerate(chunks):
+            payloads.append({
+                "text": chunk_text,
+                "chunk_index": chunk_idx,
+                "total_chunks": total_chunks,
+                "section_type": section_type_at(chunk_idx, total_chunks),
+                **judgment_payload,
+            })
+
+    batch = Batch(
+        ids=ids,
+        vectors={"dense": dense_vecs, "sparse": sparse_vecs},
+        payloads=payloads,
+    )
+    return batch, all_point_ids
+
+
+def _slice_batch(batch: "Batch", start: int, stop: Optional[int] = None) -> "Batch":
+    """Return points [start:stop] of a columnar Batch as a new Batch."""
+    from qdrant_client.models import Batch
+
+    return Batch(
+        ids=batch.ids[start:stop],
+        vectors={name: vecs[start:stop] for name, vecs in batch.vectors.items()},
+        payloads=batch.payloads[start:stop],
+    )
+
+
+def embed_and_upsert_judgments(
+    judgments: list[dict],
+    qdrant_client,
+    embedder,
+    batch_size: Optional[int] = None,
+) -> list[list[str]]:
+    """Embed the chunks of several judgments and upsert them to sc_judgments.
+
+    Blocking variant of the Phase E pipeline: returns once every point is
+    persisted. process_year() uses _UpsertPipeline instead so uploads overlap
+    with embedding of the next group.
+
+    Args:
+        judgments:     Record dicts with an added "chunks" list.
+        qdrant_client: Connected Qdrant client (sync).
+        embedder:      Loaded BGEM3Embedder instance.
+        batch_size:    Texts per forward pass. Defaults to the resolved
+                       EMBED_BATCH_SIZE.
+
+    Returns:
+        One list of point UUID strings per judgment, in input order.
+    """
+    from backend.rag.qdrant_setup import COLLECTION_SC_JUDGMENTS
+
+    batch, all_point_ids = build_judgment_points(judgments, embedder, batch_size)
+    if batch is None:
+        return all_point_ids
+
+    # Upload without waiting for each batch to be indexed, so requests are
+    # not serialised on Qdrant's indexing. Then re-upsert the last point
+    # with wait=True: sc_judgments has a single shard (checked by
+    # assert_single_shard() at the start of a run), whose updates are
+    # applied in WAL order, so once that returns every point above is
+    # persisted — the checkpoint Phase F needs before writing
+    # ingested_judgments.
+    total = len(batch.ids)
+    for start in range(0, total, QDRANT_UPLOAD_BATCH_SIZE):
+        qdrant_client.upsert(
+            collection_name=COLLECTION_SC_JUDGMENTS,
+            points=_slice_batch(batch, start, start + QDRANT_UPLOAD_BATCH_SIZE),
+            wait=False,
+        )
+    qdrant_client.upsert(
+        collection_name=COLLECTION_SC_JUDGMENTS,
+        points=_slice_batch(batch, total - 1),
+        wait=True,
+    )
+    logger.debug(
+        "upserted_judgments: judgments=%d chunks=%d",
+        len(judgments), total,
+    )
+
+    return all_point_ids
+
+
+async def upsert_points_async(
+    async_client,
+    batch: "Batch",
+    batch_size: int,
+    concurrency: int = QDRANT_UPSERT_CONCURRENCY,
+) -> None:
+    """Upsert a columnar Batch to sc_judgments as concurrent requests.
+
+    Up to `concurrency` upsert requests are in flight at once (wait=False, so
+    each returns as soon as Qdrant has written it to the WAL). The last point
+    is then re-upserted with wait=True; because sc_judgments has a single
+    shard (see qdrant_setup.assert_single_shard()) and a shard's WAL is
+    applied in order, its return means every request above is persisted.
+
+    Args:
+        async_client: Connected AsyncQdrantClient.
+        batch:        Points to upsert, as built by build_judgment_points().
+        batch_size:   Points per upsert request.
+        concurrency:  Maximum number of upsert requests in flight.
+    """
+    from backend.rag.qdrant_setup import COLLECTION_SC_JUDGMENTS
+
+    total = len(batch.ids) if batch is not None else 0
+    if not total:
+        return
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _send(start: int) -> None:
+        async with semaphore:
+            await async_client.upsert(
+                collection_name=COLLECTION_SC_JUDGMENTS,
+                points=_slice_batch(batch, start, start + batch_size),
+                wait=False,
+            )
+
+    await asyncio.gather(*(_send(start) for start in range(0, total, batch_size)))
+    await async_client.upsert(
+        collection_name=COLLECTION_SC_JUDGMENTS,
+        points=_slice_batch(batch, total - 1),
+        wait=True,
+    )
+
+
 def embed_and_upsert_judgment(
     diary_no: str,
     case_name: str,
@@ -827,12 +1277,10 @@ def embed_and_upsert_judgment(
     qdrant_client,
     embedder,
 ) -> list[str]:
-    """Embed judgment chunks and upsert to Qdrant sc_judgments collection.
+    """Embed one judgment's chunks and upsert to Qdrant sc_judgments collection.
 
-    Each chunk becomes one Qdrant point. Point UUID is deterministic:
-        uuid5(NAMESPACE_URL, f"{diary_no}__chunk{idx}")
-    This makes the pipeline fully idempotent — re-running overwrites
-    existing points with identical data, no duplicates accumulate.
+    Single-judgment convenience wrapper around embed_and_upsert_judgments(),
+    used for incremental runs where there is nothing to batch with.
 
     Args:
         diary_no:       Primary dedup key.
@@ -849,85 +1297,237 @@ def embed_and_upsert_judgment(
     Returns:
         List of point UUID strings (one per chunk) for storage in ingested_judgments.
     """
-    from qdrant_client.models import PointStruct, SparseVector
-    from backend.rag.embeddings import sparse_dict_to_qdrant
-    from backend.rag.qdrant_setup import COLLECTION_SC_JUDGMENTS
+    judgment = {
+        "diary_no": diary_no,
+        "case_name": case_name,
+        "case_no": case_no,
+        "year": year,
+        "decision_date": decision_date,
+        "disposal_nature": disposal_nature,
+        "legal_domain": legal_domain,
+        "chunks": chunks,
+    }
+    return embed_and_upsert_judgments([judgment], qdrant_client, embedder)[0]
+
+
+def _record_judgments(
+    judgments: list[dict],
+    all_point_ids: list[list[str]],
+    session,
+    stats: dict,
+) -> None:
+    """Phase F for a group of judgments whose points are persisted in Qdrant.
+
+    A Supabase failure only fails the judgment it belongs to.
+    """
+    from backend.db.repositories.judgment_repository import upsert_judgment_record
 
-    section_types = assign_section_types(chunks)
-    total_chunks = len(chunks)
-    point_ids: list[str] = []
-
-    # Process in batches for memory efficiency
-    for batch_start in range(0, total_chunks, EMBED_BATCH_SIZE):
-        batch = chunks[batch_start: batch_start + EMBED_BATCH_SIZE]
-        batch_indices = list(range(batch_start, batch_start + len(batch)))
-
-        # Generate deterministic UUIDs for this batch
-        batch_uuids = [
-            str(uuid.uuid5(UUID_NAMESPACE, f"{diary_no}__chunk{idx}"))
-            for idx in batch_indices
-        ]
-
-        # Embed: dense + sparse in one BGE-M3 forward pass
-        dense_vecs = embedder.encode_dense(batch)
-        sparse_dicts = embedder.encode_sparse(batch)
-
-        # Build Qdrant PointStructs
-        points = []
-        for i, (chunk_text, chunk_idx, point_uuid) in enumerate(
-            zip(batch, batch_indices, batch_uuids)
-        ):
-            sv = sparse_dict_to_qdrant(sparse_dicts[i])
-            points.append(
-                PointStruct(
-                    id=point_uuid,
-                    vector={
-                        "dense": dense_vecs[i],
-                        "sparse": SparseVector(**sv),
-                    },
-                    payload={
-                        "text": chunk_text,
-                        "chunk_index": chunk_idx,
-                        "total_chunks": total_chunks,
-                        "section_type": section_types[chunk_idx],
-                        "case_name": case_name,
-                        "case_no": case_no,
-                        "diary_no": diary_no,
-                        "disposal_nature": disposal_nature or "",
-                        "year": year,
-                        "decision_date": decision_date.isoformat() if decision_date else "",
-                        "legal_domain": legal_domain or "",
-                        "ik_url": "",   # populated in future IK enrichment pass
-                        "language": "en",
-                    },
-                )
+    for record, point_ids in zip(judgments, all_point_ids):
+        try:
+            upsert_judgment_record(
+                diary_no=record["diary_no"],
+                case_no=record["case_no"],
+                case_name=record["case_name"],
+                year=record["year"],
+                decision_date=record["decision_date"],
+                disposal_nature=record["disposal_nature"],
+                legal_domain=record["legal_domain"],
+                qdrant_point_ids=point_ids,
+                chunk_count=len(record["chunks"]),
+                pdf_hash=record["pdf_hash"],
+                ocr_required=record["ocr_required"],
+                sync_session=session,
             )
+            stats["processed"] += 1
+        except Exception as exc:
+            logger.exception("judgment_failed: %s — %s", record["diary_no"], exc)
+            stats["failed"] += 1
+
+
+class _UpsertPipeline:
+    """Overlap the Qdrant upload of one judgment group with embedding of the next.
+
+    An AsyncQdrantClient runs on a dedicated event-loop thread. flush() embeds
+    a group on the calling thread, then hands its points to that loop and
+    returns immediately, so the GPU starts on the next group while the
+    previous one is still on the wire. Only one group is in flight: before
+    submitting, flush() waits for the previous upload and writes its
+    ingested_judgments rows, so --resume never skips a judgment whose
+    vectors are missing. All database work stays on the calling thread.
+    """
 
-        qdrant_client.upsert(
-            collection_name=COLLECTION_SC_JUDGMENTS,
-            points=points,
-            wait=True,
+    def __init__(self, concurrency: int = QDRANT_UPSERT_CONCURRENCY) -> None:
+        self._concurrency = concurrency
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="qdrant-upsert", daemon=True,
+        )
+        self._thread.start()
+        self._client = None
+        self._in_flight: Optional[tuple] = None  # (future, judgments, point_ids)
+
+    async def _upsert(self, batch: "Batch") -> None:
+        if self._client is None:
+            from backend.rag.qdrant_setup import get_async_qdrant_client
+            self._client = get_async_qdrant_client(prefer_grpc=True)
+        await upsert_points_async(
+            self._client, batch, QDRANT_UPLOAD_BATCH_SIZE, self._concurrency,
+        )
+
+    def flush(self, judgments: list[dict], embedder, session, stats: dict) -> None:
+        """Embed a group of judgments and start uploading their points.
+
+        An embedding failure fails the whole group; an upload failure fails
+        the group once it is collected by the next flush() or close().
+        """
+        if not judgments:
+            return
+
+        try:
+            batch, all_point_ids = build_judgment_points(judgments, embedder)
+        except Exception as exc:
+            logger.exception(
+                "embed_batch_failed: judgments=%s — %s",
+                [j["diary_no"] for j in judgments], exc,
+            )
+            stats["failed"] += len(judgments)
+            return
+
+        self.drain(session, stats)
+        future = asyncio.run_coroutine_threadsafe(
+            self._upsert(batch), self._loop,
         )
-        point_ids.extend(batch_uuids)
+        self._in_flight = (future, judgments, all_point_ids)
+
+    def drain(self, session, stats: dict) -> None:
+        """Wait for the in-flight upload, then run Phase F for its judgments."""
+        if self._in_flight is None:
+            return
+        future, judgments, all_point_ids = self._in_flight
+        self._in_flight = None
+        try:
+            future.result()
+        except Exception as exc:
+            logger.exception(
+                "upsert_batch_failed: judgments=%s — %s",
+                [j["diary_no"] for j in judgments], exc,
+            )
+            stats["failed"] += len(judgments)
+            return
         logger.debug(
-            "upserted_batch: diary_no=%s chunks=%d/%d",
-            diary_no, batch_start + len(batch), total_chunks,
+            "upserted_judgments: judgments=%d chunks=%d",
+            len(judgments), sum(len(ids) for ids in all_point_ids),
         )
+        _record_judgments(judgments, all_point_ids, session, stats)
 
-    return point_ids
+    def close(self, session, stats: dict) -> None:
+        """Drain the last upload and shut down the event-loop thread."""
+        try:
+            self.drain(session, stats)
+        finally:
+            if self._client is not None:
+                asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
 
 
 # ---------------------------------------------------------------------------
 # Phase F: Update ingested_judgments in Supabase
 # ---------------------------------------------------------------------------
 
-def _compute_pdf_hash(pdf_path: Path) -> str:
-    """Return SHA-256 hex digest of a PDF file for change detection."""
-    h = hashlib.sha256()
-    with open(pdf_path, "rb") as f:
-        for block in iter(lambda: f.read(65536), b""):
-            h.update(block)
-    return h.hexdigest()
+def _compute_pdf_hash(pdf_source: bytes | Path) -> str:
+    """Return SHA-256 hex digest of a PDF (bytes or file) for change detection.
+
+    Both paths hand OpenSSL large contiguous buffers: streamed tar members in
+    a single update, files via hashlib.file_digest() (Python 3.11+), which
+    reads into a reusable buffer and hashes with the GIL released.
+    """
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return hashlib.sha256(pdf_source).hexdigest()
+    with open(pdf_source, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Phase C + D worker
+# ---------------------------------------------------------------------------
+
+def _prepare_judgment(pdf_filename: str, pdf_bytes: bytes) -> dict:
+    """Extract, clean, hash and chunk one judgment PDF (Phase C + D).
+
+    Module-level and free of Qdrant/database state so it can run in a
+    worker process.
+
+    Returns:
+        Dict with keys:
+            empty         — True if the PDF yielded no text at all
+            legal_domain  — domain inferred from the raw opening text
+            chunks        — list of chunk strings (may be empty)
+            pdf_hash      — SHA-256 hex digest of the PDF
+            ocr_required  — True if the text came from Tesseract OCR
+    """
+    raw_text, ocr_required = extract_pdf_text(pdf_bytes, name=pdf_filename)
+    if not raw_text or raw_text.isspace():
+        return {"empty": True, "legal_domain": None, "chunks": [],
+                "pdf_hash": "", "ocr_required": ocr_required}
+
+    # Derive domain from actual PDF content BEFORE cleaning — the raw text
+    # retains jurisdictional headers ("CRIMINAL APPELLATE JURISDICTION",
+    # "ORIGINAL JURISDICTION") that clean_judgment_text() strips.  This is
+    # far more reliable than the case_no prefix approach, which fails for
+    # INSC neutral citations ("2023 INSC 2").
+    # Only one copy of the judgment body is alive at each step: the raw text
+    # is dropped once cleaned, the cleaned text once chunked.
+    legal_domain = _infer_domain_from_text(raw_text)
+    clean_text = clean_judgment_text(raw_text)
+    del raw_text
+    chunks = chunk_judgment_text(clean_text)
+    del clean_text
+
+    return {
+        "empty": False,
+        "legal_domain": legal_domain,
+        "chunks": chunks,
+        "pdf_hash": _compute_pdf_hash(pdf_bytes),
+        "ocr_required": ocr_required,
+    }
+
+
+def _prefetch_prepared(
+    members: Iterator[tuple[dict, str, bytes]],
+    executor: Executor,
+    depth: int,
+) -> Iterator[tuple[dict, Future]]:
+    """Submit _prepare_judgment() for each member, keeping `depth` in flight.
+
+    Yields (record, future) in member order. At most `depth` PDFs are held
+    in memory at once, so the tar is never read far ahead of the consumer.
+    """
+    window: deque[tuple[dict, Future]] = deque()
+    for record, pdf_filename, pdf_bytes in members:
+        window.append((record, executor.submit(_prepare_judgment, pdf_filename, pdf_bytes)))
+        if len(window) >= depth:
+            yield window.popleft()
+    while window:
+        yield window.popleft()
+
+
+def _pdf_writer_worker(write_queue: "queue.Queue[Optional[tuple[Path, bytes]]]") -> None:
+    """Write (path, bytes) items from the queue to disk until a None sentinel.
+
+    Runs on a daemon thread so --keep-pdfs copies don't stall the tar
+    stream feeding the prepare workers.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            return
+        path, data = item
+        try:
+            path.write_bytes(data)
+        except OSError as exc:
+            logger.warning("keep_pdf_write_failed: %s — %s", path, exc)
 
 
 # ---------------------------------------------------------------------------
@@ -940,6 +1540,9 @@ def process_year(
     dry_run: bool = False,
     resume: bool = True,
     keep_pdfs: bool = False,
+    cpu_int8: bool = False,
+    partition: tuple[int, int] = (0, 1),
+    defer_indexing: bool = True,
 ) -> dict:
     """Full pipeline for one year of SC judgments.
 
@@ -948,15 +1551,22 @@ def process_year(
         work_dir: Working directory for downloads.
         dry_run:  If True, preprocess metadata only (no embedding/upsert).
         resume:   If True, skip already-ingested diary_nos.
-        keep_pdfs: If True, do not delete extracted PDFs after processing.
+        keep_pdfs: If True, also write each streamed PDF to work_dir/pdfs_{year}.
+        cpu_int8: If True and no GPU is present, quantize BGE-M3 to INT8.
+        partition: (index, count) — only process judgments whose diary_no
+                  falls in this partition (see _partition_of()).
+        defer_indexing: Suspend HNSW indexing for the load. Partition
+                  workers pass False; their parent defers it once for all.
 
     Returns:
         Stats dict: {processed, skipped, failed, total}.
     """
     import os
 
+    part_idx, part_count = partition
+
     logger.info("=" * 60)
-    logger.info("process_year: START year=%d", year)
+    logger.info("process_year: START year=%d partition=%d/%d", year, part_idx, part_count)
     logger.info("=" * 60)
 
     stats = {"year": year, "processed": 0, "skipped": 0, "failed": 0, "total": 0}
@@ -970,6 +1580,8 @@ def process_year(
 
     # ── Phase B: Load and preprocess metadata ────────────────────────────────
     records = load_parquet_metadata(parquet_path)
+    if part_count > 1:
+        records = [r for r in records if _partition_of(r["diary_no"], part_count) == part_idx]
     stats["total"] = len(records)
 
     if dry_run:
@@ -988,163 +1600,310 @@ def process_year(
     sync_engine = create_engine(db_url, pool_pre_ping=True)
 
     # ── Set up Qdrant client and embedder ────────────────────────────────────
-    from backend.rag.qdrant_setup import get_qdrant_client
+    from backend.rag.qdrant_setup import (
+        COLLECTION_SC_JUDGMENTS,
+        assert_single_shard,
+        deferred_indexing,
+        get_qdrant_client,
+    )
     from backend.rag.embeddings import BGEM3Embedder
 
-    qdrant_client = get_qdrant_client()
+    qdrant_client = get_qdrant_client(prefer_grpc=True)
+    assert_single_shard(qdrant_client, COLLECTION_SC_JUDGMENTS)
     logger.info("loading_embedder: BGEM3Embedder (BGE-M3, ~2GB model)...")
-    embedder = BGEM3Embedder()
+    embedder = BGEM3Embedder(cpu_int8=cpu_int8, warmup=True)
     logger.info("embedder_loaded")
 
-    # ── Download and extract PDF tar ─────────────────────────────────────────
+    # ── Download PDF tar ─────────────────────────────────────────────────────
     try:
         tar_path = download_tar(year, work_dir)
     except RuntimeError as exc:
         logger.error("download_tar_failed: year=%d — %s", year, exc)
+        qdrant_client.close()
         sync_engine.dispose()
         return stats
 
+    # PDFs are streamed straight out of the tar into PyMuPDF; they only touch
+    # disk when --keep-pdfs asks for a local copy.
     extract_dir = work_dir / f"pdfs_{year}"
-    extract_dir.mkdir(parents=True, exist_ok=True)
-
-    logger.info("extracting_tar: %s → %s", tar_path, extract_dir)
-    with tarfile.open(tar_path, "r") as tf:
-        tf.extractall(extract_dir)
-    logger.info("tar_extracted: %s", extract_dir)
+    if keep_pdfs:
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        # Bounded so a slow disk can hold back at most PREPARE_PREFETCH copies
+        write_queue: queue.Queue = queue.Queue(maxsize=PREPARE_PREFETCH)
+        writer = threading.Thread(
+            target=_pdf_writer_worker, args=(write_queue,),
+            name="keep-pdfs-writer", daemon=True,
+        )
+        writer.start()
 
     # ── Process each judgment ────────────────────────────────────────────────
-    from backend.db.repositories.judgment_repository import (
-        is_already_ingested,
-        upsert_judgment_record,
+    from backend.db.repositories.judgment_repository import get_ingested_diary_nos
+
+    # HNSW indexing is suspended for the whole year's load and rebuilt once
+    # when it finishes, instead of after every upload batch.
+    indexing = (
+        deferred_indexing(qdrant_client, COLLECTION_SC_JUDGMENTS)
+        if defer_indexing else nullcontext()
     )
+    with Session(sync_engine) as session, indexing:
+        # Batched IN queries for the whole year's dedup set instead of one per judgment
+        ingested = (
+            get_ingested_diary_nos((r["diary_no"] for r in records), session)
+            if resume else set()
+        )
+        if resume:
+            logger.info("resume: %d diary_nos already ingested for year=%d", len(ingested), year)
 
-    with Session(sync_engine) as session:
-        for i, record in enumerate(records):
+        # Resolve dedup + PDF filename up front so the tar can be consumed in
+        # a single forward pass, matching members against this index.
+        records_by_pdf: dict[str, dict] = {}
+        for record in records:
             diary_no = record["diary_no"]
-            stats["total"] = len(records)
 
             # Skip already-ingested (if resume mode)
-            if resume and is_already_ingested(diary_no, session):
+            if diary_no in ingested:
                 logger.debug("skip_already_ingested: %s", diary_no)
                 stats["skipped"] += 1
                 continue
 
-            # Find the PDF file
             pdf_filename = record.get("pdf_filename")
             if not pdf_filename:
                 logger.warning("no_pdf_filename: diary_no=%s", diary_no)
                 stats["failed"] += 1
                 continue
 
-            # PDFs may be nested in subdirectories within the tar
-            pdf_candidates = list(extract_dir.rglob(pdf_filename))
-            if not pdf_candidates:
-                logger.warning("pdf_not_found: %s in %s", pdf_filename, extract_dir)
+            # The first record keeps the PDF; a later one sharing its filename
+            # fails, as it did when each record looked its PDF up in turn
+            if pdf_filename in records_by_pdf:
+                logger.warning(
+                    "duplicate_pdf_filename: diary_no=%s pdf=%s already claimed by diary_no=%s",
+                    diary_no, pdf_filename, records_by_pdf[pdf_filename]["diary_no"],
+                )
                 stats["failed"] += 1
                 continue
 
-            pdf_path = pdf_candidates[0]
-
-            try:
-                # ── Phase C: Extract text ───────────────────────────────────
-                raw_text, ocr_required = extract_pdf_text(pdf_path)
-                if not raw_text.strip():
-                    logger.warning("empty_pdf: %s", pdf_path.name)
+            records_by_pdf[pdf_filename] = record
+
+        logger.info("streaming_tar: %s (%d judgments pending)", tar_path, len(records_by_pdf))
+
+        # Qdrant uploads run on a background event loop while the next group
+        # of judgments is extracted and embedded.
+        pipeline = _UpsertPipeline()
+
+        # Chunked judgments wait here until a window of them can be embedded
+        # together in length-sorted batches; small incremental runs flush
+        # every judgment.
+        pending: list[dict] = []
+        flush_at = 1 if len(records_by_pdf) < INCREMENTAL_THRESHOLD else EMBED_WINDOW_JUDGMENTS
+        seen = 0
+
+        def _members() -> Iterator[tuple[dict, str, bytes]]:
+            for pdf_filename, pdf_bytes in iter_tar_pdfs(tar_path, wanted=records_by_pdf):
+                record = records_by_pdf.pop(pdf_filename, None)
+                if record is None:
+                    continue  # duplicate member name, already consumed
+                if keep_pdfs:
+                    write_queue.put((extract_dir / pdf_filename, pdf_bytes))
+                yield record, pdf_filename, pdf_bytes
+
+        # Phase C + D run in worker processes, PREPARE_PREFETCH judgments
+        # ahead of the main thread, which only embeds and records. Workers
+        # are spawned rather than forked: this process already holds CUDA
+        # state and the upsert event-loop thread.
+        executor = ProcessPoolExecutor(
+            max_workers=max(1, PREPARE_WORKERS // part_count),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            for record, future in _prefetch_prepared(_members(), executor, PREPARE_PREFETCH):
+                diary_no = record["diary_no"]
+                seen += 1
+
+                try:
+                    prepared = future.result()
+                    if prepared["empty"]:
+                        logger.warning("empty_pdf: %s", record["pdf_filename"])
+                        stats["failed"] += 1
+                        continue
+
+                    record["legal_domain"] = prepared["legal_domain"]
+                    logger.debug(
+                        "domain_from_text: diary_no=%s domain=%s",
+                        diary_no, record["legal_domain"],
+                    )
+                    if not prepared["chunks"]:
+                        logger.warning("no_chunks: %s", diary_no)
+                        stats["failed"] += 1
+                        continue
+
+                    # ── Phase E + F: buffer for cross-judgment embedding ────────
+                    record["chunks"] = prepared["chunks"]
+                    record["pdf_hash"] = prepared["pdf_hash"]
+                    record["ocr_required"] = prepared["ocr_required"]
+                    pending.append(record)
+                    if len(pending) >= flush_at:
+                        pipeline.flush(pending, embedder, session, stats)
+                        pending = []
+
+                    if seen % 100 == 0:
+                        logger.info(
+                            "progress: year=%d %d/%d (processed=%d skipped=%d failed=%d)",
+                            year, stats["processed"] + stats["skipped"] + stats["failed"],
+                            len(records),
+                            stats["processed"], stats["skipped"], stats["failed"],
+                        )
+
+                except Exception as exc:
+                    logger.exception("judgment_failed: %s — %s", diary_no, exc)
                     stats["failed"] += 1
                     continue
 
-                # Derive domain from actual PDF content BEFORE cleaning —
-                # the raw text retains jurisdictional headers
-                # ("CRIMINAL APPELLATE JURISDICTION", "ORIGINAL JURISDICTION")
-                # that clean_judgment_text() strips.  This is far more reliable
-                # than the case_no prefix approach, which fails for INSC
-                # neutral citations ("2023 INSC 2").
-                record["legal_domain"] = _infer_domain_from_text(raw_text[:3000])
-                logger.debug(
-                    "domain_from_text: diary_no=%s domain=%s",
-                    diary_no, record["legal_domain"],
-                )
+            pipeline.flush(pending, embedder, session, stats)
+        finally:
+            executor.shutdown(cancel_futures=True)
+            pipeline.close(session, stats)
+            if keep_pdfs:
+                write_queue.put(None)
+                writer.join()
 
-                clean_text = clean_judgment_text(raw_text)
-                pdf_hash = _compute_pdf_hash(pdf_path)
+        # Anything still pending never appeared in the tar
+        for pdf_filename in records_by_pdf:
+            logger.warning("pdf_not_found: %s in %s", pdf_filename, tar_path)
+            stats["failed"] += 1
 
-                # ── Phase D: Chunk ──────────────────────────────────────────
-                chunks = chunk_judgment_text(clean_text)
-                if not chunks:
-                    logger.warning("no_chunks: %s", diary_no)
-                    stats["failed"] += 1
-                    continue
+    qdrant_client.close()
+    sync_engine.dispose()
 
-                # ── Phase E: Embed + Qdrant upsert ──────────────────────────
-                point_ids = embed_and_upsert_judgment(
-                    diary_no=diary_no,
-                    case_name=record["case_name"],
-                    case_no=record["case_no"],
-                    year=record["year"],
-                    decision_date=record["decision_date"],
-                    disposal_nature=record["disposal_nature"],
-                    legal_domain=record["legal_domain"],
-                    chunks=chunks,
-                    qdrant_client=qdrant_client,
-                    embedder=embedder,
-                )
+    logger.info(
+        "process_year: DONE year=%d processed=%d skipped=%d failed=%d total=%d",
+        year, stats["processed"], stats["skipped"], stats["failed"], stats["total"],
+    )
+    return stats
 
-                # ── Phase F: Update Supabase ─────────────────────────────────
-                upsert_judgment_record(
-                    diary_no=diary_no,
-                    case_no=record["case_no"],
-                    case_name=record["case_name"],
-                    year=record["year"],
-                    decision_date=record["decision_date"],
-                    disposal_nature=record["disposal_nature"],
-                    legal_domain=record["legal_domain"],
-                    qdrant_point_ids=point_ids,
-                    chunk_count=len(chunks),
-                    pdf_hash=pdf_hash,
-                    ocr_required=ocr_required,
-                    sync_session=session,
-                )
 
-                stats["processed"] += 1
-                if (i + 1) % 100 == 0:
-                    logger.info(
-                        "progress: year=%d %d/%d (processed=%d skipped=%d failed=%d)",
-                        year, i + 1, len(records),
-                        stats["processed"], stats["skipped"], stats["failed"],
-                    )
+def _partition_of(diary_no: str, count: int) -> int:
+    """Stable partition index for a diary_no (CRC-32, same in every process)."""
+    return zlib.crc32(diary_no.encode("utf-8")) % count
 
-            except Exception as exc:
-                logger.exception("judgment_failed: %s — %s", diary_no, exc)
-                stats["failed"] += 1
-                continue
-            finally:
-                # Delete PDF if not keeping them (save disk space)
-                if not keep_pdfs and pdf_path.exists():
-                    pdf_path.unlink()
 
-    # ── Cleanup ───────────────────────────────────────────────────────────────
-    if not keep_pdfs and extract_dir.exists():
-        import shutil
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        logger.info("cleaned_up: %s", extract_dir)
+def _cuda_device_count() -> int:
+    try:
+        import torch
+        return torch.cuda.device_count()
+    except ImportError:
+        return 0
+
+
+def _process_year_partition(kwargs: dict, gpu: Optional[int]) -> dict:
+    """Worker-process entry point: run process_year() for one partition.
+
+    Pins the worker to one GPU before the embedder (and so torch) loads.
+    """
+    _configure_logging()
+    if gpu is not None:
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(gpu)
+    return process_year(**kwargs)
 
-    sync_engine.dispose()
+
+def process_year_parallel(
+    year: int,
+    work_dir: Path,
+    workers: int,
+    resume: bool = True,
+    keep_pdfs: bool = False,
+    cpu_int8: bool = False,
+) -> dict:
+    """Run process_year() as `workers` processes over diary_no partitions.
+
+    Each partition runs in its own freshly spawned process, which owns its
+    BGE-M3 embedder (round-robined across visible GPUs), gRPC Qdrant client,
+    extraction pool and database session, so neither embedding nor
+    upserting is funnelled through one process. All partitions write to
+    the single sc_judgments shard (see assert_single_shard()).
+    Downloads and the HNSW indexing deferral happen once, here, so workers
+    neither race on the S3 download nor re-enable indexing while others
+    are still loading.
+
+    Returns:
+        Stats dict summed over all partitions: {processed, skipped, failed, total}.
+    """
+    stats = {"year": year, "processed": 0, "skipped": 0, "failed": 0, "total": 0}
+
+    try:
+        download_parquet(year, work_dir)
+        download_tar(year, work_dir)
+    except RuntimeError as exc:
+        logger.error("download_failed: year=%d — %s", year, exc)
+        return stats
+
+    from backend.rag.qdrant_setup import (
+        COLLECTION_SC_JUDGMENTS,
+        assert_single_shard,
+        deferred_indexing,
+        get_qdrant_client,
+    )
+
+    gpu_count = _cuda_device_count()
+    logger.info("process_year_parallel: year=%d workers=%d gpus=%d", year, workers, gpu_count)
+
+    qdrant_client = get_qdrant_client(prefer_grpc=True)
+    assert_single_shard(qdrant_client, COLLECTION_SC_JUDGMENTS)
+    try:
+        with deferred_indexing(qdrant_client, COLLECTION_SC_JUDGMENTS), \
+                ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    # A fresh process per partition: a reused worker already
+                    # has torch initialised, so CUDA_VISIBLE_DEVICES would no
+                    # longer pin its next partition to the assigned GPU
+                    max_tasks_per_child=1,
+                ) as pool:
+            futures = [
+                pool.submit(
+                    _process_year_partition,
+                    dict(
+                        year=year,
+                        work_dir=work_dir,
+                        resume=resume,
+                        keep_pdfs=keep_pdfs,
+                        cpu_int8=cpu_int8,
+                        partition=(idx, workers),
+                        defer_indexing=False,
+                    ),
+                    idx % gpu_count if gpu_count else None,
+                )
+                for idx in range(workers)
+            ]
+            for idx, future in enumerate(futures):
+                try:
+                    part_stats = future.result()
+                except Exception as exc:
+                    logger.exception("partition_failed: year=%d partition=%d — %s", year, idx, exc)
+                    continue
+                for key in ("processed", "skipped", "failed", "total"):
+                    stats[key] += part_stats[key]
+    finally:
+        qdrant_client.close()
 
     logger.info(
-        "process_year: DONE year=%d processed=%d skipped=%d failed=%d total=%d",
+        "process_year_parallel: DONE year=%d processed=%d skipped=%d failed=%d total=%d",
         year, stats["processed"], stats["skipped"], stats["failed"], stats["total"],
     )
     return stats
 
 
-def main() -> None:
-    """CLI entry point."""
+def _configure_logging() -> None:
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)],
     )
 
+
+def main() -> None:
+    """CLI entry point."""
+    _configure_logging()
+
     args = _parse_args()
 
     # Determine years to process
@@ -1158,13 +1917,24 @@ def main() -> None:
 
     all_stats = []
     for year in years:
-        stats = process_year(
-            year=year,
-            work_dir=args.work_dir,
-            dry_run=args.dry_run,
-            resume=args.resume,
-            keep_pdfs=args.keep_pdfs,
-        )
+        if args.workers > 1 and not args.dry_run:
+            stats = process_year_parallel(
+                year=year,
+                work_dir=args.work_dir,
+                workers=args.workers,
+                resume=args.resume,
+                keep_pdfs=args.keep_pdfs,
+                cpu_int8=args.cpu_int8,
+            )
+        else:
+            stats = process_year(
+                year=year,
+                work_dir=args.work_dir,
+                dry_run=args.dry_run,
+                resume=args.resume,
+                keep_pdfs=args.keep_pdfs,
+                cpu_int8=args.cpu_int8,
+            )
         all_stats.append(stats)
 
     # Summary
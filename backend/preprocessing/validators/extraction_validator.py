@@ -15,7 +15,72 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# Failure codes and message templates
+# ---------------------------------------------------------------------------
+
+FOOTNOTE_RESIDUE = 1
+COMMENTARY_RESIDUE = 2
+CROSS_SECTION_CONTAMINATION = 3
+BRACKET_ANNOTATION = 4
+EMPTY_TEXT = 5
+SHORT_TEXT = 6
+SUBSECTIONS_MISSING = 7
+SUBSECTION_COUNT_MISMATCH = 8
+MISSING_OFFENCE_FIELDS = 9
+
+# Templates are formatted with ``template.format(section_number, *args)`` only
+# when a caller reads ExtractionReport.check_failures — validation itself just
+# records (code, args) tuples.
+CHECK_MESSAGES: Dict[int, str] = {
+    FOOTNOTE_RESIDUE: (
+        "[{0}] Check 1 FAIL: Footnote residue found "
+        "(line starting with digit + 'Section' + digit). "
+        "Run remove_inline_footnotes again or re-extract from PDF."
+    ),
+    COMMENTARY_RESIDUE: (
+        "[{0}] Check 2 FAIL: Editorial comparison commentary found "
+        "in legal_text (trigger phrase survived cleaning). "
+        "This section requires re-extraction."
+    ),
+    CROSS_SECTION_CONTAMINATION: (
+        "[{0}] Check 3 FAIL: Cross-section contamination — "
+        "legal_text begins with section {1}'s content "
+        "(expected section {0}). "
+        "Discard legal_text and re-extract from PDF."
+    ),
+    BRACKET_ANNOTATION: (
+        "[{0}] Check 4 FAIL: Comparison bracket annotation found "
+        "(e.g., '[ten years]' or '[the 1st day of April, 1974]'). "
+        "Run remove_comparison_brackets again."
+    ),
+    EMPTY_TEXT: (
+        "[{0}] Check 5 FAIL: legal_text is empty. "
+        "Extraction failed entirely — extract directly from PDF."
+    ),
+    SHORT_TEXT: (
+        "[{0}] Check 5 WARN: legal_text is suspiciously short "
+        "({1} characters). Verify against source PDF."
+    ),
+    SUBSECTIONS_MISSING: (
+        "[{0}] Check 6 FAIL: has_subsections=True "
+        "but no sub-sections were extracted "
+        "(expected ~{1})."
+    ),
+    SUBSECTION_COUNT_MISMATCH: (
+        "[{0}] Check 6 WARN: Sub-section count discrepancy "
+        "(expected ~{1}, extracted {2}, "
+        "discrepancy={3:.0%})."
+    ),
+    MISSING_OFFENCE_FIELDS: (
+        "[{0}] Check 7 WARN: Offence section missing "
+        "classification fields: {1}. "
+        "Populate from BNSS Schedule I lookup table."
+    ),
+}
 
 
 # ---------------------------------------------------------------------------
@@ -27,10 +92,18 @@ class ExtractionReport:
     section_id: str                       # section_number (e.g., "103", "53A")
     checks_run: int                        # total checks executed
     checks_passed: int                     # checks with no failure
-    check_failures: List[str] = field(default_factory=list)   # human-readable messages
+    failure_codes: List[Tuple[int, tuple]] = field(default_factory=list)  # (code, args)
     extraction_confidence: float = 1.0    # 0.0 to 1.0
     requires_human_review: bool = False   # True if confidence < 0.70
 
+    @property
+    def check_failures(self) -> List[str]:
+        """Human-readable failure messages, formatted from CHECK_MESSAGES."""
+        return [
+            CHECK_MESSAGES[code].format(self.section_id, *args)
+            for code, args in self.failure_codes
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Detection patterns (mirrors text_cleaner.py — validators check AFTER cleaning)
@@ -76,6 +149,31 @@ _BRACKET_RESIDUE_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Check 6 — numbered sub-section markers "(1)", "(2)" at line start
+_SUBSECTION_NUMBER_RE = re.compile(r"^\(\d+\)", re.MULTILINE)
+
+# Literal prefilters: a residue pattern can only match if its required literal
+# occurs in the text (casefolded for the IGNORECASE patterns). Clean sections —
+# the vast majority — fail these substring tests and skip the regex scan.
+_FOOTNOTE_LITERALS = ("section",)
+_COMMENTARY_LITERALS = ("comparison", "modification", "consolidation")
+_HEADING_SEPARATORS = ("\ufffd", "\u2014", "\u2013")
+
+
+def _contains_any(text: str, literals: tuple) -> bool:
+    return any(lit in text for lit in literals)
+
+
+def _count_subsection_markers(text: str) -> int:
+    """Count "(N)" markers at line starts without materialising the matches.
+
+    Every marker needs "(" at the start of the text or right after a newline,
+    so texts with neither are answered by two substring tests.
+    """
+    if not text.startswith("(") and "\n(" not in text:
+        return 0
+    return sum(1 for _ in _SUBSECTION_NUMBER_RE.finditer(text))
+
 
 # ---------------------------------------------------------------------------
 # Main validation function
@@ -106,21 +204,19 @@ def validate_section(
     Returns:
         ExtractionReport with confidence score, failure list, review flag.
     """
-    failures: List[str] = []
+    failures: List[Tuple[int, tuple]] = []
     confidence = 1.0
     checks_run = 0
     checks_passed = 0
+    folded = legal_text.casefold() if legal_text else ""
 
     # ------------------------------------------------------------------
     # Check 1 — Footnote residue
     # ------------------------------------------------------------------
     checks_run += 1
-    if _FOOTNOTE_RESIDUE_RE.search(legal_text):
-        failures.append(
-            f"[{section_number}] Check 1 FAIL: Footnote residue found "
-            f"(line starting with digit + 'Section' + digit). "
-            f"Run remove_inline_footnotes again or re-extract from PDF."
-        )
+    if (_contains_any(folded, _FOOTNOTE_LITERALS)
+            and _FOOTNOTE_RESIDUE_RE.search(legal_text)):
+        failures.append((FOOTNOTE_RESIDUE, ()))
         confidence -= 0.31   # 0.31 ensures 1.0 - 0.31 = 0.69 < 0.70 → triggers review
     else:
         checks_passed += 1
@@ -129,12 +225,9 @@ def validate_section(
     # Check 2 — Comparison commentary residue
     # ------------------------------------------------------------------
     checks_run += 1
-    if _COMMENTARY_RESIDUE_RE.search(legal_text):
-        failures.append(
-            f"[{section_number}] Check 2 FAIL: Editorial comparison commentary found "
-            f"in legal_text (trigger phrase survived cleaning). "
-            f"This section requires re-extraction."
-        )
+    if (_contains_any(folded, _COMMENTARY_LITERALS)
+            and _COMMENTARY_RESIDUE_RE.search(legal_text)):
+        failures.append((COMMENTARY_RESIDUE, ()))
         confidence -= 0.40
     else:
         checks_passed += 1
@@ -143,16 +236,14 @@ def validate_section(
     # Check 3 — Section boundary integrity
     # ------------------------------------------------------------------
     checks_run += 1
-    first_heading = _SECTION_HEADING_IN_TEXT_RE.search(legal_text)
+    first_heading = (
+        _SECTION_HEADING_IN_TEXT_RE.search(legal_text)
+        if _contains_any(legal_text, _HEADING_SEPARATORS) else None
+    )
     if first_heading:
         found_num = first_heading.group(1)
         if found_num != section_number:
-            failures.append(
-                f"[{section_number}] Check 3 FAIL: Cross-section contamination — "
-                f"legal_text begins with section {found_num}'s content "
-                f"(expected section {section_number}). "
-                f"Discard legal_text and re-extract from PDF."
-            )
+            failures.append((CROSS_SECTION_CONTAMINATION, (found_num,)))
             confidence -= 0.40
         else:
             checks_passed += 1
@@ -163,12 +254,8 @@ def validate_section(
     # Check 4 — Bracket annotation residue
     # ------------------------------------------------------------------
     checks_run += 1
-    if _BRACKET_RESIDUE_RE.search(legal_text):
-        failures.append(
-            f"[{section_number}] Check 4 FAIL: Comparison bracket annotation found "
-            f"(e.g., '[ten years]' or '[the 1st day of April, 1974]'). "
-            f"Run remove_comparison_brackets again."
-        )
+    if "[" in legal_text and _BRACKET_RESIDUE_RE.search(legal_text):
+        failures.append((BRACKET_ANNOTATION, ()))
         confidence -= 0.20
     else:
         checks_passed += 1
@@ -179,16 +266,10 @@ def validate_section(
     checks_run += 1
     text_len = len(legal_text.strip()) if legal_text else 0
     if text_len == 0:
-        failures.append(
-            f"[{section_number}] Check 5 FAIL: legal_text is empty. "
-            f"Extraction failed entirely — extract directly from PDF."
-        )
+        failures.append((EMPTY_TEXT, ()))
         confidence -= 0.50
     elif text_len < 20:
-        failures.append(
-            f"[{section_number}] Check 5 WARN: legal_text is suspiciously short "
-            f"({text_len} characters). Verify against source PDF."
-        )
+        failures.append((SHORT_TEXT, (text_len,)))
         confidence -= 0.30
     else:
         checks_passed += 1
@@ -200,27 +281,20 @@ def validate_section(
     if has_subsections:
         # Auto-count expected sub-sections if not provided
         if expected_sub_sections == 0:
-            expected_sub_sections = len(
-                re.findall(r"^\(\d+\)", legal_text, re.MULTILINE)
-            )
+            expected_sub_sections = _count_subsection_markers(legal_text)
 
         if expected_sub_sections > 0 and sub_section_count == 0:
-            failures.append(
-                f"[{section_number}] Check 6 FAIL: has_subsections=True "
-                f"but no sub-sections were extracted "
-                f"(expected ~{expected_sub_sections})."
-            )
+            failures.append((SUBSECTIONS_MISSING, (expected_sub_sections,)))
             confidence -= 0.15
         elif expected_sub_sections > 0:
             discrepancy = (
                 abs(expected_sub_sections - sub_section_count) / expected_sub_sections
             )
             if discrepancy > 0.20:
-                failures.append(
-                    f"[{section_number}] Check 6 WARN: Sub-section count discrepancy "
-                    f"(expected ~{expected_sub_sections}, extracted {sub_section_count}, "
-                    f"discrepancy={discrepancy:.0%})."
-                )
+                failures.append((
+                    SUBSECTION_COUNT_MISMATCH,
+                    (expected_sub_sections, sub_section_count, discrepancy),
+                ))
                 confidence -= 0.15
             else:
                 checks_passed += 1
@@ -242,11 +316,7 @@ def validate_section(
         if triable_by is None:
             missing.append("triable_by")
         if missing:
-            failures.append(
-                f"[{section_number}] Check 7 WARN: Offence section missing "
-                f"classification fields: {', '.join(missing)}. "
-                f"Populate from BNSS Schedule I lookup table."
-            )
+            failures.append((MISSING_OFFENCE_FIELDS, (", ".join(missing),)))
             confidence -= 0.05 * len(missing)
         else:
             checks_passed += 1
@@ -262,7 +332,7 @@ def validate_section(
         section_id=section_number,
         checks_run=checks_run,
         checks_passed=checks_passed,
-        check_failures=failures,
+        failure_codes=failures,
         extraction_confidence=confidence,
         requires_human_review=(confidence < 0.70),
     )
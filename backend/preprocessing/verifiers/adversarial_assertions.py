@@ -19,7 +19,7 @@ Critical invariants tested:
 from __future__ import annotations
 
 import logging
-from typing import Tuple
+from typing import Any, Mapping, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,30 +28,77 @@ logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
-# Individual assertions
+# Facts query — every value the assertions inspect, in one round-trip
 # ---------------------------------------------------------------------------
 
-async def _assert_murder_snatching_separation(session: AsyncSession) -> Tuple[bool, str]:
+_ASSERTION_FACTS_SQL = text(
+    """
+    WITH sedition AS (
+        SELECT new_section, new_act FROM law_transition_mappings
+        WHERE old_act = 'IPC_1860' AND old_section = '124A'
+        LIMIT 1
+    ),
+    bns_103 AS (
+        SELECT section_title FROM sections
+        WHERE act_code = 'BNS_2023' AND section_number = '103'
+    ),
+    bns_302 AS (
+        SELECT section_title FROM sections
+        WHERE act_code = 'BNS_2023' AND section_number = '302'
+    )
+    SELECT
+        (SELECT COUNT(*) FROM law_transition_mappings
+         WHERE old_act = 'IPC_1860' AND old_section = '302'
+           AND new_act = 'BNS_2023' AND new_section = '103') AS count_302_to_103,
+        (SELECT COUNT(*) FROM law_transition_mappings
+         WHERE old_act = 'IPC_1860' AND old_section = '302'
+           AND new_act = 'BNS_2023' AND new_section = '95') AS count_302_to_95,
+        (SELECT section_title ILIKE '%murder%' FROM bns_103) AS bns_103_is_murder,
+        (SELECT section_title FROM bns_103) AS bns_103_title,
+        (SELECT section_title ILIKE '%murder%' FROM bns_302) AS bns_302_is_murder,
+        (SELECT section_title FROM bns_302) AS bns_302_title,
+        EXISTS (SELECT 1 FROM sedition) AS sedition_found,
+        (SELECT new_section FROM sedition) AS sedition_new_section,
+        (SELECT new_act FROM sedition) AS sedition_new_act,
+        (SELECT COUNT(*) FROM law_transition_mappings
+         WHERE old_act = 'IPC_1860' AND old_section = '376') AS count_376,
+        (SELECT COUNT(*) FROM law_transition_mappings
+         WHERE old_act = new_act) AS count_self_mapping,
+        (SELECT string_agg(
+                    ex.old_act || ':' || ex.old_section || '->'
+                    || COALESCE(ex.new_section, 'None'), ', ')
+         FROM (SELECT old_act, old_section, new_section
+               FROM law_transition_mappings
+               WHERE old_act = new_act LIMIT 5) AS ex) AS self_mapping_examples,
+        (SELECT COUNT(*) FROM law_transition_mappings
+         WHERE transition_type = 'equivalent' AND new_section IS NULL)
+            AS count_null_equivalent
+    """
+)
+
+
+async def _fetch_assertion_facts(session: AsyncSession) -> Mapping[str, Any]:
+    """Fetch every value the five assertions check in a single query."""
+    result = await session.execute(_ASSERTION_FACTS_SQL)
+    return result.mappings().one()
+
+
+# ---------------------------------------------------------------------------
+# Individual assertions (pure — evaluated against the fetched facts)
+# ---------------------------------------------------------------------------
+
+def _assert_murder_snatching_separation(facts: Mapping[str, Any]) -> Tuple[bool, str]:
     """Assertion 1: IPC 302 must map to BNS 103, and BNS 103 must be Murder.
 
     BNS 302 is Religious Offences (previously Snatching in draft numbering).
     Confusing these two is the single most dangerous mapping error in this system.
 
-    Uses EXISTS check (not ORDER BY LIMIT 1) to avoid false failures when
+    Uses an existence count (not ORDER BY LIMIT 1) to avoid false failures when
     multiple rows exist for old_section='302' — we only require that the
     correct mapping to BNS 103 is present, regardless of row ordering.
     """
     # Check that the correct mapping IPC 302 → BNS 103 EXISTS
-    row = await session.execute(
-        text(
-            "SELECT COUNT(*) FROM law_transition_mappings "
-            "WHERE old_act = 'IPC_1860' AND old_section = '302' "
-            "AND new_act = 'BNS_2023' AND new_section = '103'"
-        )
-    )
-    count_103 = row.scalar_one()
-
-    if count_103 == 0:
+    if facts["count_302_to_103"] == 0:
         return False, (
             "CRITICAL: IPC 302 does not correctly map to BNS 103. "
             "No mapping row found for old_section='302' → new_section='103'. "
@@ -61,15 +108,7 @@ async def _assert_murder_snatching_separation(session: AsyncSession) -> Tuple[bo
 
     # Also confirm BNS 95 is NOT incorrectly mapped to IPC 302
     # (would indicate the _BLOCKED_OLD_SECTIONS fix did not apply)
-    row2 = await session.execute(
-        text(
-            "SELECT COUNT(*) FROM law_transition_mappings "
-            "WHERE old_act = 'IPC_1860' AND old_section = '302' "
-            "AND new_act = 'BNS_2023' AND new_section = '95'"
-        )
-    )
-    count_95 = row2.scalar_one()
-    if count_95 > 0:
+    if facts["count_302_to_95"] > 0:
         return False, (
             "CRITICAL: IPC 302 is incorrectly mapped to BNS 95 "
             "(Hiring a Child to Commit an Offence). "
@@ -77,36 +116,20 @@ async def _assert_murder_snatching_separation(session: AsyncSession) -> Tuple[bo
             "This is JSON noise — check _BLOCKED_OLD_SECTIONS in json_enricher.py."
         )
 
-    # Verify BNS 103 title contains 'murder'
-    title_row = await session.execute(
-        text(
-            "SELECT section_title FROM sections "
-            "WHERE act_code = 'BNS_2023' AND section_number = '103'"
-        )
-    )
-    bns_103_title = title_row.scalar_one_or_none()
-
-    if bns_103_title is None or "murder" not in bns_103_title.lower():
+    # Verify BNS 103 title contains 'murder' (NULL if the section is missing)
+    if not facts["bns_103_is_murder"]:
         return False, (
             "CRITICAL: BNS 103 title does not contain 'murder'. "
-            f"Got title = {bns_103_title!r}. "
+            f"Got title = {facts['bns_103_title']!r}. "
             "IPC 302 (Murder) must map to BNS 103 (Murder). "
             "DO NOT PROCEED until this is fixed."
         )
 
     # Verify BNS 302 title does NOT contain 'murder'
-    title_row2 = await session.execute(
-        text(
-            "SELECT section_title FROM sections "
-            "WHERE act_code = 'BNS_2023' AND section_number = '302'"
-        )
-    )
-    bns_302_title = title_row2.scalar_one_or_none()
-
-    if bns_302_title is not None and "murder" in bns_302_title.lower():
+    if facts["bns_302_is_murder"]:
         return False, (
             "CRITICAL: BNS 302 title contains 'murder' — this is wrong. "
-            f"Got title = {bns_302_title!r}. "
+            f"Got title = {facts['bns_302_title']!r}. "
             "BNS 302 should be Religious Offences, not Murder. "
             "DO NOT PROCEED until this is fixed."
         )
@@ -115,29 +138,21 @@ async def _assert_murder_snatching_separation(session: AsyncSession) -> Tuple[bo
     return True, "Assertion 1 PASSED: murder/snatching separation verified"
 
 
-async def _assert_sedition_replacement(session: AsyncSession) -> Tuple[bool, str]:
+def _assert_sedition_replacement(facts: Mapping[str, Any]) -> Tuple[bool, str]:
     """Assertion 2: IPC 124A (Sedition) must map to BNS 152.
 
     BNS 152 replaced the sedition provision under the new Sanhita.
     IPC 124A was seeded manually in the enricher because replaces_ipc was empty.
     """
-    row = await session.execute(
-        text(
-            "SELECT new_section, new_act FROM law_transition_mappings "
-            "WHERE old_act = 'IPC_1860' AND old_section = '124A' "
-            "LIMIT 1"
-        )
-    )
-    result = row.fetchone()
-
-    if result is None:
+    if not facts["sedition_found"]:
         return False, (
             "CRITICAL: IPC 124A (Sedition) has NO mapping in law_transition_mappings. "
             "This row should have been seeded manually in the enricher. "
             "Check json_enricher.py for the IPC 124A -> BNS 152 manual seed."
         )
 
-    new_section, new_act = result
+    new_section = facts["sedition_new_section"]
+    new_act = facts["sedition_new_act"]
     if new_act != "BNS_2023" or new_section != "152":
         return False, (
             f"CRITICAL: IPC 124A (Sedition) does not map to BNS 152. "
@@ -149,7 +164,7 @@ async def _assert_sedition_replacement(session: AsyncSession) -> Tuple[bool, str
     return True, "Assertion 2 PASSED: sedition replacement verified"
 
 
-async def _assert_rape_is_split(session: AsyncSession) -> Tuple[bool, str]:
+def _assert_rape_is_split(facts: Mapping[str, Any]) -> Tuple[bool, str]:
     """Assertion 3: IPC 376 (Rape) must map to at least 2 BNS sections.
 
     The JSON has replaces_ipc=['376(1)'] on BNS 64 and replaces_ipc=['376(2)']
@@ -157,13 +172,7 @@ async def _assert_rape_is_split(session: AsyncSession) -> Tuple[bool, str]:
     2 rows in law_transition_mappings with old_section='376' (BNS 64 + BNS 65).
     Count >= 2 confirms the split was detected and stored correctly.
     """
-    row = await session.execute(
-        text(
-            "SELECT COUNT(*) FROM law_transition_mappings "
-            "WHERE old_act = 'IPC_1860' AND old_section = '376'"
-        )
-    )
-    count = row.scalar_one()
+    count = facts["count_376"]
 
     if count < 2:
         return False, (
@@ -177,30 +186,17 @@ async def _assert_rape_is_split(session: AsyncSession) -> Tuple[bool, str]:
     return True, f"Assertion 3 PASSED: IPC 376 split into {count} mappings (old_section='376')"
 
 
-async def _assert_no_self_mapping(session: AsyncSession) -> Tuple[bool, str]:
+def _assert_no_self_mapping(facts: Mapping[str, Any]) -> Tuple[bool, str]:
     """Assertion 4: No mapping should point from an act to itself.
 
     old_act == new_act is a data corruption signal — transitions only go
     between old acts (IPC/CrPC/IEA) and new acts (BNS/BNSS/BSA).
     """
-    row = await session.execute(
-        text(
-            "SELECT COUNT(*) FROM law_transition_mappings "
-            "WHERE old_act = new_act"
-        )
-    )
-    count = row.scalar_one()
+    count = facts["count_self_mapping"]
 
     if count > 0:
-        # Get examples for diagnostics
-        examples = await session.execute(
-            text(
-                "SELECT old_act, old_section, new_section FROM law_transition_mappings "
-                "WHERE old_act = new_act LIMIT 5"
-            )
-        )
-        ex_rows = examples.fetchall()
-        ex_str = ", ".join(f"{r[0]}:{r[1]}->{r[2]}" for r in ex_rows)
+        # Examples for diagnostics (up to 5, aggregated by the facts query)
+        ex_str = facts["self_mapping_examples"] or ""
         return False, (
             f"A mapping points from an act to itself. Data corruption. "
             f"Count: {count}. Examples: {ex_str}"
@@ -210,19 +206,13 @@ async def _assert_no_self_mapping(session: AsyncSession) -> Tuple[bool, str]:
     return True, "Assertion 4 PASSED: no self-mapping"
 
 
-async def _assert_no_null_equivalent_sections(session: AsyncSession) -> Tuple[bool, str]:
+def _assert_no_null_equivalent_sections(facts: Mapping[str, Any]) -> Tuple[bool, str]:
     """Assertion 5: Equivalent mappings cannot have null new_section.
 
     transition_type='equivalent' means a direct renaming — the new section
     is always known. A null new_section here indicates a parsing failure.
     """
-    row = await session.execute(
-        text(
-            "SELECT COUNT(*) FROM law_transition_mappings "
-            "WHERE transition_type = 'equivalent' AND new_section IS NULL"
-        )
-    )
-    count = row.scalar_one()
+    count = facts["count_null_equivalent"]
 
     if count > 0:
         return False, (
@@ -241,6 +231,9 @@ async def _assert_no_null_equivalent_sections(session: AsyncSession) -> Tuple[bo
 async def run_all_assertions(session: AsyncSession) -> bool:
     """Run all 5 adversarial safety assertions.
 
+    All facts are fetched with one query; the assertions are then evaluated
+    in Python, in order, stopping at the first failure.
+
     Args:
         session: Active AsyncSession (read-only — no writes performed here).
 
@@ -258,9 +251,11 @@ async def run_all_assertions(session: AsyncSession) -> bool:
         ("no_null_equivalent_sections",    _assert_no_null_equivalent_sections),
     ]
 
+    facts = await _fetch_assertion_facts(session)
+
     passed = 0
     for name, fn in assertions:
-        ok, message = await fn(session)
+        ok, message = fn(facts)
         if ok:
             passed += 1
             print(f"  [{passed}/5] {message}")
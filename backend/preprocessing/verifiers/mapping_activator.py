@@ -29,20 +29,27 @@ BGE-M3 SIMILARITY STEP:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
-import math
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.preprocessing.verifiers.adversarial_assertions import run_all_assertions
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -69,13 +76,100 @@ _TIER_CONFIG = {
     "split_into":  (0.82, "bprd_split_provision"),
 }
 
+# transition_type → index into the tier tallies (Tier 1 = index 0)
+_TYPE_TO_TIER = {
+    "equivalent":  0,
+    "same":        0,
+    "modified":    1,
+    "merged_from": 1,
+    "new":         2,
+    "deleted":     3,
+    "split_into":  4,
+}
+
 # Tier 2 types get a note appended to transition_note
 _TIER_2_TYPES = {"modified", "merged_from"}
+_TIER_2_NOTE_SUFFIX = "[Substance modified \u2014 see change_summary for details]"
+
+
+def _build_bulk_activation_sql():
+    """One UPDATE activating every inactive mapping of a known type.
+
+    The tier table is joined in as a VALUES list built from _TIER_CONFIG, so
+    each row's confidence / approved_by / note rule is resolved server-side.
+    Tier 2 rows get _TIER_2_NOTE_SUFFIX appended unless already present;
+    empty notes are stored as NULL. Rows of unknown type are left inactive.
+    """
+    rows = []
+    params: Dict[str, object] = {"suffix": _TIER_2_NOTE_SUFFIX}
+    for i, (transition_type, (confidence, approved_by)) in enumerate(_TIER_CONFIG.items()):
+        rows.append(
+            f"(CAST(:type_{i} AS TEXT), CAST(:conf_{i} AS DOUBLE PRECISION), "
+            f"CAST(:approved_by_{i} AS TEXT), CAST(:tier2_{i} AS BOOLEAN))"
+        )
+        params[f"type_{i}"] = transition_type
+        params[f"conf_{i}"] = confidence
+        params[f"approved_by_{i}"] = approved_by
+        params[f"tier2_{i}"] = transition_type in _TIER_2_TYPES
+
+    statement = text(
+        "UPDATE law_transition_mappings AS m "
+        "SET is_active = TRUE, "
+        "    confidence_score = t.conf, "
+        "    approved_by = t.approved_by, "
+        "    approved_at = NOW(), "
+        "    transition_note = CASE "
+        "        WHEN t.is_tier2 AND strpos(COALESCE(m.transition_note, ''), :suffix) = 0 "
+        "        THEN COALESCE(ltrim(NULLIF(m.transition_note, '') || ' ' || :suffix), :suffix) "
+        "        ELSE NULLIF(m.transition_note, '') "
+        "    END "
+        f"FROM (VALUES {', '.join(rows)}) AS t(transition_type, conf, approved_by, is_tier2) "
+        "WHERE m.transition_type = t.transition_type "
+        "  AND m.is_active = FALSE"
+    )
+    return statement, params
+
+
+_BULK_ACTIVATION_SQL, _BULK_ACTIVATION_PARAMS = _build_bulk_activation_sql()
+
+# Same rows and columns as the active_mapping_texts materialized view
+# (migration 005), for databases where the view has not been created
+_ACTIVE_MAPPING_TEXTS_JOIN = """(
+    SELECT
+        m.old_act,
+        m.old_section,
+        m.new_section,
+        m.transition_type,
+        s_old.section_title AS old_title,
+        s_old.legal_text    AS old_text,
+        s_new.section_title AS new_title,
+        s_new.legal_text    AS new_text
+    FROM law_transition_mappings m
+    LEFT JOIN sections s_old
+      ON s_old.act_code = m.old_act
+     AND s_old.section_number = m.old_section
+    LEFT JOIN sections s_new
+      ON s_new.act_code = m.new_act
+     AND s_new.section_number = m.new_section
+    WHERE m.is_active = TRUE
+) AS active_mapping_texts"""
 
 # Similarity thresholds (BGE-M3 step)
 _LOW_SIMILARITY_EQUIVALENT = 0.40   # Flag if equivalent similarity < this
 _HIGH_SIMILARITY_MODIFIED  = 0.95   # Flag if modified similarity > this
 
+# Mapping pairs per BGE-M3 call; both sides are encoded together, so each
+# forward pass sees twice this many texts. Lower it if the GPU runs out of memory.
+_SIMILARITY_BATCH_PAIRS = int(os.getenv("SIMILARITY_BATCH_PAIRS", "32"))
+
+# Row batches fetched ahead of the batch being encoded
+_SIMILARITY_PREFETCH_BATCHES = 2
+
+# Dense vectors kept per run, keyed by a hash of the encoded text. The same
+# section text recurs across split/merged mappings; the whole section corpus
+# is a few thousand texts, so this bound is rarely reached (~4 KB per entry).
+_EMBED_CACHE_SIZE = 10_000
+
 
 # ---------------------------------------------------------------------------
 # Report dataclasses
@@ -120,14 +214,56 @@ class SimilarityFlag:
 # Cosine similarity helper
 # ---------------------------------------------------------------------------
 
-def _cosine_similarity(a: List[float], b: List[float]) -> float:
-    """Pure-Python cosine similarity (no numpy required for this step)."""
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(y * y for y in b))
-    if norm_a == 0.0 or norm_b == 0.0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+def _unit_rows(x: "np.ndarray") -> "np.ndarray":
+    """L2-normalise each row of a (B, D) array (zero rows stay zero).
+
+    BGE-M3 already returns unit dense vectors, so this is normally a no-op
+    rescale; it makes the cosine below a plain row-wise dot product.
+    numpy comes with FlagEmbedding, which this step already requires.
+    """
+    import numpy as np
+
+    x = np.array(x, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    x /= np.maximum(norms, 1e-12)
+    return x
+
+
+def _encode_unit(model, texts: List[str]) -> "np.ndarray":
+    """Dense-encode texts in one BGE-M3 forward pass; returns unit rows."""
+    return _unit_rows(model.encode(
+        texts,
+        batch_size=len(texts),
+        return_dense=True, return_sparse=False, return_colbert_vecs=False,
+    )["dense_vecs"])
+
+
+def _batch_cosine_similarity(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Row-wise cosine similarity of two (B, D) arrays of unit rows."""
+    import numpy as np
+
+    return np.einsum("ij,ij->i", a, b)
+
+
+# ---------------------------------------------------------------------------
+# Report writing
+# ---------------------------------------------------------------------------
+
+def _dump_json(data) -> bytes:
+    """Serialise to indented UTF-8 JSON (orjson if installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write JSON to a sibling temp file, then swap it into place.
+
+    Readers never see a half-written report if the run dies mid-write.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(_dump_json(data))
+    os.replace(tmp, path)
 
 
 # ---------------------------------------------------------------------------
@@ -147,6 +283,7 @@ class MappingActivator:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
         self._report = ActivationReport()
+        self._embed_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
 
     # -----------------------------------------------------------------------
     # Public entry point
@@ -180,8 +317,12 @@ class MappingActivator:
         # Step 2 — Tier-based activation
         await self._run_tier_activation()
 
+        # Refresh the precomputed mapping/section join so Step 3 sees the
+        # rows just activated
+        has_view = await self._refresh_materialized_views()
+
         # Step 3 — BGE-M3 similarity validation (skipped if not available)
-        similarity_flags = await self._run_similarity_validation()
+        similarity_flags = await self._run_similarity_validation(has_view)
         self._report.similarity_flags = len(similarity_flags)
 
         if similarity_flags:
@@ -201,73 +342,50 @@ class MappingActivator:
     # -----------------------------------------------------------------------
 
     async def _run_tier_activation(self) -> None:
-        """Fetch all inactive mappings and activate by tier."""
+        """Tally inactive mappings by tier, then activate them in one UPDATE."""
+
+        # The activation transaction's commit need not wait for the WAL
+        # flush. SET LOCAL ends with the transaction. A database crash in
+        # the short window after COMMIT can lose the activation, never
+        # corrupt it — and re-running the pipeline simply activates the
+        # still-inactive rows again.
+        await self._session.execute(text("SET LOCAL synchronous_commit = off"))
 
+        # Counted before the UPDATE — afterwards the activated rows can no
+        # longer be told apart from previously active ones.
         rows = await self._session.execute(
             text(
-                "SELECT id, transition_type, transition_note "
+                "SELECT transition_type, COUNT(*) "
                 "FROM law_transition_mappings "
                 "WHERE is_active = FALSE "
-                "ORDER BY transition_type, id"
+                "GROUP BY transition_type"
             )
         )
-        all_rows = rows.fetchall()
-        self._report.total_mappings_processed = len(all_rows)
+        counts: Dict[str, int] = {t: n for t, n in rows.fetchall()}
+        self._report.total_mappings_processed = sum(counts.values())
 
         approved_by_dist: Dict[str, int] = {}
-        tier1 = tier2 = tier3 = tier4 = tier5 = skipped = 0
+        tiers = [0] * 5
+        skipped = 0
 
-        for row_id, transition_type, transition_note in all_rows:
-            config = _TIER_CONFIG.get(transition_type)
-            if config is None:
+        for transition_type, count in counts.items():
+            tier = _TYPE_TO_TIER.get(transition_type)
+            if tier is None:
                 logger.warning(
-                    "Unknown transition_type '%s' for mapping id=%s — skipping",
-                    transition_type, row_id,
+                    "Unknown transition_type '%s' for %d mapping(s) — skipping",
+                    transition_type, count,
                 )
-                skipped += 1
+                skipped += count
                 continue
 
-            confidence, approved_by = config
-
-            # Build the note suffix for Tier 2 types
-            new_note = transition_note or ""
-            if transition_type in _TIER_2_TYPES:
-                suffix = "[Substance modified \u2014 see change_summary for details]"
-                if suffix not in new_note:
-                    new_note = (new_note + " " + suffix).strip() if new_note else suffix
-
-            await self._session.execute(
-                text(
-                    "UPDATE law_transition_mappings "
-                    "SET is_active = TRUE, "
-                    "    confidence_score = :conf, "
-                    "    approved_by = :approved_by, "
-                    "    approved_at = NOW(), "
-                    "    transition_note = :note "
-                    "WHERE id = :row_id"
-                ),
-                {
-                    "conf": confidence,
-                    "approved_by": approved_by,
-                    "note": new_note if new_note else None,
-                    "row_id": row_id,
-                },
-            )
-
-            # Tally by tier
-            if transition_type in ("equivalent", "same"):
-                tier1 += 1
-            elif transition_type in ("modified", "merged_from"):
-                tier2 += 1
-            elif transition_type == "new":
-                tier3 += 1
-            elif transition_type == "deleted":
-                tier4 += 1
-            elif transition_type == "split_into":
-                tier5 += 1
+            tiers[tier] += count
+            _, approved_by = _TIER_CONFIG[transition_type]
+            approved_by_dist[approved_by] = approved_by_dist.get(approved_by, 0) + count
 
-            approved_by_dist[approved_by] = approved_by_dist.get(approved_by, 0) + 1
+        # Single set-based UPDATE instead of one round-trip per mapping
+        await self._session.execute(_BULK_ACTIVATION_SQL, _BULK_ACTIVATION_PARAMS)
 
+        tier1, tier2, tier3, tier4, tier5 = tiers
         self._report.tier_1_activated = tier1
         self._report.tier_2_activated = tier2
         self._report.tier_3_activated = tier3
@@ -286,13 +404,44 @@ class MappingActivator:
             print(f"  Skipped (unknown type)......................................... {skipped} mappings")
         print()
 
+    async def _refresh_materialized_views(self) -> bool:
+        """Refresh active_mapping_texts (migration 005) after activation.
+
+        CONCURRENTLY keeps the view readable by other sessions during the
+        refresh; it relies on the view's unique index on id. Development
+        schemas built with Base.metadata.create_all() have no view — the
+        refresh is skipped there rather than failing the activation.
+
+        Returns:
+            True if the view exists (and was refreshed).
+        """
+        exists = await self._session.execute(
+            text("SELECT to_regclass('active_mapping_texts') IS NOT NULL")
+        )
+        if not exists.scalar_one():
+            logger.info(
+                "Materialized view active_mapping_texts not found (migration 005 "
+                "not applied) — similarity step will join sections directly"
+            )
+            return False
+
+        await self._session.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY active_mapping_texts")
+        )
+        logger.info("Refreshed materialized view active_mapping_texts")
+        return True
+
     # -----------------------------------------------------------------------
     # Step 3: BGE-M3 similarity validation
     # -----------------------------------------------------------------------
 
-    async def _run_similarity_validation(self) -> List[SimilarityFlag]:
+    async def _run_similarity_validation(self, has_view: bool) -> List[SimilarityFlag]:
         """Run BGE-M3 semantic similarity on equivalent/modified active mappings.
 
+        Args:
+            has_view: Read from the active_mapping_texts view; otherwise
+                      join law_transition_mappings to sections in the query.
+
         Returns list of SimilarityFlag objects. Returns empty list if BGE-M3
         is not available (graceful skip).
         """
@@ -319,81 +468,69 @@ class MappingActivator:
             print(f"  BGE-M3 load failed ({exc}) — similarity validation skipped.")
             return []
 
-        # Fetch equivalent and modified active mappings that have legal_text in both sides
-        rows = await self._session.execute(
+        # Stream equivalent and modified active mappings that have legal_text
+        # in both sides, one batch of rows at a time from a server-side cursor
+        batch_size = _SIMILARITY_BATCH_PAIRS
+        source = "active_mapping_texts" if has_view else _ACTIVE_MAPPING_TEXTS_JOIN
+        rows = await self._session.stream(
             text(
-                """
+                f"""
                 SELECT
-                    m.old_act,
-                    m.old_section,
-                    s_old.section_title AS old_title,
-                    s_old.legal_text    AS old_text,
-                    m.new_section,
-                    s_new.section_title AS new_title,
-                    s_new.legal_text    AS new_text,
-                    m.transition_type
-                FROM law_transition_mappings m
-                JOIN sections s_old
-                  ON s_old.act_code = m.old_act
-                 AND s_old.section_number = m.old_section
-                JOIN sections s_new
-                  ON s_new.act_code = m.new_act
-                 AND s_new.section_number = m.new_section
-                WHERE m.is_active = TRUE
-                  AND m.transition_type IN ('equivalent', 'modified')
-                  AND s_old.legal_text IS NOT NULL
-                  AND s_new.legal_text IS NOT NULL
-                  AND m.new_section IS NOT NULL
-                ORDER BY m.old_section
+                    old_act,
+                    old_section,
+                    old_title,
+                    LEFT(old_text, 2000) AS old_text,
+                    new_section,
+                    new_title,
+                    LEFT(new_text, 2000) AS new_text,
+                    transition_type,
+                    LEFT(old_text, 100)  AS old_preview,
+                    LEFT(new_text, 100)  AS new_preview
+                FROM {source}
+                WHERE transition_type IN ('equivalent', 'modified')
+                  AND old_text IS NOT NULL
+                  AND new_text IS NOT NULL
+                  AND new_section IS NOT NULL
+                  -- identical encoder inputs score 1.0, which can never flag
+                  -- an equivalent mapping: leave those pairs out entirely
+                  AND NOT (
+                      transition_type = 'equivalent'
+                      AND LEFT(old_text, 2000) = LEFT(new_text, 2000)
+                  )
+                ORDER BY old_section
                 """
-            )
+            ).execution_options(yield_per=batch_size)
         )
-        mapping_rows = rows.fetchall()
 
-        if not mapping_rows:
-            print("  BGE-M3 similarity validation: 0 eligible mappings found.")
-            return []
+        # The next row batches are fetched while the current one is encoded
+        # on a worker thread (the encode releases the GIL).
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_SIMILARITY_PREFETCH_BATCHES)
 
-        flags: List[SimilarityFlag] = []
-        batch_size = 32
-
-        for batch_start in range(0, len(mapping_rows), batch_size):
-            batch = mapping_rows[batch_start : batch_start + batch_size]
-            old_texts = [r[3][:2000] for r in batch]   # cap at 2000 chars for speed
-            new_texts = [r[6][:2000] for r in batch]
-
-            old_embeddings = model.encode(
-                old_texts, return_dense=True, return_sparse=False, return_colbert_vecs=False
-            )["dense_vecs"]
-            new_embeddings = model.encode(
-                new_texts, return_dense=True, return_sparse=False, return_colbert_vecs=False
-            )["dense_vecs"]
-
-            for i, row in enumerate(batch):
-                old_act, old_sec, old_title, old_text, new_sec, new_title, new_text, t_type = row
-                sim = _cosine_similarity(
-                    list(old_embeddings[i]), list(new_embeddings[i])
-                )
+        async def _produce() -> None:
+            try:
+                async for partition in rows.partitions(batch_size):
+                    await queue.put(partition)
+            except Exception as exc:
+                await queue.put(exc)
+            else:
+                await queue.put(None)
 
-                flag_reason: Optional[str] = None
-                if t_type == "equivalent" and sim < _LOW_SIMILARITY_EQUIVALENT:
-                    flag_reason = f"similarity {sim:.4f} < {_LOW_SIMILARITY_EQUIVALENT} for equivalent mapping"
-                elif t_type == "modified" and sim > _HIGH_SIMILARITY_MODIFIED:
-                    flag_reason = f"similarity {sim:.4f} > {_HIGH_SIMILARITY_MODIFIED} for modified mapping"
-
-                if flag_reason:
-                    flags.append(SimilarityFlag(
-                        old_act=old_act,
-                        old_section=old_sec,
-                        old_section_title=old_title or "",
-                        new_section=new_sec,
-                        new_section_title=new_title or "",
-                        transition_type=t_type,
-                        similarity_score=round(sim, 6),
-                        flag_reason=flag_reason,
-                        old_text_preview=(old_text or "")[:100],
-                        new_text_preview=(new_text or "")[:100],
-                    ))
+        flags: List[SimilarityFlag] = []
+        eligible = 0
+        producer = asyncio.create_task(_produce())
+        try:
+            while (batch := await queue.get()) is not None:
+                if isinstance(batch, Exception):
+                    raise batch
+                eligible += len(batch)
+                flags.extend(await self._flag_batch(model, batch))
+        finally:
+            if not producer.done():
+                producer.cancel()
+
+        if not eligible:
+            print("  BGE-M3 similarity validation: 0 eligible mappings found.")
+            return []
 
         print(
             f"  BGE-M3 similarity validation: {len(flags)} flags written to "
@@ -402,6 +539,87 @@ class MappingActivator:
         logger.info("Similarity validation complete: %d flags", len(flags))
         return flags
 
+    async def _encode_cached(self, model, texts: List[str]) -> "np.ndarray":
+        """Unit dense vectors for texts, encoding only those not seen this run.
+
+        Misses are de-duplicated and encoded together in one forward pass on
+        a worker thread; results are then scattered back into input order.
+        """
+        import numpy as np
+
+        cache = self._embed_cache
+        keys = [
+            hashlib.blake2b(t.encode("utf-8"), digest_size=16).digest() for t in texts
+        ]
+        misses: Dict[bytes, str] = {}
+        for key, t in zip(keys, texts):
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                misses.setdefault(key, t)
+
+        if misses:
+            encoded = await asyncio.to_thread(_encode_unit, model, list(misses.values()))
+            for key, vec in zip(misses, encoded):
+                cache[key] = vec
+        # Assemble before evicting, so this batch's own vectors are present
+        out = np.stack([cache[key] for key in keys])
+        while len(cache) > _EMBED_CACHE_SIZE:
+            cache.popitem(last=False)
+        return out
+
+    async def _flag_batch(self, model, batch: list) -> List[SimilarityFlag]:
+        """Encode one batch of mapping rows and return the flags it raises."""
+        import numpy as np
+
+        # Texts arrive capped at 2000 chars (LEFT() in the query) for speed
+        old_texts = [r.old_text for r in batch]
+        new_texts = [r.new_text for r in batch]
+
+        # Identical encoder inputs score exactly 1.0; only the other pairs are
+        # encoded, both sides in one forward pass
+        sims = np.ones(len(batch), dtype=np.float32)
+        todo = [i for i, (o, n) in enumerate(zip(old_texts, new_texts)) if o != n]
+        if todo:
+            embeddings = await self._encode_cached(
+                model, [old_texts[i] for i in todo] + [new_texts[i] for i in todo],
+            )
+            sims[todo] = _batch_cosine_similarity(
+                embeddings[:len(todo)], embeddings[len(todo):],
+            )
+
+        # Select the (few) flagged rows with array masks; only those are
+        # turned into Python objects.
+        t_types = np.array([r.transition_type for r in batch])
+        is_equivalent = t_types == "equivalent"
+        low = is_equivalent & (sims < _LOW_SIMILARITY_EQUIVALENT)
+        high = (t_types == "modified") & (sims > _HIGH_SIMILARITY_MODIFIED)
+
+        flags: List[SimilarityFlag] = []
+        for i in np.flatnonzero(low | high).tolist():
+            row = batch[i]
+            sim = float(sims[i])
+
+            if is_equivalent[i]:
+                flag_reason = f"similarity {sim:.4f} < {_LOW_SIMILARITY_EQUIVALENT} for equivalent mapping"
+            else:
+                flag_reason = f"similarity {sim:.4f} > {_HIGH_SIMILARITY_MODIFIED} for modified mapping"
+
+            flags.append(SimilarityFlag(
+                old_act=row.old_act,
+                old_section=row.old_section,
+                old_section_title=row.old_title or "",
+                new_section=row.new_section,
+                new_section_title=row.new_title or "",
+                transition_type=row.transition_type,
+                similarity_score=round(sim, 6),
+                flag_reason=flag_reason,
+                old_text_preview=row.old_preview or "",
+                new_text_preview=row.new_preview or "",
+            ))
+
+        return flags
+
     # -----------------------------------------------------------------------
     # Step 4: Write reports
     # -----------------------------------------------------------------------
@@ -413,16 +631,14 @@ class MappingActivator:
         report_dict.pop("skipped_unknown_type", None)
         report_dict.pop("errors", None)
 
-        with open(_ACTIVATION_REPORT_PATH, "w", encoding="utf-8") as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(_ACTIVATION_REPORT_PATH, report_dict)
 
         logger.info("Activation report written to %s", _ACTIVATION_REPORT_PATH)
 
     def _write_similarity_flags(self, flags: List[SimilarityFlag]) -> None:
         """Write similarity_flags.json to data/audit/."""
         flags_data = [asdict(f) for f in flags]
-        with open(_SIMILARITY_FLAGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(flags_data, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(_SIMILARITY_FLAGS_PATH, flags_data)
 
         logger.info(
             "Similarity flags written to %s (%d entries)",
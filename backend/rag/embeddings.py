@@ -21,10 +21,14 @@ The module will raise ImportError with a clear message if it is not available.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +38,39 @@ logger = logging.getLogger(__name__)
 
 DOCUMENT_PREFIX = "Represent this Indian legal provision for retrieval: "
 
+# ---------------------------------------------------------------------------
+# Batching limits
+# ---------------------------------------------------------------------------
+
+# Padded tokens per forward pass (items x longest item). Bounds activation
+# memory directly instead of through a fixed item count. Lower on small GPUs.
+TOKEN_BUDGET = int(os.getenv("BGE_M3_TOKEN_BUDGET", "16384"))
+
+# BGE-M3 truncates at 8192 tokens; ~4 characters per XLM-R token is close
+# enough to estimate padded length without tokenizing twice
+MAX_TOKENS = 8192
+_CHARS_PER_TOKEN = 4
+
+# Longer texts are encoded as overlapping windows of this many tokens and
+# pooled (see iter_encode_batch). The default keeps whole-text encoding;
+# lowering it changes stored vectors, so re-index every collection after.
+MAX_LENGTH = min(int(os.getenv("BGE_M3_MAX_LENGTH", str(MAX_TOKENS))), MAX_TOKENS)
+WINDOW_OVERLAP_TOKENS = 128
+
+# Concurrent aencode_batch() calls allowed into the model. More than a
+# couple only contend for the same GPU.
+ENCODE_CONCURRENCY = int(os.getenv("BGE_M3_CONCURRENCY", "2"))
+
+# Encoded document texts kept for reuse by iter_encode_batch(); 0 disables.
+# Dense vectors are cached as the model returned them (~4KB as float32, plus
+# the sparse weights), so a cache hit yields exactly the vector a miss would.
+# Off by default: only corpora with repeated boilerplate (statutes) gain;
+# unique judgment chunks would just fill it.
+ENCODE_CACHE_SIZE = int(os.getenv("BGE_M3_CACHE_SIZE", "0"))
+
+# torch.compile the backbone at load (slow first batches per new shape).
+TORCH_COMPILE = os.getenv("BGE_M3_TORCH_COMPILE", "0") == "1"
+
 
 # ---------------------------------------------------------------------------
 # BGEM3Embedder
@@ -50,7 +87,9 @@ class BGEM3Embedder:
     several seconds and allocates significant GPU/CPU memory.
 
     Sparse vector format returned by encode_sparse / encode_batch:
-        List[Dict[int, float]] — token_id -> weight mapping.
+        List[Dict[int, float]] — token_id -> weight mapping. These are
+        FlagEmbedding's own dicts (token IDs as numeric strings), returned
+        without copying; treat them as read-only.
         Call sparse_dict_to_qdrant(sparse) to convert for Qdrant upload.
     """
 
@@ -58,6 +97,9 @@ class BGEM3Embedder:
         self,
         model_path: Optional[str] = None,
         use_fp16: bool = True,
+        cpu_int8: bool = False,
+        warmup: bool = False,
+        cache_size: Optional[int] = None,
     ) -> None:
         """Load the BGE-M3 model.
 
@@ -65,7 +107,21 @@ class BGEM3Embedder:
             model_path: HuggingFace model ID or local path.
                         Defaults to BGE_M3_MODEL_PATH env var or 'BAAI/bge-m3'.
             use_fp16:   Use FP16 for faster GPU inference. Falls back to FP32
-                        on CPU automatically.
+                        on CPU automatically, and on pre-Volta GPUs (compute
+                        capability < 7.0) where FP16 has no tensor cores.
+            cpu_int8:   When no GPU is available, apply PyTorch dynamic INT8
+                        quantization to the model's Linear layers (~2-3x
+                        faster CPU inference, tiny embedding drift). Ignored
+                        on GPU. Off by default so query and index vectors
+                        come from the same precision unless opted in.
+            warmup:     On GPU, run one worst-case batch (TOKEN_BUDGET padded
+                        tokens) at load so the CUDA caching allocator reserves
+                        peak activation memory, and a torch.compile'd backbone
+                        (BGE_M3_TORCH_COMPILE=1) compiles, before real batches
+                        arrive. Off by default; only long-running batch
+                        loaders (indexing, judgment ingestion) opt in.
+            cache_size: Encoded texts kept for reuse by iter_encode_batch().
+                        Defaults to ENCODE_CACHE_SIZE (BGE_M3_CACHE_SIZE, 0 = off).
 
         Raises:
             ImportError: If FlagEmbedding is not installed.
@@ -79,6 +135,14 @@ class BGEM3Embedder:
                 "BGE-M3 is non-negotiable for this system — do not substitute."
             ) from exc
 
+        # Must be set before CUDA initialises; growing segments in place
+        # avoids fragmentation as batch shapes vary between calls
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+        if use_fp16 and not _has_fp16_tensor_cores():
+            logger.info("bgem3_fp16_disabled: GPU predates tensor cores — using FP32")
+            use_fp16 = False
+
         resolved_path = model_path or os.getenv("BGE_M3_MODEL_PATH", "BAAI/bge-m3")
         logger.info("bgem3_loading: model=%s use_fp16=%s", resolved_path, use_fp16)
 
@@ -89,6 +153,78 @@ class BGEM3Embedder:
         logger.info("bgem3_loaded: model=%s elapsed_s=%.2f", resolved_path, elapsed)
         self._model_path = resolved_path
 
+        self._encode_sem = asyncio.Semaphore(ENCODE_CONCURRENCY)
+        self._cache_size = ENCODE_CACHE_SIZE if cache_size is None else cache_size
+        # aencode_batch() runs encodes on several threads at once
+        self._encode_cache_lock = threading.Lock()
+        self._encode_cache: "OrderedDict[bytes, Tuple[np.ndarray, Dict[int, float]]]" = (
+            OrderedDict()
+        )
+
+        if cpu_int8:
+            self._quantize_cpu_int8()
+        elif TORCH_COMPILE:
+            self._compile_backbone()
+        if warmup:
+            self._warmup_cuda()
+
+    def _warmup_cuda(self) -> None:
+        """Encode one TOKEN_BUDGET-sized batch of max-length texts (GPU only)."""
+        import torch
+
+        if not torch.cuda.is_available():
+            return
+
+        n = max(1, TOKEN_BUDGET // MAX_TOKENS)
+        torch.cuda.reset_peak_memory_stats()
+        t0 = time.monotonic()
+        self._model.encode(
+            [" law" * MAX_TOKENS] * n,
+            batch_size=n,
+            max_length=MAX_TOKENS,
+            return_dense=True,
+            return_sparse=True,
+            return_colbert_vecs=False,
+        )
+        logger.info(
+            "bgem3_warmup: batch=%d peak_allocated_mb=%.0f elapsed_s=%.2f",
+            n,
+            torch.cuda.max_memory_allocated() / 2**20,
+            time.monotonic() - t0,
+        )
+
+    def _compile_backbone(self) -> None:
+        """Wrap the transformer in torch.compile so Inductor fuses its kernels."""
+        import torch
+
+        inner = getattr(self._model, "model", None)
+        if inner is None:
+            logger.warning("bgem3_compile_skipped: FlagEmbedding model has no .model attribute")
+            return
+
+        # Default mode, not reduce-overhead: CUDA graphs are recorded per
+        # input shape, and token-budget batches rarely repeat a shape
+        self._model.model = torch.compile(inner, dynamic=True, fullgraph=False)
+        logger.info("bgem3_compiled: model=%s", self._model_path)
+
+    def _quantize_cpu_int8(self) -> None:
+        """Swap the model's Linear layers for dynamically quantized INT8 ones (CPU only)."""
+        import torch
+
+        if torch.cuda.is_available():
+            logger.info("bgem3_int8_skipped: CUDA available — keeping FP16 on GPU")
+            return
+
+        inner = getattr(self._model, "model", None)
+        if inner is None:
+            logger.warning("bgem3_int8_skipped: FlagEmbedding model has no .model attribute")
+            return
+
+        self._model.model = torch.quantization.quantize_dynamic(
+            inner, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        logger.info("bgem3_int8_quantized: model=%s device=cpu", self._model_path)
+
     # ------------------------------------------------------------------
     # Public encoding methods
     # ------------------------------------------------------------------
@@ -139,59 +275,343 @@ class BGEM3Embedder:
         logger.debug(
             "bgem3_encode_sparse: n=%d elapsed_s=%.3f", len(texts), elapsed
         )
-        return [dict(s) for s in sparse]
+        return list(sparse)
 
-    def encode_batch(
+    def encode_dense_sparse(
         self,
         texts: List[str],
-        batch_size: int = 32,
     ) -> Tuple[List[List[float]], List[Dict[int, float]]]:
-        """Encode dense and sparse in a single forward pass per batch.
+        """Encode texts to dense and sparse vectors with one forward pass.
 
-        This is the preferred method for indexing — BGE-M3 computes both
-        dense and sparse vectors simultaneously, avoiding redundant computation.
+        Query-time counterpart of encode_batch(): the shared transformer runs
+        once and both heads read its hidden states, instead of running it
+        twice via encode_dense() + encode_sparse(). No batching loop — meant
+        for a handful of query texts.
 
         Args:
-            texts:      List of text strings (with DOCUMENT_PREFIX if indexing).
-            batch_size: Number of texts per forward pass. Reduce if OOM on GPU.
+            texts: List of text strings. Do NOT apply DOCUMENT_PREFIX for queries.
 
         Returns:
-            Tuple of (dense_vectors, sparse_vectors).
-            dense_vectors: List[List[float]] — 1024-dim per text.
-            sparse_vectors: List[Dict[int, float]] — token_id->weight per text.
+            Tuple of (dense_vectors, sparse_vectors), as for encode_batch().
         """
-        all_dense: List[List[float]] = []
-        all_sparse: List[Dict[int, float]] = []
+        t0 = time.monotonic()
+        output = self._model.encode(
+            texts,
+            return_dense=True,
+            return_sparse=True,
+            return_colbert_vecs=False,
+        )
+        elapsed = time.monotonic() - t0
+        dense = output["dense_vecs"].tolist()
+        sparse = list(output["lexical_weights"])
+        logger.debug(
+            "bgem3_encode_dense_sparse: n=%d elapsed_s=%.3f", len(texts), elapsed
+        )
+        return dense, sparse
+
+    def iter_encode_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        token_budget: Optional[int] = None,
+        max_length: Optional[int] = None,
+    ) -> Iterator[Tuple[List[int], List[List[float]], List[Dict[int, float]]]]:
+        """Encode dense and sparse in one forward pass per batch, yielding each batch.
+
+        Lets indexers upsert a batch while holding only that batch's vectors,
+        instead of the whole corpus. Texts are encoded shortest-first so each
+        forward pass pads to similar lengths; each yield carries the input
+        positions of its texts. A batch is closed once its padded size
+        (items x estimated tokens of the longest item) would exceed
+        token_budget, so short clauses pack densely while long judgments go
+        a few at a time.
+
+        If the cache is enabled (cache_size), recently encoded texts are kept
+        in an LRU keyed by content hash, with dense vectors stored unrounded
+        in the model's output dtype — a text's vector does not depend on
+        whether it was cached. Cached and in-call duplicate texts skip the
+        forward pass (cached ones arrive first, in one yield).
+
+        Texts longer than max_length (estimated) tokens are split into
+        overlapping windows, each encoded on its own; the text's dense vector
+        is the L2-normalised mean of its windows' and its sparse weights the
+        per-token max. Attention cost grows with the square of length, so a
+        lower cap keeps one long outlier from dominating its batch.
 
+        Args:
+            texts:        List of text strings (with DOCUMENT_PREFIX if indexing).
+            batch_size:   Maximum texts per forward pass.
+            token_budget: Padded tokens per forward pass. Defaults to
+                          TOKEN_BUDGET; reduce if OOM on GPU.
+            max_length:   Window length in tokens. Defaults to MAX_LENGTH.
+
+        Yields:
+            (positions, dense_vectors, sparse_vectors) — positions[j] is the
+            index in texts of dense_vectors[j] / sparse_vectors[j]. Sparse
+            vectors are FlagEmbedding's raw lexical weight mappings, shared
+            with the cache: do not mutate them.
+        """
+        pieces: List[str] = []
+        owners: List[int] = []
+        for i, text in enumerate(texts):
+            for piece in _split_long_text(text, max_length or MAX_LENGTH):
+                pieces.append(piece)
+                owners.append(i)
+        if len(pieces) == len(texts):
+            yield from self._iter_encode_texts(texts, batch_size, token_budget)
+            return
+
+        n_pieces = Counter(owners)
+        parts: Dict[int, List[Tuple[List[float], Dict[int, float]]]] = defaultdict(list)
+        for piece_idx, dense_vecs, sparse_vecs in self._iter_encode_texts(
+            pieces, batch_size, token_budget
+        ):
+            positions: List[int] = []
+            batch_dense: List[List[float]] = []
+            batch_sparse: List[Dict[int, float]] = []
+            for p, dense, sparse in zip(piece_idx, dense_vecs, sparse_vecs):
+                i = owners[p]
+                parts[i].append((dense, sparse))
+                # Emit a text once its last window is encoded
+                if len(parts[i]) == n_pieces[i]:
+                    dense, sparse = _merge_windows(parts.pop(i))
+                    positions.append(i)
+                    batch_dense.append(dense)
+                    batch_sparse.append(sparse)
+            if positions:
+                yield positions, batch_dense, batch_sparse
+
+    def _iter_encode_texts(
+        self,
+        texts: List[str],
+        batch_size: int,
+        token_budget: Optional[int],
+    ) -> Iterator[Tuple[List[int], List[List[float]], List[Dict[int, float]]]]:
+        """Cache lookup plus length-sorted, token-budget batches; see iter_encode_batch()."""
         total = len(texts)
-        for start in range(0, total, batch_size):
-            batch = texts[start : start + batch_size]
+        cache = self._encode_cache
+        keys = [_text_key(t) for t in texts]
+
+        # Repeated boilerplate (provisos, statute headers) is served from the
+        # cache and encoded once per call; misses maps key -> input positions
+        hits: List[int] = []
+        hit_entries: list = []
+        misses: Dict[bytes, List[int]] = {}
+        with self._encode_cache_lock:
+            for i, key in enumerate(keys):
+                entry = cache.get(key)
+                if entry is not None:
+                    cache.move_to_end(key)
+                    hits.append(i)
+                    hit_entries.append(entry)
+                else:
+                    misses.setdefault(key, []).append(i)
+        if hits:
+            logger.debug("bgem3_encode_cache_hits: n=%d/%d", len(hits), total)
+            yield (
+                hits,
+                [dense.tolist() for dense, _ in hit_entries],
+                [sparse for _, sparse in hit_entries],
+            )
+
+        order = sorted((p[0] for p in misses.values()), key=lambda i: len(texts[i]))
+        done = len(hits)
+        for batch_idx in _token_budget_batches(
+            order, texts, batch_size, token_budget or TOKEN_BUDGET
+        ):
+            batch = [texts[i] for i in batch_idx]
             t0 = time.monotonic()
 
+            # batch_size=len(batch) stops FlagEmbedding re-splitting the batch
             output = self._model.encode(
                 batch,
+                batch_size=len(batch),
                 return_dense=True,
                 return_sparse=True,
                 return_colbert_vecs=False,
             )
 
             elapsed = time.monotonic() - t0
-            batch_dense = output["dense_vecs"].tolist()
-            batch_sparse = [dict(s) for s in output["lexical_weights"]]
-
-            all_dense.extend(batch_dense)
-            all_sparse.extend(batch_sparse)
-
+            positions: List[int] = []
+            batch_dense: List[List[float]] = []
+            batch_sparse: List[Dict[int, float]] = []
+            if self._cache_size > 0:
+                import numpy as np
+
+                # Row copies, so an entry does not pin the whole batch array
+                dense_rows = np.asarray(output["dense_vecs"])
+                with self._encode_cache_lock:
+                    for i, vec, sparse in zip(batch_idx, dense_rows, output["lexical_weights"]):
+                        cache[keys[i]] = (vec.copy(), sparse)
+                    while len(cache) > self._cache_size:
+                        cache.popitem(last=False)
+            for i, dense, sparse in zip(
+                batch_idx, output["dense_vecs"].tolist(), output["lexical_weights"]
+            ):
+                for j in misses[keys[i]]:
+                    positions.append(j)
+                    batch_dense.append(dense)
+                    batch_sparse.append(sparse)
+
+            done += len(positions)
             logger.info(
                 "bgem3_encode_batch: batch=%d/%d size=%d elapsed_s=%.3f",
-                start + len(batch),
+                done,
                 total,
                 len(batch),
                 elapsed,
             )
+            yield positions, batch_dense, batch_sparse
 
+    def encode_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        sparse_csr: bool = False,
+        token_budget: Optional[int] = None,
+        max_length: Optional[int] = None,
+    ) -> Tuple[List[List[float]], Any]:
+        """Encode dense and sparse in a single forward pass per batch.
+
+        This is the preferred method for indexing — BGE-M3 computes both
+        dense and sparse vectors simultaneously, avoiding redundant computation.
+        Collects iter_encode_batch() into input order.
+
+        Args:
+            texts:        List of text strings (with DOCUMENT_PREFIX if indexing).
+            batch_size:   Maximum texts per forward pass.
+            sparse_csr:   Return the sparse vectors as one CSR triple instead
+                          of a dict per text (see sparse_weights_to_csr()).
+            token_budget: Padded tokens per forward pass. Defaults to
+                          TOKEN_BUDGET; reduce if OOM on GPU.
+            max_length:   Window length in tokens for long texts. Defaults to
+                          MAX_LENGTH (see iter_encode_batch()).
+
+        Returns:
+            Tuple of (dense_vectors, sparse_vectors).
+            dense_vectors: List[List[float]] — 1024-dim per text.
+            sparse_vectors: List[Dict[int, float]] — token_id->weight per text,
+                or (indptr, indices, values) numpy arrays if sparse_csr.
+        """
+        total = len(texts)
+        all_dense: List[Any] = [None] * total
+        all_sparse: List[Any] = [None] * total
+
+        for batch_idx, batch_dense, batch_sparse in self.iter_encode_batch(
+            texts, batch_size=batch_size, token_budget=token_budget,
+            max_length=max_length,
+        ):
+            for i, dense, sparse in zip(batch_idx, batch_dense, batch_sparse):
+                all_dense[i] = dense
+                all_sparse[i] = sparse
+
+        if sparse_csr:
+            return all_dense, sparse_weights_to_csr(all_sparse)
         return all_dense, all_sparse
 
+    async def aencode_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        token_budget: Optional[int] = None,
+    ) -> Tuple[List[List[float]], List[Dict[int, float]]]:
+        """Run encode_batch() in a worker thread for async callers.
+
+        At most ENCODE_CONCURRENCY calls encode at once, so callers can
+        asyncio.gather() shards without piling threads onto the GPU.
+        """
+        async with self._encode_sem:
+            return await asyncio.to_thread(
+                self.encode_batch, texts, batch_size, token_budget=token_budget
+            )
+
+
+# ---------------------------------------------------------------------------
+# Batching helpers
+# ---------------------------------------------------------------------------
+
+def _has_fp16_tensor_cores() -> bool:
+    """True unless running on a CUDA GPU older than Volta (sm_70).
+
+    CPU returns True: FlagEmbedding already drops FP16 there itself.
+    """
+    import torch
+
+    if not torch.cuda.is_available():
+        return True
+    return torch.cuda.get_device_capability() >= (7, 0)
+
+
+def _split_long_text(text: str, max_length: int) -> List[str]:
+    """Split text into overlapping windows of about max_length tokens.
+
+    Windows after the first re-apply DOCUMENT_PREFIX when the text has it,
+    so every window is embedded as a document.
+    """
+    if max_length >= MAX_TOKENS or _estimate_tokens(text) <= max_length:
+        return [text]
+
+    prefix = DOCUMENT_PREFIX if text.startswith(DOCUMENT_PREFIX) else ""
+    body = text[len(prefix):]
+    width = max_length * _CHARS_PER_TOKEN - len(prefix)
+    step = width - min(WINDOW_OVERLAP_TOKENS * _CHARS_PER_TOKEN, width // 2)
+    return [
+        prefix + body[start : start + width]
+        for start in range(0, max(len(body) - width, 0) + step, step)
+    ]
+
+
+def _merge_windows(
+    parts: List[Tuple[List[float], Dict[int, float]]],
+) -> Tuple[List[float], Dict[int, float]]:
+    """Pool window encodings: normalised mean dense, per-token max sparse."""
+    if len(parts) == 1:
+        return parts[0]
+    import numpy as np
+
+    dense = np.mean(np.asarray([d for d, _ in parts], dtype=np.float32), axis=0)
+    dense /= np.linalg.norm(dense) or 1.0
+
+    sparse: Dict[int, float] = {}
+    for _, weights in parts:
+        for token, weight in weights.items():
+            if weight > sparse.get(token, 0.0):
+                sparse[token] = weight
+    return dense.tolist(), sparse
+
+
+def _text_key(text: str) -> bytes:
+    """128-bit content hash used as the encode cache key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough BGE-M3 token count for batching, capped at MAX_TOKENS."""
+    return min(len(text) // _CHARS_PER_TOKEN + 2, MAX_TOKENS)
+
+
+def _token_budget_batches(
+    order: List[int],
+    texts: List[str],
+    max_items: int,
+    token_budget: int,
+) -> Iterator[List[int]]:
+    """Split length-sorted text indices into batches under a padded-token budget.
+
+    Since order is ascending by length, the next item is always the longest
+    so far and a batch's padded size is (count + 1) x its estimated tokens.
+    An item over the budget on its own still gets a batch to itself.
+    """
+    batch: List[int] = []
+    for i in order:
+        padded = (len(batch) + 1) * _estimate_tokens(texts[i])
+        if batch and (len(batch) >= max_items or padded > token_budget):
+            yield batch
+            batch = []
+        batch.append(i)
+    if batch:
+        yield batch
+
 
 # ---------------------------------------------------------------------------
 # Sparse vector format conversion
@@ -204,16 +624,57 @@ def sparse_dict_to_qdrant(sparse: Dict[int, float]) -> dict:
     Qdrant requires: SparseVector(indices=[...], values=[...])
 
     Args:
-        sparse: Token ID to weight mapping from BGE-M3.
+        sparse: Token ID (int or numeric str) to weight mapping from BGE-M3.
 
     Returns:
-        Dict with "indices" and "values" lists, ready to construct
-        qdrant_client.models.SparseVector(**result).
+        Dict with "indices" and "values" lists, sorted by token ID and ready
+        to construct qdrant_client.models.SparseVector(**result).
     """
     if not sparse:
         return {"indices": [], "values": []}
-    indices, values = zip(*sorted(sparse.items()))
-    return {"indices": list(indices), "values": list(values)}
+    import numpy as np
+
+    # Sort as integers: FlagEmbedding keys are numeric strings, which would
+    # otherwise sort lexically ("10" < "9")
+    n = len(sparse)
+    indices = np.fromiter((int(k) for k in sparse), dtype=np.int64, count=n)
+    values = np.fromiter(sparse.values(), dtype=np.float32, count=n)
+    order = np.argsort(indices, kind="stable")
+    return {"indices": indices[order].tolist(), "values": values[order].tolist()}
+
+
+def sparse_weights_to_csr(
+    weights: List[Dict[Any, float]],
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Pack per-text BGE-M3 lexical weights into CSR arrays.
+
+    Text i's sparse vector is indices[indptr[i]:indptr[i+1]] with the
+    matching slice of values, so callers can build Qdrant SparseVectors
+    from array slices instead of sorting and unzipping a dict per text.
+    Indices keep BGE-M3's order (Qdrant does not require them sorted).
+
+    Args:
+        weights: Token ID (int or numeric str) to weight mapping per text.
+
+    Returns:
+        (indptr, indices, values): int64 of length len(weights) + 1, int64
+        and float32 of length nnz.
+    """
+    import numpy as np
+
+    indptr = np.zeros(len(weights) + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter((len(w) for w in weights), dtype=np.int64, count=len(weights)),
+        out=indptr[1:],
+    )
+    nnz = int(indptr[-1])
+    indices = np.fromiter(
+        (int(k) for w in weights for k in w), dtype=np.int64, count=nnz,
+    )
+    values = np.fromiter(
+        (v for w in weights for v in w.values()), dtype=np.float32, count=nnz,
+    )
+    return indptr, indices, values
 
 
 def apply_document_prefix(texts: List[str]) -> List[str]:
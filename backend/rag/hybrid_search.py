@@ -5,23 +5,33 @@ IMPORTANT: The StatuteNormalizationTool MUST have already run before calling
 search() — this module does not normalize statute references.
 
 Search pipeline:
-    1. Embed query (dense only — BGE-M3, no instruction prefix for queries)
-    2. Build Qdrant filter from non-None filter parameters
+    1. Build Qdrant filter from non-None filter parameters
+    2. Embed query (BGE-M3 dense + sparse in one pass, no instruction prefix)
     3. Prefetch dense results  (top_k * prefetch_multiplier candidates)
     4. Prefetch sparse results (top_k * prefetch_multiplier candidates)
+       Steps 2–4 are served from in-process LRU caches for repeat queries
+       (see cache_clear()).
     5. Apply Weighted Reciprocal Rank Fusion (weights from QUERY_TYPE_WEIGHTS)
     6. Apply client-side Score Boosting (era recency, extraction confidence,
        offence classification)
     7. Apply Maximal Marginal Relevance (MMR) diversity if mmr_diversity > 0
-    8. Return top_k results as List[RetrievalResult]
+    8. Deduplicate, fetch full payloads for the survivors only (prefetches
+       carry just the ranking fields), return top_k as List[RetrievalResult]
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from backend.rag.embeddings import BGEM3Embedder, sparse_dict_to_qdrant
 from backend.rag.reranker import RetrievalResult
@@ -50,6 +60,162 @@ QUERY_TYPE_WEIGHTS: dict[str, tuple[float, float]] = {
     "old_statute":      (1.0, 3.0),   # IPC/CrPC references after normalization
     "default":          (2.0, 1.0),   # fallback
 }
+_DEFAULT_WEIGHTS = QUERY_TYPE_WEIGHTS["default"]
+
+
+# ---------------------------------------------------------------------------
+# Query caches (repeat queries from paginated UIs and agent retries)
+# ---------------------------------------------------------------------------
+
+# Query text -> (dense, SparseVector) embedding. Embeddings never go stale.
+QUERY_EMBED_CACHE_SIZE = int(os.getenv("QUERY_EMBED_CACHE_SIZE", "1024"))
+# (query, collection, filters, candidates) -> raw dense/sparse hit lists.
+# Expires so re-indexed collections are picked up without a restart.
+QUERY_HIT_CACHE_SIZE = int(os.getenv("QUERY_HIT_CACHE_SIZE", "256"))
+QUERY_HIT_CACHE_TTL_S = float(os.getenv("QUERY_HIT_CACHE_TTL_S", "300"))
+
+
+class _LRUCache:
+    """Bounded, thread-safe LRU shared by search() and search_async()."""
+
+    def __init__(self, name: str, maxsize: int, ttl_s: Optional[float] = None) -> None:
+        self._name = name
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self._ttl_s is not None:
+                if time.monotonic() - entry[0] > self._ttl_s:
+                    del self._data[key]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        logger.debug(
+            "query_cache_hit: cache=%s hits=%d misses=%d",
+            self._name, self.hits, self.misses,
+        )
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_EMBED_CACHE = _LRUCache("query_embed", QUERY_EMBED_CACHE_SIZE)
+_HIT_CACHE = _LRUCache("query_hits", QUERY_HIT_CACHE_SIZE, ttl_s=QUERY_HIT_CACHE_TTL_S)
+
+
+def cache_clear() -> None:
+    """Drop all cached query embeddings and hit lists (e.g. after re-indexing)."""
+    _EMBED_CACHE.clear()
+    _HIT_CACHE.clear()
+
+
+def _query_key(query: str) -> bytes:
+    """128-bit hash of the query text, used as the embedding cache key."""
+    return hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+
+
+# ---------------------------------------------------------------------------
+# Qdrant request helpers
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=256)
+def _build_filter(
+    act_filter: Optional[str],
+    era_filter: Optional[str],
+    legal_domain_filter: Optional[str],
+    is_offence_filter: Optional[bool],
+    is_judgment_collection: bool,
+) -> Any:
+    """Build the Qdrant payload Filter for a search, or None if unfiltered.
+
+    Memoised: filter combinations repeat across requests and every
+    FieldCondition is pydantic-validated on construction. The returned
+    Filter is shared between calls, so callers must not mutate it.
+    """
+    from qdrant_client.models import Filter, FieldCondition, MatchValue
+
+    filter_conditions = []
+    # act_code and era are statute-only fields — sc_judgments collection
+    # does not have these indexes, so skip them for that collection.
+    if act_filter and act_filter != "none" and not is_judgment_collection:
+        filter_conditions.append(
+            FieldCondition(key="act_code", match=MatchValue(value=act_filter))
+        )
+    if era_filter and era_filter != "none" and not is_judgment_collection:
+        filter_conditions.append(
+            FieldCondition(key="era", match=MatchValue(value=era_filter))
+        )
+    if legal_domain_filter and legal_domain_filter != "none":
+        filter_conditions.append(
+            FieldCondition(key="legal_domain", match=MatchValue(value=legal_domain_filter))
+        )
+    if is_offence_filter is not None:
+        filter_conditions.append(
+            FieldCondition(key="is_offence", match=MatchValue(value=is_offence_filter))
+        )
+
+    return Filter(must=filter_conditions) if filter_conditions else None
+
+
+# Payload fields needed to fuse, boost, MMR-select and dedup candidates.
+# Prefetches return only these; full payloads (text, titles) are fetched
+# for the final results alone.
+_RANKING_PAYLOAD_FIELDS = [
+    "act_code", "section_number", "era", "extraction_confidence", "is_offence",
+]
+
+
+def _query_vectors(dense: List[float], sparse: Dict[int, float]) -> Tuple[List[float], Any]:
+    """The (dense, SparseVector) pair cached per query text.
+
+    Building the SparseVector validates every index/value pair, so it is
+    done once per embedding rather than once per search that reuses it.
+    """
+    from qdrant_client.models import SparseVector
+
+    return dense, SparseVector(**sparse_dict_to_qdrant(sparse))
+
+
+def _prefetch_requests(
+    dense_query: List[float],
+    sparse_query: Any,
+    qdrant_filter: Any,
+    candidates: int,
+) -> list:
+    """Dense and sparse candidate queries for one query_batch_points() call."""
+    from qdrant_client.models import QueryRequest
+
+    return [
+        QueryRequest(
+            query=dense_query, using="dense", filter=qdrant_filter,
+            limit=candidates, with_payload=_RANKING_PAYLOAD_FIELDS,
+        ),
+        QueryRequest(
+            query=sparse_query, using="sparse",
+            filter=qdrant_filter, limit=candidates, with_payload=_RANKING_PAYLOAD_FIELDS,
+        ),
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -82,32 +248,42 @@ def _apply_score_boost(
     Returns:
         The same list with 'boosted_score' added; sorted by boosted_score desc.
     """
+    if not fused:
+        return fused
+    import numpy as np
+
     prefer_naveen = (era_filter == "naveen_sanhitas")
     is_criminal = (query_type == "criminal_offence")
 
-    for item in fused:
-        payload = item.get("payload", {})
-        era = payload.get("era", "")
-        # extraction_confidence may be null in older ingested sections; default 1.0
-        confidence = float(payload.get("extraction_confidence") or 1.0)
-        is_offence = bool(payload.get("is_offence", False))
-
-        score = item["rrf_score"]
-
-        # 1. Era recency boost
-        if prefer_naveen and era == "naveen_sanhitas":
-            score += 0.15
-
-        # 2. Extraction confidence weighting: maps confidence [0, 1] → factor [0.7, 1.0]
-        score *= (0.7 + confidence * 0.3)
+    n = len(fused)
+    payloads = [item.get("payload", {}) for item in fused]
+    score = np.fromiter((item["rrf_score"] for item in fused), dtype=np.float64, count=n)
+    # extraction_confidence may be null in older ingested sections; default 1.0
+    confidence = np.fromiter(
+        (float(p.get("extraction_confidence") or 1.0) for p in payloads),
+        dtype=np.float64, count=n,
+    )
+
+    # 1. Era recency boost
+    if prefer_naveen:
+        score += 0.15 * np.fromiter(
+            (p.get("era", "") == "naveen_sanhitas" for p in payloads), dtype=bool, count=n,
+        )
 
-        # 3. Offence precision boost
-        if is_criminal and is_offence:
-            score += 0.10
+    # 2. Extraction confidence weighting: maps confidence [0, 1] → factor [0.7, 1.0]
+    score *= 0.7 + confidence * 0.3
 
-        item["boosted_score"] = score
+    # 3. Offence precision boost
+    if is_criminal:
+        score += 0.10 * np.fromiter(
+            (bool(p.get("is_offence", False)) for p in payloads), dtype=bool, count=n,
+        )
 
-    return sorted(fused, key=lambda x: x.get("boosted_score", x["rrf_score"]), reverse=True)
+    # Stable, so equal scores keep their RRF order as sorted() did
+    order = np.argsort(-score, kind="stable")
+    for item, boosted in zip(fused, score.tolist()):
+        item["boosted_score"] = boosted
+    return [fused[i] for i in order.tolist()]
 
 
 # ---------------------------------------------------------------------------
@@ -144,39 +320,177 @@ def _apply_mmr_diversity(
     if mmr_diversity <= 0.0 or not candidates:
         return candidates[:top_k]
 
+    import numpy as np
+
     lam = 1.0 - mmr_diversity  # weight on relevance; (1-lam) on diversity
 
-    selected: list[dict] = []
-    remaining = list(candidates)
-
-    while remaining and len(selected) < top_k:
-        best_idx = 0
-        best_mmr = float("-inf")
-
-        for i, cand in enumerate(remaining):
-            relevance = cand.get("boosted_score", cand.get("rrf_score", 0.0))
-            cand_act = (cand.get("payload") or {}).get("act_code", "_UNKNOWN_")
-
-            if selected:
-                # Max similarity to already-selected results (act_code proximity)
-                max_sim = max(
-                    1.0 if cand_act == (s.get("payload") or {}).get("act_code", "")
-                    else 0.2
-                    for s in selected
-                )
-            else:
-                max_sim = 0.0
+    relevance = np.array(
+        [c.get("boosted_score", c.get("rrf_score", 0.0)) for c in candidates],
+        dtype=np.float64,
+    )
+    # Intern act codes to ints so the similarity matrix is an int compare.
+    # A candidate without act_code (-1) never matches a selected result.
+    interner: dict[str, int] = {}
+    cand_ids = np.empty(len(candidates), dtype=np.int32)
+    sel_ids = np.empty(len(candidates), dtype=np.int32)
+    for i, c in enumerate(candidates):
+        payload = c.get("payload") or {}
+        sel_ids[i] = interner.setdefault(payload.get("act_code", ""), len(interner))
+        cand_ids[i] = sel_ids[i] if "act_code" in payload else -1
+    # One act (e.g. act_filter set), or none at all: the diversity penalty
+    # is the same for every remaining candidate, so the greedy picks
+    # follow the relevance order the input is already sorted by.
+    if (cand_ids == cand_ids[0]).all():
+        return candidates[:top_k]
+    # sim[i, j]: similarity of candidate i to candidate j once j is selected
+    sim = np.where(cand_ids[:, None] == sel_ids[None, :], 1.0, 0.2)
 
-            mmr_score = lam * relevance - (1.0 - lam) * max_sim
-            if mmr_score > best_mmr:
-                best_mmr = mmr_score
-                best_idx = i
+    # Running max similarity to the selected set, updated per pick in O(N)
+    max_sim = np.zeros(len(candidates))
+    alive = np.ones(len(candidates), dtype=bool)
+    selected: list[dict] = []
 
-        selected.append(remaining.pop(best_idx))
+    while len(selected) < min(top_k, len(candidates)):
+        mmr_scores = lam * relevance - (1.0 - lam) * max_sim
+        mmr_scores[~alive] = -np.inf
+        best_idx = int(np.argmax(mmr_scores))
+        selected.append(candidates[best_idx])
+        alive[best_idx] = False
+        np.maximum(max_sim, sim[:, best_idx], out=max_sim)
 
     return selected
 
 
+# ---------------------------------------------------------------------------
+# Result pipeline helpers (shared by search() and search_async())
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class _Hit:
+    """One prefetch hit, as read by reciprocal_rank_fusion().
+
+    Slotted rather than a dict: 2 × candidates of these are built per
+    search. __getitem__/get keep the mapping interface RRF expects.
+    """
+
+    point_id: str
+    score: float
+    payload: dict
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+# Low-cardinality payload values (a few dozen acts, two eras). Interned so
+# the copies held by the query hit cache share one str object per value.
+_INTERNED_PAYLOAD_FIELDS = ("act_code", "era", "legal_domain")
+
+
+def _hits_to_rows(hits: list) -> List[_Hit]:
+    """Convert Qdrant ScoredPoints to the rows reciprocal_rank_fusion() takes."""
+    rows: List[_Hit] = []
+    for hit in hits:
+        payload = hit.payload or {}
+        for field in _INTERNED_PAYLOAD_FIELDS:
+            value = payload.get(field)
+            if isinstance(value, str):
+                payload[field] = sys.intern(value)
+        rows.append(_Hit(str(hit.id), hit.score, payload))
+    return rows
+
+
+def _rank_candidates(
+    dense_results: List[_Hit],
+    sparse_results: List[_Hit],
+    top_k: int,
+    query_type: str,
+    era_filter: Optional[str],
+    mmr_diversity: float,
+    is_judgment_collection: bool,
+) -> List[dict]:
+    """Fuse, boost, MMR-select and deduplicate candidates (pipeline steps 5–8).
+
+    Returns:
+        Fused candidate dicts, best first, one per dedup key.
+    """
+    # Step 5: Weighted Reciprocal Rank Fusion
+    dense_w, sparse_w = QUERY_TYPE_WEIGHTS.get(query_type, _DEFAULT_WEIGHTS)
+    fused = reciprocal_rank_fusion(
+        dense_results=dense_results,
+        sparse_results=sparse_results,
+        top_k=top_k * 2,  # Keep 2× top_k for boosting + MMR to select from
+        dense_weight=dense_w,
+        sparse_weight=sparse_w,
+    )
+
+    # Step 6: Client-side Score Boosting
+    # (era recency, extraction confidence, offence classification)
+    # Skip for sc_judgments — those payloads lack statutory metadata.
+    if not is_judgment_collection:
+        fused = _apply_score_boost(fused, era_filter=era_filter, query_type=query_type)
+
+    # Step 7: MMR diversity selection (optional)
+    if mmr_diversity > 0.0 and not is_judgment_collection:
+        fused = _apply_mmr_diversity(fused, mmr_diversity=mmr_diversity, top_k=top_k)
+    else:
+        fused = fused[:top_k]
+
+    # Step 8: Deduplication
+    # For statute sections: deduplicate by (act_code, section_number) —
+    # a section may be indexed more than once; keep highest-scoring copy.
+    #
+    # For SC judgment chunks: act_code and section_number are both empty
+    # strings (""). Using ("", "") as a dedup key would collapse ALL chunks
+    # to a single result. Instead, use point_id (each chunk is distinct).
+    # Detection: act_code is empty for judgment payloads.
+    #
+    # fused is score-sorted, so the first item per key is the best copy
+    best: Dict[object, dict] = {}
+    for f in fused:
+        payload = f["payload"]
+        act_code = payload.get("act_code", "")
+        if act_code:
+            best.setdefault((act_code, payload.get("section_number", "")), f)
+        else:
+            best.setdefault(f["point_id"], f)
+    return list(best.values())
+
+
+def _build_results(
+    kept: List[dict],
+    full_payloads: Dict[str, dict],
+    extract_text: Callable[[dict], str],
+) -> List[RetrievalResult]:
+    """Build RetrievalResults from ranked candidates and their full payloads.
+
+    Falls back to the candidate's ranking payload if a point was not
+    returned by retrieve() (e.g. deleted since the prefetch).
+    """
+    results: List[RetrievalResult] = []
+    for f in kept:
+        payload = full_payloads.get(f["point_id"]) or f["payload"]
+        text = payload.get("text") or extract_text(payload)
+        results.append(
+            RetrievalResult(
+                point_id=f["point_id"],
+                # Use boosted_score as primary score when available
+                score=f.get("boosted_score", f["rrf_score"]),
+                dense_score=f["dense_score"],
+                sparse_score=f["sparse_score"],
+                act_code=payload.get("act_code", ""),
+                section_number=payload.get("section_number", ""),
+                section_title=payload.get("section_title", ""),
+                era=payload.get("era", ""),
+                text=text,
+                payload=payload,
+            )
+        )
+    return results
+
+
 # ---------------------------------------------------------------------------
 # HybridSearcher
 # ---------------------------------------------------------------------------
@@ -189,6 +503,8 @@ class HybridSearcher:
         results = await searcher.search("punishment for murder under BNS", top_k=10)
     """
 
+    __slots__ = ("_qdrant", "_embedder", "_prefetch_k", "_async_qdrant")
+
     def __init__(
         self,
         qdrant_client: Any,
@@ -243,153 +559,71 @@ class HybridSearcher:
         Returns:
             List[RetrievalResult] sorted by score descending (boosted RRF or MMR).
         """
-        from qdrant_client.models import Filter, FieldCondition, MatchValue, NamedSparseVector, SparseVector
-
         candidates = top_k * self._prefetch_k
 
         # ----------------------------------------------------------------
-        # Step 1: Embed query — dense only, NO instruction prefix
-        # ----------------------------------------------------------------
-        dense_query = self._embedder.encode_dense([query])[0]
-
-        # ----------------------------------------------------------------
-        # Step 2: Build Qdrant filter
+        # Step 1: Build Qdrant filter
         # ----------------------------------------------------------------
-        filter_conditions = []
-        # act_code and era are statute-only fields — sc_judgments collection
-        # does not have these indexes, so skip them for that collection.
         is_judgment_collection = collection == COLLECTION_SC_JUDGMENTS
-        if act_filter and act_filter != "none" and not is_judgment_collection:
-            filter_conditions.append(
-                FieldCondition(key="act_code", match=MatchValue(value=act_filter))
-            )
-        if era_filter and era_filter != "none" and not is_judgment_collection:
-            filter_conditions.append(
-                FieldCondition(key="era", match=MatchValue(value=era_filter))
-            )
-        if legal_domain_filter and legal_domain_filter != "none":
-            filter_conditions.append(
-                FieldCondition(key="legal_domain", match=MatchValue(value=legal_domain_filter))
-            )
-        if is_offence_filter is not None:
-            filter_conditions.append(
-                FieldCondition(key="is_offence", match=MatchValue(value=is_offence_filter))
-            )
-
-        qdrant_filter = Filter(must=filter_conditions) if filter_conditions else None
-
-        # ----------------------------------------------------------------
-        # Step 3: Prefetch dense results
-        # ----------------------------------------------------------------
-        dense_hits = self._qdrant.search(
-            collection_name=collection,
-            query_vector=("dense", dense_query),
-            query_filter=qdrant_filter,
-            limit=candidates,
-            with_payload=True,
+        qdrant_filter = _build_filter(
+            act_filter, era_filter, legal_domain_filter, is_offence_filter,
+            is_judgment_collection,
         )
-        dense_results = [
-            {
-                "point_id": str(hit.id),
-                "score": hit.score,
-                "payload": hit.payload or {},
-            }
-            for hit in dense_hits
-        ]
 
         # ----------------------------------------------------------------
-        # Step 4: Prefetch sparse results
+        # Steps 2–4: Embed query (NO instruction prefix), prefetch dense and
+        # sparse results — skipped entirely when the same search is cached
         # ----------------------------------------------------------------
-        sparse_query_dict = self._embedder.encode_sparse([query])[0]
-        sv = sparse_dict_to_qdrant(sparse_query_dict)
-
-        sparse_hits = self._qdrant.search(
-            collection_name=collection,
-            query_vector=NamedSparseVector(name="sparse", vector=SparseVector(**sv)),
-            query_filter=qdrant_filter,
-            limit=candidates,
-            with_payload=True,
+        qkey = _query_key(query)
+        hit_key = (
+            qkey, collection, act_filter, era_filter, legal_domain_filter,
+            is_offence_filter, candidates,
         )
-        sparse_results = [
-            {
-                "point_id": str(hit.id),
-                "score": hit.score,
-                "payload": hit.payload or {},
-            }
-            for hit in sparse_hits
-        ]
+        cached_hits = _HIT_CACHE.get(hit_key)
+        if cached_hits is not None:
+            dense_results, sparse_results = cached_hits
+        else:
+            embedded = _EMBED_CACHE.get(qkey)
+            if embedded is None:
+                # One BGE-M3 forward pass yields both query vectors
+                dense_batch, sparse_batch = self._embedder.encode_dense_sparse([query])
+                embedded = _query_vectors(dense_batch[0], sparse_batch[0])
+                _EMBED_CACHE.put(qkey, embedded)
+            dense_query, sparse_query = embedded
+
+            # Both prefetches go in one round-trip; fusion stays client-side
+            # because Qdrant's server-side RRF is unweighted
+            dense_resp, sparse_resp = self._qdrant.query_batch_points(
+                collection_name=collection,
+                requests=_prefetch_requests(
+                    dense_query, sparse_query, qdrant_filter, candidates
+                ),
+            )
+            dense_results = _hits_to_rows(dense_resp.points)
+            sparse_results = _hits_to_rows(sparse_resp.points)
+            _HIT_CACHE.put(hit_key, (dense_results, sparse_results))
 
         # ----------------------------------------------------------------
-        # Step 5: Weighted Reciprocal Rank Fusion
+        # Steps 5–8: Weighted RRF, score boosting, MMR, deduplication
         # ----------------------------------------------------------------
-        dense_w, sparse_w = QUERY_TYPE_WEIGHTS.get(query_type, QUERY_TYPE_WEIGHTS["default"])
-        fused = reciprocal_rank_fusion(
-            dense_results=dense_results,
-            sparse_results=sparse_results,
-            top_k=top_k * 2,  # Keep 2× top_k for boosting + MMR to select from
-            dense_weight=dense_w,
-            sparse_weight=sparse_w,
+        kept = _rank_candidates(
+            dense_results, sparse_results,
+            top_k=top_k, query_type=query_type, era_filter=era_filter,
+            mmr_diversity=mmr_diversity, is_judgment_collection=is_judgment_collection,
         )
 
-        # ----------------------------------------------------------------
-        # Step 6: Client-side Score Boosting
-        # (era recency, extraction confidence, offence classification)
-        # Skip for sc_judgments — those payloads lack statutory metadata.
-        # ----------------------------------------------------------------
-        if not is_judgment_collection:
-            fused = _apply_score_boost(fused, era_filter=era_filter, query_type=query_type)
-
-        # ----------------------------------------------------------------
-        # Step 7: MMR diversity selection (optional)
-        # ----------------------------------------------------------------
-        if mmr_diversity > 0.0 and not is_judgment_collection:
-            fused = _apply_mmr_diversity(fused, mmr_diversity=mmr_diversity, top_k=top_k)
-        else:
-            fused = fused[:top_k]
-
-        # ----------------------------------------------------------------
-        # Step 8: Build RetrievalResult list with deduplication
-        # For statute sections: deduplicate by (act_code, section_number) —
-        # a section may be indexed more than once; keep highest-scoring copy.
-        #
-        # For SC judgment chunks: act_code and section_number are both empty
-        # strings (""). Using ("", "") as a dedup key would collapse ALL chunks
-        # to a single result. Instead, use point_id (each chunk is distinct).
-        # Detection: act_code is empty for judgment payloads.
-        # ----------------------------------------------------------------
-        seen_keys: set = set()
-        results: List[RetrievalResult] = []
-        for f in fused:
-            payload = f["payload"]
-            act_code = payload.get("act_code", "")
-            section_number = payload.get("section_number", "")
-            if act_code:
-                # Statutory section — deduplicate by (act, section) pair
-                dedup_key: object = (act_code, section_number)
-            else:
-                # Judgment chunk (or unknown) — each point is individually distinct
-                dedup_key = f["point_id"]
-            if dedup_key in seen_keys:
-                continue  # Skip duplicate — fused list is already score-sorted
-            seen_keys.add(dedup_key)
-
-            # Use boosted_score as primary score when available
-            final_score = f.get("boosted_score", f["rrf_score"])
-            text = payload.get("text") or self._extract_text_from_payload(payload)
-            results.append(
-                RetrievalResult(
-                    point_id=f["point_id"],
-                    score=final_score,
-                    dense_score=f["dense_score"],
-                    sparse_score=f["sparse_score"],
-                    act_code=act_code,
-                    section_number=section_number,
-                    section_title=payload.get("section_title", ""),
-                    era=payload.get("era", ""),
-                    text=text,
-                    payload=payload,
-                )
+        # Prefetches carried only the ranking fields; fetch full payloads
+        # (text, titles) for the survivors in one call
+        full_payloads: Dict[str, dict] = {}
+        if kept:
+            points = self._qdrant.retrieve(
+                collection_name=collection,
+                ids=[f["point_id"] for f in kept],
+                with_payload=True,
+                with_vectors=False,
             )
+            full_payloads = {str(p.id): p.payload or {} for p in points}
+        results = _build_results(kept, full_payloads, self._extract_text_from_payload)
 
         logger.info(
             "hybrid_search: query=%r act=%s era=%s query_type=%s mmr=%.1f top_k=%d results=%d",
@@ -402,12 +636,20 @@ class HybridSearcher:
 
         Shares QDRANT_URL / QDRANT_API_KEY with the sync client but
         uses the async client for I/O-bound Qdrant queries in search_async().
+        The client owns a keep-alive connection pool, so keep one searcher
+        per process rather than one per request.
         """
         if self._async_qdrant is None:
             from backend.rag.qdrant_setup import get_async_qdrant_client
             self._async_qdrant = get_async_qdrant_client()
         return self._async_qdrant
 
+    async def close(self) -> None:
+        """Close the lazily created AsyncQdrantClient and its connection pool."""
+        if self._async_qdrant is not None:
+            await self._async_qdrant.close()
+            self._async_qdrant = None
+
     async def search_async(
         self,
         query: str,
@@ -434,142 +676,150 @@ class HybridSearcher:
         Returns:
             List[RetrievalResult] sorted by score descending (boosted or MMR-selected).
         """
-        from qdrant_client.models import Filter, FieldCondition, MatchValue, NamedSparseVector, SparseVector
+        return await self._search_async(
+            query, None, act_filter, era_filter, legal_domain_filter,
+            is_offence_filter, collection, top_k, query_type, mmr_diversity,
+        )
 
-        candidates = top_k * self._prefetch_k
+    async def search_many(
+        self,
+        queries: List[str],
+        act_filter: Optional[str] = None,
+        era_filter: Optional[str] = None,
+        legal_domain_filter: Optional[str] = None,
+        is_offence_filter: Optional[bool] = None,
+        collection: str = COLLECTION_LEGAL_SECTIONS,
+        top_k: int = 10,
+        query_type: str = "default",
+        mmr_diversity: float = 0.0,
+    ) -> List[List[RetrievalResult]]:
+        """Run search_async() for several queries, embedding them in one pass.
 
-        # ----------------------------------------------------------------
-        # Step 1: Embed query — CPU-bound, run in thread to yield event loop
-        # ----------------------------------------------------------------
-        dense_batch = await asyncio.to_thread(self._embedder.encode_dense, [query])
-        dense_query = dense_batch[0]
+        For agents that fan a user turn out into sub-queries: the uncached
+        queries go through BGE-M3 as a single batch instead of one forward
+        pass each, then the Qdrant searches run concurrently.
 
-        # ----------------------------------------------------------------
-        # Step 2: Build Qdrant filter (same logic as sync search())
-        # ----------------------------------------------------------------
-        filter_conditions = []
-        is_judgment_collection = collection == COLLECTION_SC_JUDGMENTS
-        if act_filter and act_filter != "none" and not is_judgment_collection:
-            filter_conditions.append(
-                FieldCondition(key="act_code", match=MatchValue(value=act_filter))
-            )
-        if era_filter and era_filter != "none" and not is_judgment_collection:
-            filter_conditions.append(
-                FieldCondition(key="era", match=MatchValue(value=era_filter))
-            )
-        if legal_domain_filter and legal_domain_filter != "none":
-            filter_conditions.append(
-                FieldCondition(key="legal_domain", match=MatchValue(value=legal_domain_filter))
+        Args:
+            queries: Natural language legal queries.
+            act_filter, era_filter, legal_domain_filter, is_offence_filter,
+            collection, top_k, query_type, mmr_diversity: applied to every
+            query, with the same semantics as search().
+
+        Returns:
+            One List[RetrievalResult] per query, in input order.
+        """
+        embedded: Dict[bytes, Tuple[Any, Any]] = {}
+        to_encode: Dict[bytes, str] = {}
+        for query in queries:
+            qkey = _query_key(query)
+            if qkey in embedded or qkey in to_encode:
+                continue
+            cached = _EMBED_CACHE.get(qkey)
+            if cached is not None:
+                embedded[qkey] = cached
+            else:
+                to_encode[qkey] = query
+
+        if to_encode:
+            dense_batch, sparse_batch = await asyncio.to_thread(
+                self._embedder.encode_dense_sparse, list(to_encode.values())
             )
-        if is_offence_filter is not None:
-            filter_conditions.append(
-                FieldCondition(key="is_offence", match=MatchValue(value=is_offence_filter))
+            for qkey, dense, sparse in zip(to_encode, dense_batch, sparse_batch):
+                embedded[qkey] = _query_vectors(dense, sparse)
+                _EMBED_CACHE.put(qkey, embedded[qkey])
+
+        return list(await asyncio.gather(*(
+            self._search_async(
+                query, embedded[_query_key(query)], act_filter, era_filter,
+                legal_domain_filter, is_offence_filter, collection, top_k,
+                query_type, mmr_diversity,
             )
+            for query in queries
+        )))
 
-        qdrant_filter = Filter(must=filter_conditions) if filter_conditions else None
-
-        # ----------------------------------------------------------------
-        # Step 3: Async dense search (I/O-bound)
-        # ----------------------------------------------------------------
-        async_qdrant = await self._get_async_qdrant()
-        dense_hits = await async_qdrant.search(
-            collection_name=collection,
-            query_vector=("dense", dense_query),
-            query_filter=qdrant_filter,
-            limit=candidates,
-            with_payload=True,
-        )
-        dense_results = [
-            {
-                "point_id": str(hit.id),
-                "score": hit.score,
-                "payload": hit.payload or {},
-            }
-            for hit in dense_hits
-        ]
+    async def _search_async(
+        self,
+        query: str,
+        embedded: Optional[Tuple[Any, Any]],
+        act_filter: Optional[str],
+        era_filter: Optional[str],
+        legal_domain_filter: Optional[str],
+        is_offence_filter: Optional[bool],
+        collection: str,
+        top_k: int,
+        query_type: str,
+        mmr_diversity: float,
+    ) -> List[RetrievalResult]:
+        """search_async() body; embedded is the (dense, sparse) query pair if known."""
+        candidates = top_k * self._prefetch_k
 
         # ----------------------------------------------------------------
-        # Step 4: Encode sparse in thread (CPU-bound), then async sparse search
+        # Step 1: Build Qdrant filter (shared with sync search())
         # ----------------------------------------------------------------
-        sparse_batch = await asyncio.to_thread(self._embedder.encode_sparse, [query])
-        sparse_query_dict = sparse_batch[0]
-        sv = sparse_dict_to_qdrant(sparse_query_dict)
-
-        sparse_hits = await async_qdrant.search(
-            collection_name=collection,
-            query_vector=NamedSparseVector(name="sparse", vector=SparseVector(**sv)),
-            query_filter=qdrant_filter,
-            limit=candidates,
-            with_payload=True,
+        is_judgment_collection = collection == COLLECTION_SC_JUDGMENTS
+        qdrant_filter = _build_filter(
+            act_filter, era_filter, legal_domain_filter, is_offence_filter,
+            is_judgment_collection,
         )
-        sparse_results = [
-            {
-                "point_id": str(hit.id),
-                "score": hit.score,
-                "payload": hit.payload or {},
-            }
-            for hit in sparse_hits
-        ]
 
         # ----------------------------------------------------------------
-        # Step 5: Weighted RRF fusion
+        # Steps 2–4: Embed query in a thread (CPU-bound), then async dense and
+        # sparse searches (I/O-bound) — skipped when the search is cached
         # ----------------------------------------------------------------
-        dense_w, sparse_w = QUERY_TYPE_WEIGHTS.get(query_type, QUERY_TYPE_WEIGHTS["default"])
-        fused = reciprocal_rank_fusion(
-            dense_results=dense_results,
-            sparse_results=sparse_results,
-            top_k=top_k * 2,
-            dense_weight=dense_w,
-            sparse_weight=sparse_w,
+        async_qdrant = await self._get_async_qdrant()
+        qkey = _query_key(query)
+        hit_key = (
+            qkey, collection, act_filter, era_filter, legal_domain_filter,
+            is_offence_filter, candidates,
         )
+        cached_hits = _HIT_CACHE.get(hit_key)
+        if cached_hits is not None:
+            dense_results, sparse_results = cached_hits
+        else:
+            if embedded is None:
+                embedded = _EMBED_CACHE.get(qkey)
+            if embedded is None:
+                # One BGE-M3 forward pass yields both query vectors
+                dense_batch, sparse_batch = await asyncio.to_thread(
+                    self._embedder.encode_dense_sparse, [query]
+                )
+                embedded = _query_vectors(dense_batch[0], sparse_batch[0])
+                _EMBED_CACHE.put(qkey, embedded)
+            dense_query, sparse_query = embedded
+            # Both prefetches go in one round-trip; fusion stays client-side
+            # because Qdrant's server-side RRF is unweighted
+            dense_resp, sparse_resp = await async_qdrant.query_batch_points(
+                collection_name=collection,
+                requests=_prefetch_requests(
+                    dense_query, sparse_query, qdrant_filter, candidates
+                ),
+            )
 
-        # ----------------------------------------------------------------
-        # Step 6: Score boosting (skipped for sc_judgments)
-        # ----------------------------------------------------------------
-        if not is_judgment_collection:
-            fused = _apply_score_boost(fused, era_filter=era_filter, query_type=query_type)
+            dense_results = _hits_to_rows(dense_resp.points)
+            sparse_results = _hits_to_rows(sparse_resp.points)
+            _HIT_CACHE.put(hit_key, (dense_results, sparse_results))
 
         # ----------------------------------------------------------------
-        # Step 7: MMR diversity selection (optional)
+        # Steps 5–8: Weighted RRF, score boosting, MMR, deduplication
         # ----------------------------------------------------------------
-        if mmr_diversity > 0.0 and not is_judgment_collection:
-            fused = _apply_mmr_diversity(fused, mmr_diversity=mmr_diversity, top_k=top_k)
-        else:
-            fused = fused[:top_k]
+        kept = _rank_candidates(
+            dense_results, sparse_results,
+            top_k=top_k, query_type=query_type, era_filter=era_filter,
+            mmr_diversity=mmr_diversity, is_judgment_collection=is_judgment_collection,
+        )
 
-        # ----------------------------------------------------------------
-        # Step 8: Build RetrievalResult list with deduplication (same as sync)
-        # ----------------------------------------------------------------
-        seen_keys: set = set()
-        results: List[RetrievalResult] = []
-        for f in fused:
-            payload = f["payload"]
-            act_code = payload.get("act_code", "")
-            section_number = payload.get("section_number", "")
-            if act_code:
-                dedup_key: object = (act_code, section_number)
-            else:
-                dedup_key = f["point_id"]
-            if dedup_key in seen_keys:
-                continue
-            seen_keys.add(dedup_key)
-
-            final_score = f.get("boosted_score", f["rrf_score"])
-            text = payload.get("text") or self._extract_text_from_payload(payload)
-            results.append(
-                RetrievalResult(
-                    point_id=f["point_id"],
-                    score=final_score,
-                    dense_score=f["dense_score"],
-                    sparse_score=f["sparse_score"],
-                    act_code=act_code,
-                    section_number=section_number,
-                    section_title=payload.get("section_title", ""),
-                    era=payload.get("era", ""),
-                    text=text,
-                    payload=payload,
-                )
+        # Prefetches carried only the ranking fields; fetch full payloads
+        # (text, titles) for the survivors in one call
+        full_payloads: Dict[str, dict] = {}
+        if kept:
+            points = await async_qdrant.retrieve(
+                collection_name=collection,
+                ids=[f["point_id"] for f in kept],
+                with_payload=True,
+                with_vectors=False,
             )
+            full_payloads = {str(p.id): p.payload or {} for p in points}
+        results = _build_results(kept, full_payloads, self._extract_text_from_payload)
 
         logger.info(
             "hybrid_search_async: query=%r act=%s era=%s query_type=%s mmr=%.1f top_k=%d results=%d",
@@ -594,6 +844,8 @@ class HybridSearcher:
 class SubSectionSearcher(HybridSearcher):
     """Searches legal_sub_sections collection for granular clause retrieval."""
 
+    __slots__ = ()
+
     def search_sub_sections(
         self,
         query: str,
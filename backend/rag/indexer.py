@@ -325,9 +325,9 @@ class LegalIndexer:
         1. Fetch all eligible sections + chapter + sub-section + transition data
         2. For each section, determine scenario (A/B/C/D)
         3. Build section point payloads (with chunking for scenario C)
-        4. Embed all section texts in batches via BGE-M3
-        5. Upsert section points to legal_sections
-        6. Build + embed + upsert sub-section points to legal_sub_sections
+        4. Build sub-section points for scenarios B/C/D
+        5. Embed section and sub-section texts together in batches via BGE-M3
+        6. Upsert each batch's points to legal_sections / legal_sub_sections
         7. Mark sections as qdrant_indexed in PostgreSQL
 
         Args:
@@ -365,7 +365,7 @@ class LegalIndexer:
         # Accumulate points to embed
         # Each entry: (point_id, text_for_embedding, payload, sub_sections, section_dict)
         section_point_specs: List[Dict[str, Any]] = []
-        # Sub-section points built separately after section embedding
+        # Sub-section points, embedded in the same pass as the section points
         sub_section_specs: List[Dict[str, Any]] = []
 
         successfully_indexed_section_ids: List[_uuid_mod.UUID] = []
@@ -477,98 +477,76 @@ class LegalIndexer:
                 logger.error("indexer_section_error: act=%s %s", act_code, detail, exc_info=True)
 
         # ----------------------------------------------------------------
-        # Step 4: Embed section texts and upsert to Qdrant
+        # Steps 4-6: Embed section and sub-section texts in one pass and
+        # upsert each point to its collection
         # ----------------------------------------------------------------
-        if section_point_specs:
-            texts = [DOCUMENT_PREFIX + sp["text"] for sp in section_point_specs]
-            logger.info("indexer_embedding_sections: act=%s count=%d", act_code, len(texts))
-
-            dense_vecs, sparse_vecs = self._embedder.encode_batch(
-                texts, batch_size=self._batch_size
-            )
-
-            from qdrant_client.models import PointStruct, SparseVector
-
-            points = []
-            for i, spec in enumerate(section_point_specs):
-                sv = sparse_dict_to_qdrant(sparse_vecs[i])
-                # Store the embedded text in the payload so retrieval can return it
-                spec["payload"]["text"] = spec["text"]
-                points.append(
-                    PointStruct(
-                        id=spec["point_id"],
-                        vector={
-                            "dense": dense_vecs[i],
-                            "sparse": SparseVector(**sv),
-                        },
-                        payload=spec["payload"],
-                    )
-                )
-                # Track unique section UUIDs (not chunk point IDs)
-                section_uuid = spec.get("section_uuid")
-                if section_uuid and section_uuid not in successfully_indexed_section_ids:
-                    successfully_indexed_section_ids.append(section_uuid)
-
-            # Upsert in batches to avoid oversized requests
-            for batch_start in range(0, len(points), self._batch_size):
-                batch = points[batch_start : batch_start + self._batch_size]
-                self._qdrant.upsert(
-                    collection_name=COLLECTION_LEGAL_SECTIONS,
-                    points=batch,
-                    wait=True,
-                )
-
-            report.section_points_created = len(points)
-            report.sections_indexed = len(successfully_indexed_section_ids)
+        # One iter_encode_batch() call over both lists: its length-sorted
+        # batches mix the two kinds, so short sub-sections fill the batches
+        # instead of a second, separately padded run after the sections.
+        # Positions below n_sections are section points.
+        n_sections = len(section_point_specs)
+        all_specs = section_point_specs + sub_section_specs
+        if all_specs:
+            texts = [DOCUMENT_PREFIX + sp["text"] for sp in all_specs]
             logger.info(
-                "indexer_sections_upserted: act=%s points=%d sections=%d",
-                act_code, len(points), report.sections_indexed,
-            )
-
-        # ----------------------------------------------------------------
-        # Step 6: Embed and upsert sub-section points
-        # ----------------------------------------------------------------
-        if sub_section_specs:
-            ss_texts = [DOCUMENT_PREFIX + sp["text"] for sp in sub_section_specs]
-            logger.info(
-                "indexer_embedding_sub_sections: act=%s count=%d",
-                act_code, len(ss_texts),
-            )
-
-            ss_dense, ss_sparse = self._embedder.encode_batch(
-                ss_texts, batch_size=self._batch_size
+                "indexer_embedding: act=%s sections=%d sub_sections=%d",
+                act_code, n_sections, len(sub_section_specs),
             )
 
             from qdrant_client.models import PointStruct, SparseVector
 
-            ss_points = []
-            for i, spec in enumerate(sub_section_specs):
-                sv = sparse_dict_to_qdrant(ss_sparse[i])
-                # Store the embedded text in the payload so retrieval can return it
-                spec["payload"]["text"] = spec["text"]
-                ss_points.append(
-                    PointStruct(
+            # Upsert each encoded batch as it arrives so only one batch of
+            # vectors is held at a time
+            points_created = 0
+            ss_points_created = 0
+            for batch_idx, dense_vecs, sparse_vecs in self._embedder.iter_encode_batch(
+                texts, batch_size=self._batch_size
+            ):
+                points = []
+                ss_points = []
+                for i, dense, sparse in zip(batch_idx, dense_vecs, sparse_vecs):
+                    spec = all_specs[i]
+                    sv = sparse_dict_to_qdrant(sparse)
+                    # Store the embedded text in the payload so retrieval can return it
+                    spec["payload"]["text"] = spec["text"]
+                    point = PointStruct(
                         id=spec["point_id"],
                         vector={
-                            "dense": ss_dense[i],
+                            "dense": dense,
                             "sparse": SparseVector(**sv),
                         },
                         payload=spec["payload"],
                     )
-                )
-
-            for batch_start in range(0, len(ss_points), self._batch_size):
-                batch = ss_points[batch_start : batch_start + self._batch_size]
-                self._qdrant.upsert(
-                    collection_name=COLLECTION_LEGAL_SUB_SECTIONS,
-                    points=batch,
-                    wait=True,
-                )
+                    if i >= n_sections:
+                        ss_points.append(point)
+                        continue
+                    points.append(point)
+                    # Track unique section UUIDs (not chunk point IDs)
+                    section_uuid = spec.get("section_uuid")
+                    if section_uuid and section_uuid not in successfully_indexed_section_ids:
+                        successfully_indexed_section_ids.append(section_uuid)
+
+                if points:
+                    self._qdrant.upsert(
+                        collection_name=COLLECTION_LEGAL_SECTIONS,
+                        points=points,
+                        wait=True,
+                    )
+                    points_created += len(points)
+                if ss_points:
+                    self._qdrant.upsert(
+                        collection_name=COLLECTION_LEGAL_SUB_SECTIONS,
+                        points=ss_points,
+                        wait=True,
+                    )
+                    ss_points_created += len(ss_points)
 
-            report.sub_sections_indexed = len(ss_points)
+            report.section_points_created = points_created
+            report.sections_indexed = len(successfully_indexed_section_ids)
+            report.sub_sections_indexed = ss_points_created
             logger.info(
-                "indexer_sub_sections_upserted: act=%s count=%d",
-                act_code, len(ss_points),
+                "indexer_upserted: act=%s points=%d sections=%d sub_sections=%d",
+                act_code, points_created, report.sections_indexed, ss_points_created,
             )
 
         # ----------------------------------------------------------------
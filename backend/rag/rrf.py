@@ -20,7 +20,9 @@ outperforms Condorcet and individual Rank Learning Methods."
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, List, Optional, Sequence
 
 # Standard RRF constant. Changing this affects how much low-ranked results
@@ -97,41 +99,40 @@ def reciprocal_rank_fusion(
     # Process dense results
     for rank, result in enumerate(dense_results, start=1):
         pid = result["point_id"]
-        if pid not in candidates:
-            candidates[pid] = RRFCandidate(
-                point_id=pid,
-                payload=result.get("payload", {}),
-            )
-        candidates[pid].dense_rank = rank
-        candidates[pid].dense_score = result.get("score", 0.0)
+        payload = result.get("payload")
+        candidate = candidates.get(pid)
+        if candidate is None:
+            candidate = candidates[pid] = RRFCandidate(point_id=pid, payload=payload or {})
         # Prefer payload from dense results (usually more complete)
-        if result.get("payload"):
-            candidates[pid].payload = result["payload"]
+        elif payload:
+            candidate.payload = payload
+        candidate.dense_rank = rank
+        candidate.dense_score = result.get("score", 0.0)
 
     # Process sparse results
     for rank, result in enumerate(sparse_results, start=1):
         pid = result["point_id"]
-        if pid not in candidates:
-            candidates[pid] = RRFCandidate(
-                point_id=pid,
-                payload=result.get("payload", {}),
-            )
-        candidates[pid].sparse_rank = rank
-        candidates[pid].sparse_score = result.get("score", 0.0)
+        payload = result.get("payload")
+        candidate = candidates.get(pid)
+        if candidate is None:
+            candidate = candidates[pid] = RRFCandidate(point_id=pid, payload=payload or {})
         # Merge payload — sparse results may have same payload
-        if result.get("payload") and not candidates[pid].payload:
-            candidates[pid].payload = result["payload"]
+        elif payload and not candidate.payload:
+            candidate.payload = payload
+        candidate.sparse_rank = rank
+        candidate.sparse_score = result.get("score", 0.0)
 
     # Compute RRF scores with optional weights
     for candidate in candidates.values():
         candidate.compute_rrf(k=k, dense_weight=dense_weight, sparse_weight=sparse_weight)
 
-    # Sort by RRF score descending
-    sorted_candidates = sorted(
+    # Top top_k by RRF score, descending. nlargest() is O(N log top_k) and
+    # keeps sorted()'s order for ties; callers pass top_k well below N.
+    sorted_candidates = heapq.nlargest(
+        top_k,
         candidates.values(),
-        key=lambda c: c.rrf_score,
-        reverse=True,
-    )[:top_k]
+        key=attrgetter("rrf_score"),
+    )
 
     return [
         {
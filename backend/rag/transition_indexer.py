@@ -171,36 +171,37 @@ class TransitionIndexer:
         texts_prefixed = apply_document_prefix([s["text"] for s in specs])
         logger.info("transition_indexer_embedding: count=%d", len(texts_prefixed))
 
-        dense_vecs, sparse_vecs = self._embedder.encode_batch(
-            texts_prefixed, batch_size=self._batch_size
-        )
-
         from qdrant_client.models import PointStruct, SparseVector
 
-        points = []
-        for i, spec in enumerate(specs):
-            sv = sparse_dict_to_qdrant(sparse_vecs[i])
-            points.append(
-                PointStruct(
-                    id=spec["point_id"],
-                    vector={
-                        "dense": dense_vecs[i],
-                        "sparse": SparseVector(**sv),
-                    },
-                    payload=spec["payload"],
+        # Upsert each encoded batch as it arrives so only one batch of
+        # vectors is held at a time
+        indexed = 0
+        for batch_idx, dense_vecs, sparse_vecs in self._embedder.iter_encode_batch(
+            texts_prefixed, batch_size=self._batch_size
+        ):
+            points = []
+            for i, dense, sparse in zip(batch_idx, dense_vecs, sparse_vecs):
+                spec = specs[i]
+                sv = sparse_dict_to_qdrant(sparse)
+                points.append(
+                    PointStruct(
+                        id=spec["point_id"],
+                        vector={
+                            "dense": dense,
+                            "sparse": SparseVector(**sv),
+                        },
+                        payload=spec["payload"],
+                    )
                 )
-            )
 
-        # Upsert in batches
-        for batch_start in range(0, len(points), self._batch_size):
-            batch = points[batch_start : batch_start + self._batch_size]
             self._qdrant.upsert(
                 collection_name=COLLECTION_TRANSITION_CONTEXT,
-                points=batch,
+                points=points,
                 wait=True,
             )
+            indexed += len(points)
 
-        report.mappings_indexed = len(points)
+        report.mappings_indexed = indexed
         report.duration_seconds = time.monotonic() - t_start
         logger.info(
             "transition_indexer_complete: indexed=%d errors=%d duration=%.1fs",
@@ -0,0 +1,199 @@
+"""Unit tests for the BGE-M3 embedder's batching (backend/rag/embeddings.py).
+
+The FlagEmbedding model is replaced by a fake that records each forward pass,
+so these run without the model weights or a GPU.
+
+Run from project root:
+    pytest backend/tests/test_embeddings.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from backend.rag.embeddings import (
+    DOCUMENT_PREFIX,
+    BGEM3Embedder,
+    _split_long_text,
+    sparse_dict_to_qdrant,
+)
+
+
+class _Vecs(list):
+    """Stands in for the numpy array FlagEmbedding returns as dense_vecs."""
+
+    def tolist(self):
+        return list(self)
+
+
+class _FakeModel:
+    """Encodes each text as dense [len(text)] and sparse {len(text): 1.0}."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return {
+            "dense_vecs": _Vecs([float(len(t))] for t in texts),
+            "lexical_weights": [{str(len(t)): 1.0} for t in texts],
+        }
+
+
+def _embedder() -> BGEM3Embedder:
+    embedder = object.__new__(BGEM3Embedder)
+    embedder._model = _FakeModel()
+    embedder._encode_sem = asyncio.Semaphore(1)
+    embedder._cache_size = 0
+    embedder._encode_cache_lock = threading.Lock()
+    embedder._encode_cache = OrderedDict()
+    return embedder
+
+
+class TestEncodeBatch:
+    """encode_batch groups similar lengths per pass but keeps input order."""
+
+    def test_batches_are_length_sorted(self):
+        embedder = _embedder()
+        texts = ["aaaa", "a", "aaa", "aa", "aaaaa"]
+
+        embedder.encode_batch(texts, batch_size=2)
+
+        assert embedder._model.calls == [["a", "aa"], ["aaa", "aaaa"], ["aaaaa"]]
+
+    def test_results_in_input_order(self):
+        embedder = _embedder()
+        texts = ["aaaa", "a", "aaa"]
+
+        dense, sparse = embedder.encode_batch(texts, batch_size=2)
+
+        assert dense == [[4.0], [1.0], [3.0]]
+        assert sparse == [{"4": 1.0}, {"1": 1.0}, {"3": 1.0}]
+
+    def test_token_budget_closes_batch(self):
+        embedder = _embedder()
+        # Estimated tokens: 2, 2, 27, 27 -> the two long texts alone fill 54
+        texts = ["a", "b", "x" * 100, "y" * 100]
+
+        embedder.encode_batch(texts, batch_size=32, token_budget=30)
+
+        assert [len(c) for c in embedder._model.calls] == [2, 1, 1]
+
+    def test_oversized_text_gets_own_batch(self):
+        embedder = _embedder()
+
+        dense, _ = embedder.encode_batch(["z" * 400, "a"], token_budget=10)
+
+        assert embedder._model.calls == [["a"], ["z" * 400]]
+        assert dense == [[400.0], [1.0]]
+
+    def test_iter_yields_input_positions(self):
+        embedder = _embedder()
+        texts = ["aaa", "a", "aa"]
+
+        batches = list(embedder.iter_encode_batch(texts, batch_size=2))
+
+        assert [b[0] for b in batches] == [[1, 2], [0]]
+        assert batches[0][1] == [[1.0], [2.0]]
+
+    def test_aencode_batch_gathers_shards(self):
+        embedder = _embedder()
+
+        async def run():
+            return await asyncio.gather(
+                embedder.aencode_batch(["aa", "a"]),
+                embedder.aencode_batch(["aaa"]),
+            )
+
+        (dense_a, _), (dense_b, _) = asyncio.run(run())
+
+        assert dense_a == [[2.0], [1.0]]
+        assert dense_b == [[3.0]]
+
+    def test_duplicates_encoded_once(self):
+        embedder = _embedder()
+
+        dense, _ = embedder.encode_batch(["aa", "a", "aa"])
+
+        assert embedder._model.calls == [["a", "aa"]]
+        assert dense == [[2.0], [1.0], [2.0]]
+
+    def test_cached_texts_skip_forward_pass(self):
+        pytest.importorskip("numpy")
+        embedder = _embedder()
+        embedder._cache_size = 16
+        embedder.encode_batch(["aa", "a"])
+
+        dense, sparse = embedder.encode_batch(["aaa", "a"])
+
+        assert embedder._model.calls[1] == ["aaa"]
+        assert dense == [[3.0], [1.0]]
+        assert sparse == [{"3": 1.0}, {"1": 1.0}]
+
+    def test_cache_hit_returns_the_unrounded_vector(self):
+        pytest.importorskip("numpy")
+        embedder = _embedder()
+        embedder._cache_size = 16
+        model = embedder._model
+        # 1/3 and 0.1 are not exactly representable in float16 (or float32)
+        model.encode = lambda texts, **kw: {
+            "dense_vecs": _Vecs([len(t) / 3, 0.1] for t in texts),
+            "lexical_weights": [{} for _ in texts],
+        }
+
+        miss, _ = embedder.encode_batch(["aa"])
+        hit, _ = embedder.encode_batch(["aa"])
+
+        assert hit == miss == [[2 / 3, 0.1]]
+
+
+class TestLongTextWindows:
+    """Texts over max_length are encoded as windows and pooled."""
+
+    def test_short_text_not_split(self):
+        assert _split_long_text("a" * 40, 64) == ["a" * 40]
+
+    def test_windows_overlap_and_cover_text(self):
+        body = "".join(chr(65 + i % 26) for i in range(2000))
+
+        windows = _split_long_text(body, 256)
+
+        assert all(len(w) <= 1024 for w in windows)
+        assert windows[0] == body[:1024]
+        assert windows[1].startswith(body[512:520])
+        assert body.endswith(windows[-1])
+
+    def test_windows_keep_document_prefix(self):
+        windows = _split_long_text(DOCUMENT_PREFIX + "x" * 3000, 256)
+
+        assert len(windows) > 1
+        assert all(w.startswith(DOCUMENT_PREFIX) for w in windows)
+
+    def test_long_text_pooled(self):
+        pytest.importorskip("numpy")
+        embedder = _embedder()
+
+        dense, sparse = embedder.encode_batch(["a" * 3000, "b"], max_length=256)
+
+        # Four identical 1024-char windows plus a 952-char tail, encoded once each
+        assert embedder._model.calls == [["b", "a" * 952, "a" * 1024]]
+        assert dense == [[1.0], [1.0]]
+        assert sparse[0] == {"1024": 1.0, "952": 1.0}
+
+
+class TestSparseDictToQdrant:
+    """sparse_dict_to_qdrant sorts token IDs numerically."""
+
+    def test_string_keys_sorted_as_ints(self):
+        pytest.importorskip("numpy")
+
+        result = sparse_dict_to_qdrant({"10": 0.5, "9": 0.25, "100": 1.0})
+
+        assert result == {"indices": [9, 10, 100], "values": [0.25, 0.5, 1.0]}
+
+    def test_empty(self):
+        assert sparse_dict_to_qdrant({}) == {"indices": [], "values": []}
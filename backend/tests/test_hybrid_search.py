@@ -0,0 +1,180 @@
+"""Unit tests for HybridSearcher (backend/rag/hybrid_search.py).
+
+Qdrant and BGE-M3 are replaced by in-memory fakes, so these run without a
+Qdrant server or model weights (qdrant-client must still be installed for
+its model classes).
+
+Run from project root:
+    pytest backend/tests/test_hybrid_search.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+pytest.importorskip("numpy")
+
+from backend.rag import hybrid_search
+from backend.rag.hybrid_search import HybridSearcher, _apply_mmr_diversity, _apply_score_boost
+
+
+class _FakeEmbedder:
+    def __init__(self):
+        self.calls = 0
+
+    def encode_dense_sparse(self, texts):
+        self.calls += 1
+        return [[0.1, 0.2] for _ in texts], [{"7": 0.5} for _ in texts]
+
+
+_PAYLOADS = {
+    "p1": {"act_code": "BNS_2023", "section_number": "103", "text": "Murder"},
+    "p2": {"act_code": "BNS_2023", "section_number": "101", "text": "Culpable"},
+}
+
+
+class _FakeQdrant:
+    """Two statute hits per prefetch, honouring with_payload field lists."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def query_batch_points(self, collection_name, requests):
+        self.calls += 1
+        return [
+            SimpleNamespace(points=[
+                SimpleNamespace(
+                    id=pid, score=score,
+                    payload={k: v for k, v in _PAYLOADS[pid].items() if k in req.with_payload},
+                )
+                for pid, score in (("p1", 0.9), ("p2", 0.5))
+            ])
+            for req in requests
+        ]
+
+    def retrieve(self, collection_name, ids, with_payload, with_vectors):
+        self.calls += 1
+        return [SimpleNamespace(id=pid, payload=_PAYLOADS[pid]) for pid in ids]
+
+
+class _FakeAsyncQdrant(_FakeQdrant):
+    async def query_batch_points(self, collection_name, requests):
+        return super().query_batch_points(collection_name, requests)
+
+    async def retrieve(self, collection_name, ids, with_payload, with_vectors):
+        return super().retrieve(collection_name, ids, with_payload, with_vectors)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    hybrid_search.cache_clear()
+    yield
+    hybrid_search.cache_clear()
+
+
+def _searcher():
+    return HybridSearcher(qdrant_client=_FakeQdrant(), embedder=_FakeEmbedder())
+
+
+class TestQueryCaches:
+    def test_repeat_search_served_from_cache(self):
+        searcher = _searcher()
+
+        first = searcher.search("punishment for murder", top_k=2)
+        second = searcher.search("punishment for murder", top_k=2)
+
+        assert [r.point_id for r in first] == [r.point_id for r in second] == ["p1", "p2"]
+        assert searcher._embedder.calls == 1    # first call only
+        assert searcher._qdrant.calls == 3      # one prefetch, one retrieve per search
+
+    def test_new_filter_reuses_embedding(self):
+        searcher = _searcher()
+
+        searcher.search("punishment for murder", top_k=2)
+        searcher.search("punishment for murder", top_k=2, act_filter="BNS_2023")
+
+        assert searcher._embedder.calls == 1
+        assert searcher._qdrant.calls == 4
+
+
+class TestSearchAsync:
+    def test_full_payloads_fetched_for_survivors(self):
+        searcher = _searcher()
+        searcher._async_qdrant = _FakeAsyncQdrant()
+
+        results = asyncio.run(searcher.search_async("punishment for murder", top_k=2))
+
+        assert [r.point_id for r in results] == ["p1", "p2"]
+        assert [r.text for r in results] == ["Murder", "Culpable"]
+        assert searcher._async_qdrant.calls == 2
+
+    def test_search_many_embeds_once(self):
+        searcher = _searcher()
+        searcher._async_qdrant = _FakeAsyncQdrant()
+
+        results = asyncio.run(searcher.search_many(
+            ["punishment for murder", "culpable homicide", "punishment for murder"], top_k=2,
+        ))
+
+        assert len(results) == 3
+        assert [r.point_id for r in results[0]] == ["p1", "p2"]
+        assert searcher._embedder.calls == 1
+
+
+class TestMMRDiversity:
+    @staticmethod
+    def _cand(point_id, score, act_code):
+        return {"point_id": point_id, "boosted_score": score, "payload": {"act_code": act_code}}
+
+    def test_other_act_promoted_over_same_act(self):
+        candidates = [
+            self._cand("a1", 1.0, "BNS_2023"),
+            self._cand("a2", 0.9, "BNS_2023"),
+            self._cand("b1", 0.5, "BNSS_2023"),
+        ]
+
+        selected = _apply_mmr_diversity(candidates, mmr_diversity=0.5, top_k=3)
+
+        assert [c["point_id"] for c in selected] == ["a1", "b1", "a2"]
+
+    def test_missing_act_code_never_similar(self):
+        candidates = [
+            {"point_id": "x", "boosted_score": 1.0, "payload": {}},
+            {"point_id": "y", "boosted_score": 0.9, "payload": {}},
+            self._cand("b1", 0.95, "BNS_2023"),
+        ]
+
+        selected = _apply_mmr_diversity(candidates, mmr_diversity=0.5, top_k=2)
+
+        assert [c["point_id"] for c in selected] == ["x", "b1"]
+
+    def test_single_act_keeps_relevance_order(self):
+        candidates = [
+            self._cand("a1", 1.0, "BNS_2023"),
+            self._cand("a2", 0.9, "BNS_2023"),
+            self._cand("a3", 0.5, "BNS_2023"),
+        ]
+
+        selected = _apply_mmr_diversity(candidates, mmr_diversity=0.5, top_k=2)
+
+        assert [c["point_id"] for c in selected] == ["a1", "a2"]
+
+
+class TestScoreBoost:
+    def test_boosts_applied_in_order_and_resorted(self):
+        fused = [
+            {"rrf_score": 1.0, "payload": {"era": "colonial_codes", "extraction_confidence": 1.0}},
+            {"rrf_score": 1.0, "payload": {"era": "naveen_sanhitas", "extraction_confidence": 0.5,
+                                           "is_offence": True}},
+        ]
+
+        boosted = _apply_score_boost(fused, "naveen_sanhitas", "criminal_offence")
+
+        # Era boost is added before the confidence factor: (1.0 + 0.15) * 0.85 + 0.10
+        assert boosted[0]["boosted_score"] == pytest.approx(1.0775)
+        assert boosted[0]["payload"]["era"] == "naveen_sanhitas"
+        assert boosted[1]["boosted_score"] == pytest.approx(1.0)
@@ -32,7 +32,10 @@ from backend.preprocessing.parsers.act_parser import (
     arabic_to_roman,
     parse_act,
 )
-from backend.preprocessing.validators.extraction_validator import validate_section
+from backend.preprocessing.validators.extraction_validator import (
+    SUBSECTION_COUNT_MISMATCH,
+    validate_section,
+)
 
 # ---------------------------------------------------------------------------
 # Path configuration
@@ -301,6 +304,28 @@ class TestExtractionValidator:
         assert report.extraction_confidence < 1.0
         assert any("bracket" in f.lower() for f in report.check_failures)
 
+    def test_commentary_residue_detected_case_insensitively(self):
+        """Commentary trigger phrases are caught regardless of case."""
+        text = "Whoever commits theft shall be punished.\nComparison with IPC: unchanged."
+        report = validate_section(section_number="303", legal_text=text)
+        assert any("commentary" in f.lower() for f in report.check_failures)
+
+    def test_failure_codes_format_to_messages(self):
+        """Failures are recorded as codes and formatted with their arguments."""
+        report = validate_section(
+            section_number="64",
+            legal_text="(1) Whoever commits rape.\n(2) Whoever, being a police officer.",
+            has_subsections=True,
+            sub_section_count=5,
+        )
+        assert report.failure_codes == [
+            (SUBSECTION_COUNT_MISMATCH, (2, 5, 1.5)),
+        ]
+        assert report.check_failures == [
+            "[64] Check 6 WARN: Sub-section count discrepancy "
+            "(expected ~2, extracted 5, discrepancy=150%)."
+        ]
+
     def test_empty_legal_text_routed_to_review(self):
         """Sections with empty legal_text must require human review."""
         report = validate_section(section_number="240", legal_text="")
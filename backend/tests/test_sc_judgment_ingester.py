@@ -0,0 +1,393 @@
+"""Unit tests for the SC judgment ingestion pipeline helpers.
+
+These tests cover the pure-Python stages of sc_judgment_ingester.py that do
+not need BGE-M3, Qdrant, or Supabase:
+- decision date parsing (Phase B)
+- tar streaming (Phase C input)
+- bounded prefetch of Phase C + D work
+- judgment text cleaning (Phase C output)
+- domain inference from the opening text
+- cross-judgment embedding batches (Phase E), with a fake embedder
+- concurrent async upserts (Phase E), with a mocked AsyncQdrantClient
+- PDF hashing (Phase F change detection)
+
+Run from project root:
+    pytest backend/tests/test_sc_judgment_ingester.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import queue
+import tarfile
+import uuid
+import zlib
+from datetime import date
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.preprocessing.sc_judgment_ingester import (
+    DOMAIN_SIGNAL_CHARS,
+    _chunk_point_ids,
+    _compute_pdf_hash,
+    _infer_domain_from_text,
+    _parse_decision_date,
+    _partition_of,
+    _pdf_writer_worker,
+    _prefetch_prepared,
+    assign_section_types,
+    clean_judgment_text,
+    embed_and_upsert_judgments,
+    iter_tar_pdfs,
+    upsert_points_async,
+)
+
+
+def _make_tar(tar_path: Path, members: dict[str, bytes]) -> None:
+    with tarfile.open(tar_path, "w") as tf:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+class TestParseDecisionDate:
+    """_parse_decision_date handles every format regardless of try order."""
+
+    def test_formats_interleaved(self):
+        assert _parse_decision_date("2024-03-15", 2024) == date(2024, 3, 15)
+        assert _parse_decision_date("15-03-2024", 2024) == date(2024, 3, 15)
+        assert _parse_decision_date("15/03/2024", 2024) == date(2024, 3, 15)
+        assert _parse_decision_date("2024/03/15", 2024) == date(2024, 3, 15)
+        assert _parse_decision_date("2024-03-16", 2024) == date(2024, 3, 16)
+
+    def test_century_bug_fixed(self):
+        assert _parse_decision_date("17-02-1902", 2002) == date(2002, 2, 17)
+
+    def test_unparseable(self):
+        assert _parse_decision_date("", 2024) is None
+        assert _parse_decision_date("not a date", 2024) is None
+
+
+class TestTarStreaming:
+    """iter_tar_pdfs yields PDF members in archive order without extracting."""
+
+    def test_yields_basenames_and_bytes(self, tmp_path):
+        tar_path = tmp_path / "english.tar"
+        _make_tar(tar_path, {
+            "english/2024/a_EN.pdf": b"%PDF-a",
+            "english/2024/nested/b_EN.pdf": b"%PDF-b",
+        })
+        assert list(iter_tar_pdfs(tar_path)) == [
+            ("a_EN.pdf", b"%PDF-a"),
+            ("b_EN.pdf", b"%PDF-b"),
+        ]
+
+    def test_skips_non_pdf_members(self, tmp_path):
+        tar_path = tmp_path / "english.tar"
+        _make_tar(tar_path, {"README.txt": b"x", "c.pdf": b"%PDF-c"})
+        assert [name for name, _ in iter_tar_pdfs(tar_path)] == ["c.pdf"]
+
+    def test_unwanted_members_skipped(self, tmp_path):
+        tar_path = tmp_path / "english.tar"
+        _make_tar(tar_path, {"a.pdf": b"%PDF-a", "b.pdf": b"%PDF-b", "c.pdf": b"%PDF-c"})
+        wanted = {"a.pdf", "c.pdf"}
+        assert [name for name, _ in iter_tar_pdfs(tar_path, wanted=wanted)] == ["a.pdf", "c.pdf"]
+
+    def test_nothing_written_to_disk(self, tmp_path):
+        tar_path = tmp_path / "english.tar"
+        _make_tar(tar_path, {"d.pdf": b"%PDF-d"})
+        list(iter_tar_pdfs(tar_path))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["english.tar"]
+
+
+class TestPrefetchPrepared:
+    """_prefetch_prepared keeps a bounded window of submitted judgments."""
+
+    def test_order_and_window(self):
+        executor = MagicMock()
+        members = (({"diary_no": str(i)}, f"{i}.pdf", b"") for i in range(5))
+
+        stream = _prefetch_prepared(members, executor, depth=2)
+        record, _ = next(stream)
+        assert record["diary_no"] == "0"
+        assert executor.submit.call_count == 2
+
+        rest = [r["diary_no"] for r, _ in stream]
+        assert rest == ["1", "2", "3", "4"]
+        assert executor.submit.call_count == 5
+
+
+class TestPdfWriterWorker:
+    """_pdf_writer_worker drains the --keep-pdfs queue until the sentinel."""
+
+    def test_writes_until_sentinel(self, tmp_path):
+        q: queue.Queue = queue.Queue()
+        q.put((tmp_path / "a.pdf", b"%PDF-a"))
+        q.put((tmp_path / "missing" / "b.pdf", b"%PDF-b"))  # write fails, logged
+        q.put((tmp_path / "c.pdf", b"%PDF-c"))
+        q.put(None)
+
+        _pdf_writer_worker(q)
+
+        assert (tmp_path / "a.pdf").read_bytes() == b"%PDF-a"
+        assert (tmp_path / "c.pdf").read_bytes() == b"%PDF-c"
+        assert q.empty()
+
+
+class TestCleanJudgmentText:
+    """clean_judgment_text drops noise lines in one regex pass."""
+
+    def test_drops_headers_and_page_numbers(self):
+        raw = "IN THE SUPREME COURT OF INDIA\nReportable\nThe appellant filed\n  12  \nan appeal."
+        assert clean_judgment_text(raw) == "The appellant filed\nan appeal."
+
+    def test_noise_line_does_not_split_paragraph(self):
+        raw = "first line\n-----\nsecond line"
+        assert clean_judgment_text(raw) == "first line\nsecond line"
+
+    def test_collapses_blank_runs(self):
+        assert clean_judgment_text("a\n\n\n\n\nb") == "a\n\nb"
+
+    def test_keeps_numbers_inside_text(self):
+        assert clean_judgment_text("Section 302\n12345") == "Section 302\n12345"
+
+
+class TestInferDomainFromText:
+    """_infer_domain_from_text matches signals case-insensitively in the opening."""
+
+    def test_criminal_header(self):
+        assert _infer_domain_from_text("Criminal Appellate Jurisdiction") == "criminal"
+
+    def test_criminal_beats_constitutional(self):
+        text = "WRIT PETITION ... this criminal appeal arises"
+        assert _infer_domain_from_text(text) == "criminal"
+
+    def test_constitutional(self):
+        assert _infer_domain_from_text("under Article 32 of the Constitution") == "constitutional"
+
+    def test_default_civil(self):
+        assert _infer_domain_from_text("civil appeal against decree") == "civil"
+
+    def test_signal_beyond_opening_ignored(self):
+        text = "x" * DOMAIN_SIGNAL_CHARS + " SESSIONS JUDGE"
+        assert _infer_domain_from_text(text) == "civil"
+
+    def test_aho_corasick_priority(self):
+        pytest.importorskip("ahocorasick")
+        from backend.preprocessing.sc_judgment_ingester import (
+            _domain_signal_automaton,
+            _infer_domain_aho_corasick,
+        )
+        automaton = _domain_signal_automaton()
+        for text, expected in (
+            ("Writ Petition (Civil) ... Sessions Judge convicted", "criminal"),
+            ("ORIGINAL JURISDICTION writ petition under Art. 32", "constitutional"),
+            ("Civil Appeal No. 12 of 2020", "civil"),
+        ):
+            assert _infer_domain_aho_corasick(automaton, text) == expected
+
+
+class TestSectionTypes:
+    """Positional section_type labels for judgment chunks."""
+
+    def test_small_judgments(self):
+        assert assign_section_types([]) == []
+        assert assign_section_types(["a"]) == ["conclusion"]
+        assert assign_section_types(["a"] * 2) == ["background", "conclusion"]
+        assert assign_section_types(["a"] * 3) == ["background", "analysis", "conclusion"]
+
+    def test_long_judgment(self):
+        assert assign_section_types(["a"] * 6) == [
+            "background", "background", "analysis", "analysis", "conclusion", "conclusion",
+        ]
+
+
+class TestPartitionOf:
+    """Worker partitions are stable across processes and cover every record."""
+
+    def test_stable_and_in_range(self):
+        diary_nos = [f"{n}-2024" for n in range(200)]
+        parts = [_partition_of(d, 4) for d in diary_nos]
+        assert parts == [_partition_of(d, 4) for d in diary_nos]
+        assert set(parts) == {0, 1, 2, 3}
+        assert _partition_of("10169-2001", 4) == zlib.crc32(b"10169-2001") % 4
+
+
+class TestPdfHash:
+    """_compute_pdf_hash gives the same digest for bytes and files."""
+
+    def test_bytes_and_path_agree(self, tmp_path):
+        data = b"%PDF-1.7 judgment" * 1000
+        pdf = tmp_path / "x.pdf"
+        pdf.write_bytes(data)
+        expected = hashlib.sha256(data).hexdigest()
+        assert _compute_pdf_hash(data) == expected
+        assert _compute_pdf_hash(pdf) == expected
+
+
+class TestChunkPointIds:
+    """_chunk_point_ids must stay identical to the documented uuid5 scheme."""
+
+    def test_matches_uuid5(self):
+        for diary_no in ("10169-2001", "SCIN010012342024", "ज्ञ-1"):
+            assert _chunk_point_ids(diary_no, 12) == [
+                str(uuid.uuid5(uuid.NAMESPACE_URL, f"{diary_no}__chunk{idx}"))
+                for idx in range(12)
+            ]
+
+    def test_empty(self):
+        assert _chunk_point_ids("x", 0) == []
+
+
+class _FakeEmbedder:
+    """Stands in for BGEM3Embedder: one encode_batch call per invocation."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode_batch(self, texts, batch_size=32, sparse_csr=False):
+        from backend.rag.embeddings import sparse_weights_to_csr
+
+        self.calls.append(list(texts))
+        dense = [[float(len(t))] for t in texts]
+        sparse = [{str(i): 1.0} for i in range(len(texts))]
+        return dense, sparse_weights_to_csr(sparse) if sparse_csr else sparse
+
+
+def _judgment(diary_no: str, n_chunks: int) -> dict:
+    return {
+        "diary_no": diary_no,
+        "case_name": f"{diary_no} v. State",
+        "case_no": "",
+        "year": 2024,
+        "decision_date": None,
+        "disposal_nature": None,
+        "legal_domain": "civil",
+        "chunks": [f"{diary_no} chunk {i}" for i in range(n_chunks)],
+    }
+
+
+def _upserted(client) -> tuple[list, list, list]:
+    """Concatenate the ids / dense vectors / payloads of all wait=False upserts."""
+    ids, dense, payloads = [], [], []
+    for call in client.upsert.call_args_list:
+        if call.kwargs["wait"]:
+            continue
+        batch = call.kwargs["points"]
+        ids += batch.ids
+        dense += batch.vectors["dense"]
+        payloads += batch.payloads
+    return ids, dense, payloads
+
+
+def _batch(n: int):
+    from qdrant_client.models import Batch
+    return Batch(
+        ids=[str(uuid.UUID(int=i)) for i in range(n)],
+        vectors={"dense": [[float(i)] for i in range(n)]},
+        payloads=[{"i": i} for i in range(n)],
+    )
+
+
+class TestCrossJudgmentEmbedding:
+    """embed_and_upsert_judgments embeds several judgments in one call."""
+
+    @pytest.fixture(autouse=True)
+    def _require_qdrant_models(self):
+        pytest.importorskip("qdrant_client")
+        pytest.importorskip("numpy")
+
+    def test_single_encode_call_and_demux(self):
+        embedder = _FakeEmbedder()
+        client = MagicMock()
+        judgments = [_judgment("A", 3), _judgment("B", 2)]
+
+        ids = embed_and_upsert_judgments(judgments, client, embedder, batch_size=128)
+
+        assert len(embedder.calls) == 1
+        assert len(embedder.calls[0]) == 5
+        assert ids[0] == [
+            str(uuid.uuid5(uuid.NAMESPACE_URL, f"A__chunk{i}")) for i in range(3)
+        ]
+        point_ids, _, payloads = _upserted(client)
+        assert point_ids == ids[0] + ids[1]
+        assert [p["diary_no"] for p in payloads] == ["A", "A", "A", "B", "B"]
+        assert payloads[3]["chunk_index"] == 0
+        assert payloads[4]["total_chunks"] == 2
+
+    def test_vectors_follow_chunk_order(self):
+        embedder = _FakeEmbedder()
+        client = MagicMock()
+        judgment = _judgment("A", 3)
+        judgment["chunks"] = ["long chunk text", "mid chunk", "short"]
+
+        embed_and_upsert_judgments([judgment], client, embedder)
+
+        assert embedder.calls[0] == judgment["chunks"]
+        _, dense, payloads = _upserted(client)
+        assert [p["text"] for p in payloads] == judgment["chunks"]
+        # _FakeEmbedder encodes each text as [len(text)]
+        assert dense == [[15.0], [9.0], [5.0]]
+
+        sparse = [
+            v for c in client.upsert.call_args_list if not c.kwargs["wait"]
+            for v in c.kwargs["points"].vectors["sparse"]
+        ]
+        # _FakeEmbedder gives the text at position p the token {p: 1.0}
+        assert [v.indices for v in sparse] == [[0], [1], [2]]
+        assert [v.values for v in sparse] == [[1.0], [1.0], [1.0]]
+
+    def test_checkpoint_upsert_waits(self):
+        client = MagicMock()
+        ids = embed_and_upsert_judgments([_judgment("A", 2)], client, _FakeEmbedder())
+        last = client.upsert.call_args_list[-1]
+        assert last.kwargs["wait"] is True
+        assert last.kwargs["points"].ids == ids[0][-1:]
+        assert all(c.kwargs["wait"] is False for c in client.upsert.call_args_list[:-1])
+
+
+class TestAsyncUpsert:
+    """upsert_points_async fans batches out concurrently, then checkpoints."""
+
+    @pytest.fixture(autouse=True)
+    def _require_qdrant_setup(self):
+        pytest.importorskip("qdrant_client")
+
+    def test_batches_then_waiting_checkpoint(self):
+        client = MagicMock()
+        client.upsert = AsyncMock()
+        batch = _batch(10)
+
+        asyncio.run(upsert_points_async(client, batch, batch_size=4, concurrency=2))
+
+        calls = client.upsert.call_args_list
+        assert [c.kwargs["points"].payloads for c in calls[:-1]] == [
+            [{"i": 0}, {"i": 1}, {"i": 2}, {"i": 3}],
+            [{"i": 4}, {"i": 5}, {"i": 6}, {"i": 7}],
+            [{"i": 8}, {"i": 9}],
+        ]
+        assert calls[1].kwargs["points"].vectors["dense"] == [[4.0], [5.0], [6.0], [7.0]]
+        assert all(c.kwargs["wait"] is False for c in calls[:-1])
+        assert calls[-1].kwargs["points"].ids == batch.ids[-1:]
+        assert calls[-1].kwargs["wait"] is True
+
+    def test_concurrency_bound(self):
+        in_flight = 0
+        peak = 0
+
+        async def _upsert(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        client = MagicMock()
+        client.upsert = _upsert
+        asyncio.run(upsert_points_async(client, _batch(20), batch_size=1, concurrency=3))
+        assert peak == 3
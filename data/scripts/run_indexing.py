@@ -27,6 +27,7 @@ import argparse
 import asyncio
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -77,6 +78,9 @@ ALL_ACTS = [
     "ACA_1996", "CPA_2019", "HMA_1955", "HSA_1956", "CPC_1908",
 ]
 _AUDIT_DIR = _PROJECT_ROOT / "data" / "audit"
+# Statute texts repeat provisos and headers, so indexing keeps an encode
+# cache (~2KB per entry) unless BGE_M3_CACHE_SIZE says otherwise
+_ENCODE_CACHE_SIZE = int(os.getenv("BGE_M3_CACHE_SIZE", "10000"))
 
 
 # ---------------------------------------------------------------------------
@@ -243,7 +247,7 @@ def main() -> None:
     needs_embedding = args.act or args.mode in ("transition", "all")
     if needs_embedding:
         logger.info("Loading BGE-M3 embedder (this may take 30-60s on T4)...")
-        embedder = BGEM3Embedder()
+        embedder = BGEM3Embedder(warmup=True, cache_size=_ENCODE_CACHE_SIZE)
         batch_size = args.batch_size
         logger.info("Using batch_size=%d (reduce to 16 if CUDA OOM occurs)", batch_size)
 
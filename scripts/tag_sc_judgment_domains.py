@@ -129,7 +129,7 @@ def main(retag: bool = False) -> None:
                     diary_no = payload.get("diary_no")
                     chunk_text = payload.get("text", "")
                     if diary_no and chunk_text:
-                        domain = _infer_domain_from_text(chunk_text[:3000])
+                        domain = _infer_domain_from_text(chunk_text)
                         domain_lookup[diary_no] = domain
                         domain_counts[domain] += 1
 